@@ -0,0 +1,88 @@
+"""안무 컴파일 시간과 실행 중 단계별 전송 지연을 측정합니다.
+Measures how long validating and compiling a choreography takes offline, and
+how late each step is sent when the compiled show runs against simulators.
+
+    python -m benchmarks.choreography
+"""
+
+import ipaddress
+import json
+import logging
+import time
+
+from djitellopy.choreography import Choreography
+from djitellopy.swarm import TelloSwarm
+from djitellopy.swarm_transport import SwarmTransport
+from djitellopy.tello import Tello, TelloTransport
+
+from .common import percentiles, simulator_process, wait_for_simulator
+
+FIRST_HOST = '127.0.0.2'
+
+
+def hosts(count):
+    first = ipaddress.ip_address(FIRST_HOST)
+    return [str(first + i) for i in range(count)]
+
+
+def show(count, loops=1):
+    """이륙 → (기동, rc 전진, rc 정지, 회전) × loops → 착륙. 드론마다 기동이 다릅니다"""
+    choreography = Choreography(count)
+    choreography.add_all(0, 'takeoff')
+    t = 3.0
+    for _ in range(loops):
+        for drone in range(count):
+            choreography.add(drone, t, ('up 30', 'flip b', 'down 20')[drone % 3])
+        choreography.add_all(t + 2.5, 'rc 0 30 0 0')
+        choreography.add_all(t + 4.0, 'rc 0 0 0 0')
+        choreography.add_all(t + 4.5, 'cw 45')
+        t += 6.0
+    choreography.add_all(t, 'land')
+    return choreography
+
+
+def measure_compile(count, loops, repeat=5):
+    choreography = show(count, loops)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compiled = choreography.compile()
+        samples.append(time.perf_counter() - started)
+    result = percentiles(samples, points=(50,))
+    result['duration_s'] = compiled.duration
+    result['steps'] = sum(len(track) for track in compiled.tracks)
+    return result
+
+
+def measure_perform(transport_class, count):
+    transport = transport_class()
+    swarm = TelloSwarm.fromIps(hosts(count), transport=transport)
+    try:
+        swarm.send_all('command')
+        # 시뮬레이터의 상태 패킷은 1Hz라 아직 배터리 값이 없을 수 있습니다
+        result = swarm.perform(show(count), check_battery=False)
+    finally:
+        swarm.end()
+        transport.close()
+
+    lateness = percentiles(result.lateness)
+    lateness['steps'] = len(result.sends)
+    lateness['failures'] = len(result.failures)
+    return lateness
+
+
+def run(compile_counts=(10, 50), perform_counts=(5, 20)):
+    Tello.LOGGER.setLevel(logging.ERROR)
+    result = {'compile': {'drones_{}'.format(count): measure_compile(count, loops=10) for count in compile_counts}}
+    for count in perform_counts:
+        with simulator_process(FIRST_HOST, '--count', str(count), '--latency', '0.01', '--state-rate', '1'):
+            wait_for_simulator(hosts(count)[-1])
+            result['drones_{}'.format(count)] = {
+                'threaded': measure_perform(TelloTransport, count),
+                'multiplexed': measure_perform(SwarmTransport, count),
+            }
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
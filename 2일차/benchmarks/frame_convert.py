@@ -0,0 +1,45 @@
+"""디코딩된 720p 프레임을 ndarray로 변환하는 비용을 측정합니다.
+Measures the cost of turning a decoded 720p frame into an ndarray.
+
+    python -m benchmarks.frame_convert
+"""
+
+import json
+import timeit
+
+import av
+import numpy as np
+
+from djitellopy.tello import Tello, BackgroundFrameRead
+
+
+def make_reader(pixel_format):
+    """컨테이너를 열지 않고 변환 메서드만 사용하는 BackgroundFrameRead"""
+    reader = BackgroundFrameRead.__new__(BackgroundFrameRead)
+    reader.pixel_format = pixel_format
+    return reader
+
+
+def run(number=200, width=1280, height=720):
+    # 디코더 출력과 같은 yuv420p 프레임
+    rgb = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+    frame = av.VideoFrame.from_ndarray(rgb, format='rgb24').reformat(format='yuv420p')
+
+    variants = {
+        'pil_round_trip': lambda f: np.array(f.to_image()),
+        'to_ndarray_rgb24': make_reader(Tello.PIXEL_FORMAT_RGB).convert_frame,
+        'to_ndarray_bgr24': make_reader(Tello.PIXEL_FORMAT_BGR).convert_frame,
+        'to_ndarray_yuv420p': make_reader(Tello.PIXEL_FORMAT_YUV420P).convert_frame,
+    }
+
+    result = {}
+    for name, convert in variants.items():
+        stmt = lambda convert=convert: convert(frame)
+        seconds = min(timeit.repeat(stmt, number=number, repeat=3))
+        result[name] = {'ms_per_frame': round(seconds / number * 1e3, 3)}
+
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,126 @@
+"""스웜 명령이 드론들에 도착하는 시각의 차이(skew)를 비교합니다.
+Compares how far apart a swarm command arrives at the drones: parallel()
+(one thread per drone) versus broadcast() (pre-encoded, back-to-back sends).
+
+가짜 드론은 커널 수신 시각(SO_TIMESTAMPNS)을 기록하므로 측정 스레드의 스케줄링이
+결과에 섞이지 않습니다.
+The fake drones record kernel receive timestamps (SO_TIMESTAMPNS), so the
+measurement itself is not skewed by thread scheduling.
+
+    python -m benchmarks.swarm_broadcast
+"""
+
+import ipaddress
+import json
+import logging
+import selectors
+import socket
+import struct
+import time
+from threading import Thread, Event
+
+from djitellopy.swarm import TelloSwarm
+from djitellopy.swarm_transport import SwarmTransport
+from djitellopy.tello import Tello, TelloTransport
+
+from .common import percentiles
+
+FIRST_HOST = '127.0.0.2'
+SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+TIMESPEC = struct.Struct('@ll')
+
+
+class FakeDrones:
+    """명령을 받으면 수신 시각을 기록하고 'ok'로 응답하는 드론들 (스레드 하나)"""
+
+    def __init__(self, count):
+        first = ipaddress.ip_address(FIRST_HOST)
+        self.hosts = [str(first + i) for i in range(count)]
+        self.selector = selectors.DefaultSelector()
+        self.sockets = []
+        self.kernel_timestamps = True
+        for host in self.hosts:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            except OSError:
+                self.kernel_timestamps = False
+            sock.bind((host, Tello.CONTROL_UDP_PORT))
+            self.selector.register(sock, selectors.EVENT_READ)
+            self.sockets.append(sock)
+        self.arrivals = []  # 받은 순서대로 (시각, 명령)
+        self.stopped = Event()
+        self.worker = Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def run(self):
+        while not self.stopped.is_set():
+            for key, _ in self.selector.select(0.1):
+                sock = key.fileobj
+                data, ancillary, _, address = sock.recvmsg(1024, 64)
+                received_at = time.time()
+                for level, kind, value in ancillary:
+                    if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS:
+                        seconds, nanoseconds = TIMESPEC.unpack(value[:TIMESPEC.size])
+                        received_at = seconds + nanoseconds * 1e-9
+                self.arrivals.append(received_at)
+                sock.sendto(b'ok', address)
+
+    def spread(self):
+        """지난 라운드에 모든 드론이 명령을 받은 시각의 차이 (초)"""
+        arrivals = self.arrivals
+        self.arrivals = []
+        return max(arrivals) - min(arrivals)
+
+    def close(self):
+        self.stopped.set()
+        self.worker.join()
+        for sock in self.sockets:
+            sock.close()
+
+
+def measure(drones, transport_class, run_round, rounds):
+    transport = transport_class()
+    swarm = TelloSwarm.fromIps(drones.hosts, transport=transport)
+    try:
+        swarm.send_all('command')
+        drones.spread()
+
+        spreads = []
+        for _ in range(rounds):
+            time.sleep(Tello.TIME_BTW_COMMANDS)
+            run_round(swarm)
+            spreads.append(drones.spread())
+    finally:
+        swarm.end()
+        transport.close()
+    return percentiles(spreads)
+
+
+def parallel_round(swarm):
+    swarm.parallel(lambda i, tello: tello.send_control_command('command'))
+
+
+def broadcast_round(swarm):
+    swarm.broadcast('command').results()
+
+
+def run(counts=(5, 20, 50), rounds=30):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    result = {}
+    for count in counts:
+        drones = FakeDrones(count)
+        try:
+            result['drones_{}'.format(count)] = {
+                'parallel': measure(drones, TelloTransport, parallel_round, rounds),
+                'broadcast': measure(drones, TelloTransport, broadcast_round, rounds),
+                'broadcast_multiplexed': measure(drones, SwarmTransport, broadcast_round, rounds),
+            }
+        finally:
+            drones.close()
+        result['kernel_timestamps'] = drones.kernel_timestamps
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,50 @@
+"""드론 수에 따른 TelloSwarm.parallel의 디스패치 오버헤드를 측정합니다.
+Measures TelloSwarm.parallel dispatch overhead as the number of drones grows.
+
+    python -m benchmarks.swarm_parallel
+"""
+
+import json
+import logging
+import time
+
+from djitellopy.swarm import TelloSwarm
+from djitellopy.tello import Tello, TelloTransport
+
+from .common import percentiles
+
+
+def make_swarm(count):
+    """패킷을 보내지 않으므로 드론이 없어도 되는 스웜"""
+    tellos = [Tello('127.0.0.{}'.format(i + 2), transport=TelloTransport()) for i in range(count)]
+    return TelloSwarm(tellos)
+
+
+def close_swarm(swarm):
+    for tello in swarm:
+        tello.end()
+        tello.transport.close()
+
+
+def run(counts=(1, 2, 4, 8, 16, 32), calls=200):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    result = {}
+    for count in counts:
+        swarm = make_swarm(count)
+        try:
+            swarm.parallel(lambda i, tello: None)  # 워커 스레드 준비
+
+            samples = []
+            for _ in range(calls):
+                started = time.perf_counter()
+                swarm.parallel(lambda i, tello: None)
+                samples.append(time.perf_counter() - started)
+        finally:
+            close_swarm(swarm)
+
+        result['drones_{}'.format(count)] = percentiles(samples)
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,58 @@
+"""스웜 상태 질의 비용을 드론별 getter 순회와 상태 행렬로 비교합니다.
+Compares the cost of swarm-wide state queries: a getter per drone versus the
+incrementally maintained state matrix, plus the per-packet update cost.
+
+    python -m benchmarks.swarm_state
+"""
+
+import json
+import logging
+import timeit
+
+from djitellopy.swarm import TelloSwarm
+from djitellopy.tello import Tello, TelloTransport
+
+STATE = (b'mid:1;x:10;y:-20;z:80;mpry:0,0,0;pitch:0;roll:0;yaw:45;vgx:0;vgy:0;vgz:0;templ:60;temph:62;'
+         b'tof:90;h:80;bat:87;baro:12.34;time:12;agx:0.00;agy:0.00;agz:-1000.00;\r\n')
+
+
+def make_swarm(count):
+    """상태 패킷을 직접 넣으므로 드론이 없어도 되는 스웜"""
+    transport = TelloTransport()
+    swarm = TelloSwarm([Tello('127.0.0.{}'.format(i + 2), transport=transport) for i in range(count)])
+    for tello in swarm:
+        Tello.handle_state_packet(tello.get_own_udp_object(), STATE)
+    return swarm, transport
+
+
+def per_call_us(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def run(counts=(10, 50, 100), number=2000):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    result = {}
+    for count in counts:
+        swarm, transport = make_swarm(count)
+        try:
+            swarm.get_state_matrix()
+            drone = swarm.tellos[0].get_own_udp_object()
+            result['drones_{}'.format(count)] = {
+                'getter_min_battery_us': round(per_call_us(lambda: min(tello.get_battery() for tello in swarm),
+                                                           number), 2),
+                'matrix_min_battery_us': round(per_call_us(swarm.min_battery, number), 2),
+                'getter_fleet_check_us': round(per_call_us(
+                    lambda: [(tello.get_battery(), tello.get_height(), tello.get_temperature()) for tello in swarm],
+                    number), 2),
+                'matrix_fleet_check_us': round(per_call_us(
+                    lambda: (swarm.state_matrix(('bat', 'h', 'templ', 'temph')), swarm.any_stale(0.5)), number), 2),
+                'state_packet_us': round(per_call_us(lambda: Tello.handle_state_packet(drone, STATE), number), 2),
+            }
+        finally:
+            swarm.end()
+            transport.close()
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
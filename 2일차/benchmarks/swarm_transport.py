@@ -0,0 +1,82 @@
+"""드론 수에 따른 스웜 전송 계층의 스레드 수, CPU 사용량, 명령 왕복 시간을 비교합니다.
+Compares thread count, CPU time and command round time of the threaded swarm
+(TelloTransport + TelloSwarm.parallel) with the single-threaded SwarmTransport
+(TelloSwarm.send_all) as the swarm grows.
+
+    python -m benchmarks.swarm_transport
+"""
+
+import ipaddress
+import json
+import logging
+import threading
+import time
+
+from djitellopy.swarm import TelloSwarm
+from djitellopy.swarm_transport import SwarmTransport
+from djitellopy.tello import Tello, TelloTransport
+
+from .common import percentiles, simulator_process, wait_for_simulator
+
+FIRST_HOST = '127.0.0.2'
+
+
+def hosts(count):
+    first = ipaddress.ip_address(FIRST_HOST)
+    return [str(first + i) for i in range(count)]
+
+
+def threaded_round(swarm):
+    return swarm.parallel(lambda i, tello: tello.send_control_command('command'))
+
+
+def multiplexed_round(swarm):
+    return swarm.send_all('command')
+
+
+def measure(transport_class, run_round, count, rounds):
+    baseline_threads = set(threading.enumerate())
+    transport = transport_class()
+    swarm = TelloSwarm.fromIps(hosts(count), transport=transport)
+    try:
+        run_round(swarm)  # 스케줄러와 스레드 준비
+
+        samples = []
+        peak_threads = 0
+        cpu_started = time.process_time()
+        for _ in range(rounds):
+            # 드론은 명령 사이에 TIME_BTW_COMMANDS 간격이 필요하므로 라운드 사이에 기다립니다
+            time.sleep(Tello.TIME_BTW_COMMANDS)
+            started = time.perf_counter()
+            results = run_round(swarm)
+            samples.append(time.perf_counter() - started)
+            peak_threads = max(peak_threads, len(set(threading.enumerate()) - baseline_threads))
+            failed = [result for result in results if result is not True]
+            if failed:
+                raise RuntimeError('round failed: {}'.format(failed[0]))
+        cpu = time.process_time() - cpu_started
+    finally:
+        swarm.end()
+        transport.close()
+
+    result = percentiles(samples)
+    result['threads'] = peak_threads
+    result['cpu_ms_per_round'] = round(cpu / rounds * 1e3, 3)
+    return result
+
+
+def run(counts=(10, 50, 100), rounds=20):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    result = {}
+    for count in counts:
+        with simulator_process(FIRST_HOST, '--count', str(count), '--latency', '0.01', '--state-rate', '1'):
+            wait_for_simulator(hosts(count)[-1])
+            result['drones_{}'.format(count)] = {
+                'threaded': measure(TelloTransport, threaded_round, count, rounds),
+                'multiplexed': measure(SwarmTransport, multiplexed_round, count, rounds),
+            }
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
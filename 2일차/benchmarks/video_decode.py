@@ -0,0 +1,92 @@
+"""BackgroundFrameRead의 초당 프레임 수와 프레임당 CPU 시간을 측정합니다.
+Measures BackgroundFrameRead frames/sec and CPU time per frame.
+
+    python -m benchmarks.video_decode
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+from djitellopy.sim import generate_test_video
+from djitellopy.tello import Tello, TelloTransport, BackgroundFrameRead
+
+from .common import simulator_process
+
+HOST = '127.0.0.1'
+
+
+def frames_read(reader):
+    latest = reader.ring.latest()
+    return 0 if latest is None else latest.sequence
+
+
+def decode_file(path, **options):
+    """네트워크 없이 파일을 최대 속도로 디코딩합니다 (디코더의 상한)"""
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    reader = BackgroundFrameRead(None, path, **options)
+    reader.start()
+    reader.worker.join()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    frames = frames_read(reader)
+    return {
+        'frames': frames,
+        'fps': round(frames / elapsed, 1),
+        'cpu_ms_per_frame': round(cpu / max(frames, 1) * 1e3, 3),
+    }
+
+
+def decode_stream(path, seconds, **options):
+    """시뮬레이터가 실시간으로 보내는 스트림을 get_frame_read()로 받습니다"""
+    with simulator_process(HOST, '--video', path):
+        tello = Tello(HOST, transport=TelloTransport())
+        try:
+            tello.connect()
+            tello.streamon()
+            reader = tello.get_frame_read(**options)
+            reader.wait_for_next(0, timeout=Tello.FRAME_GRAB_TIMEOUT)
+            time.sleep(1.0)  # 디코더 초기화 중 쌓인 패킷을 먼저 소화합니다
+
+            first = frames_read(reader)
+            cpu_started = time.process_time()
+            started = time.perf_counter()
+            time.sleep(seconds)
+            frames = frames_read(reader) - first
+            elapsed = time.perf_counter() - started
+            cpu = time.process_time() - cpu_started
+
+            tello.streamoff()
+        finally:
+            tello.end()
+            tello.transport.close()
+
+    return {
+        'frames': frames,
+        'fps': round(frames / elapsed, 1),
+        'cpu_ms_per_frame': round(cpu / max(frames, 1) * 1e3, 3),
+    }
+
+
+def run(seconds=5.0, width=960, height=720):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        path = generate_test_video(os.path.join(directory, 'bench.h264'), seconds=seconds,
+                                   width=width, height=height)
+        return {
+            'file': {
+                'rgb24': decode_file(path),
+                'bgr24': decode_file(path, pixel_format=Tello.PIXEL_FORMAT_BGR),
+                'yuv420p': decode_file(path, pixel_format=Tello.PIXEL_FORMAT_YUV420P),
+            },
+            'stream': {
+                'rgb24': decode_stream(path, seconds),
+            },
+        }
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
@@ -1,2 +1,15 @@
-from .tello import Tello, TelloException, BackgroundFrameRead
-from .swarm import TelloSwarm
\ No newline at end of file
+from .tello import Tello, TelloException, TelloState, BackgroundFrameRead, FrameRingBuffer, RcStreamer, TelloTransport, \
+    CommandScheduler
+from .swarm import TelloSwarm
+from .swarm_transport import SwarmTransport
+from .frame_hub import FrameHub
+from .recorder import H264Recorder
+from .telemetry import TelemetryHistory
+
+
+def __getattr__(name):
+    # AsyncTello는 asyncio를 불러오므로 처음 사용할 때 가져옵니다
+    if name == 'AsyncTello':
+        from .async_tello import AsyncTello
+        return AsyncTello
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
\ No newline at end of file
@@ -0,0 +1,704 @@
+"""드론별 시간표(트랙)로 스웜 비행을 미리 검증하고 제시간에 실행하는 안무 컴파일러.
+Swarm choreography: per-drone tracks of timed commands, validated offline and
+dispatched on time by a single scheduler thread.
+"""
+
+import heapq
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .sim.model import DroneModel
+from .swarm import TelloSwarm, ScheduledBroadcast
+from .tello import Tello, TelloException, BroadcastGate
+
+# 명령별 인자 범위 (SDK 문서 기준). 튜플은 (최소, 최대), 집합은 허용되는 값입니다
+DISTANCE = (20, 500)
+COORDINATE = (-500, 500)
+STICK = (-100, 100)
+COMMAND_ARGUMENTS = {
+    'command': (), 'takeoff': (), 'land': (), 'stop': (), 'emergency': (),
+    'motoron': (), 'motoroff': (), 'mon': (), 'moff': (),
+    'up': (DISTANCE,), 'down': (DISTANCE,), 'left': (DISTANCE,),
+    'right': (DISTANCE,), 'forward': (DISTANCE,), 'back': (DISTANCE,),
+    'cw': ((1, 360),), 'ccw': ((1, 360),),
+    'flip': ({'l', 'r', 'f', 'b'},),
+    'speed': ((10, 100),),
+    'go': (COORDINATE,) * 3 + ((10, 100),),
+    'curve': (COORDINATE,) * 6 + ((10, 60),),
+    'rc': (STICK,) * 4,
+}
+# 비행 중이 아니어도 보낼 수 있는 명령
+GROUND_COMMANDS = ('command', 'takeoff', 'emergency', 'motoron', 'motoroff', 'mon', 'moff', 'speed')
+
+
+class ChoreographyStep:
+    """트랙의 한 단계: 안무 시작 후 t초에 보낼 명령 (rc 명령이면 응답 없이 보내는 스틱 값)
+    """
+
+    __slots__ = ('t', 'command', 'name', 'arguments')
+
+    def __init__(self, t: float, command: str):
+        self.t = float(t)
+        self.command = command.strip()
+        parts = self.command.split()
+        self.name = parts[0] if parts else ''
+        self.arguments = parts[1:]
+
+    @property
+    def is_rc(self) -> bool:
+        return self.name == 'rc'
+
+    def check(self) -> Optional[str]:
+        """SDK 범위를 벗어나면 문제 설명을, 문제가 없으면 None을 반환합니다"""
+        if self.name not in COMMAND_ARGUMENTS:
+            return "unsupported command '{}'".format(self.command)
+        limits = COMMAND_ARGUMENTS[self.name]
+        if len(self.arguments) != len(limits):
+            return "'{}' expects {} argument(s)".format(self.name, len(limits))
+
+        for argument, limit in zip(self.arguments, limits):
+            if isinstance(limit, set):
+                if argument not in limit:
+                    return "'{}' must be one of {}".format(argument, ', '.join(sorted(limit)))
+                continue
+            try:
+                value = int(argument)
+            except ValueError:
+                return "'{}' is not an integer".format(argument)
+            if not limit[0] <= value <= limit[1]:
+                return "{} is out of range {}..{}".format(value, *limit)
+
+        # go/curve는 x, y, z가 모두 -20~20 안에 있으면 드론이 거부합니다
+        if self.name in ('go', 'curve'):
+            for offset in range(0, len(self.arguments) - 1, 3):
+                point = [int(v) for v in self.arguments[offset:offset + 3]]
+                if all(-20 <= v <= 20 for v in point) and any(point):
+                    return "x, y and z can't all be between -20 and 20"
+        return None
+
+    def __repr__(self):
+        return 'ChoreographyStep({:.2f}, {!r})'.format(self.t, self.command)
+
+
+class Choreography:
+    """
+    드론마다 하나씩인 트랙에 (시각, 명령) 단계를 적어 스웜 비행을 기술합니다. 시각은 안무
+    시작 후 경과 초이고, 명령은 SDK 명령 문자열 또는 rc 스틱 값입니다. rc 값은 다음 단계까지
+    유지됩니다 (패킷 손실에 대비해 RC_REPEAT_INTERVAL마다 다시 보냅니다).
+
+    validate()는 시뮬레이터와 같은 운동 모델(DroneModel)로 트랙을 미리 비행해 보고 SDK 범위,
+    앞 기동이 끝나기 전에 시작하는 단계, 드론 사이의 충돌 범위, 배터리 소모량을 검사합니다.
+    compile()은 검증을 통과한 안무를 미리 인코딩된 시간표(CompiledChoreography)로 만들고,
+    perform()은 한 스레드에서 드론마다 다음 단계를 제시간에 보냅니다. 단계마다 모든 드론을
+    기다리는 sync()가 없으므로 한 드론이 늦어도 다른 드론의 시간표는 밀리지 않습니다.
+
+    ```python
+    show = Choreography(3, start_positions=[(0, 0, 0), (0, 150, 0), (0, 300, 0)])
+    show.add_all(0, 'takeoff')
+    show.add(0, 4, 'up 50').add(1, 4, 'flip f').add(2, 4, 'down 20')
+    show.add_all(7, 'rc 0 40 0 0')   # 3초 동안 앞으로
+    show.add_all(10, 'rc 0 0 0 0')
+    show.add_all(11, 'land')
+
+    report = show.validate(battery=[80, 75, 90])
+    print(report.errors, report.battery_needed)
+    result = swarm.perform(show)
+    ```
+
+    JSON으로 저장하고 불러올 수 있습니다 (save(), load()).
+    """
+
+    SAMPLE_INTERVAL = 0.05   # 충돌 검사용 궤적 샘플 간격 (초)
+    ENVELOPE_RADIUS = 40.0   # 드론 하나가 차지하는 원기둥의 반지름 (cm)
+    ENVELOPE_HEIGHT = 60.0   # 이 높이 차이 안에서 원기둥이 겹치면 충돌로 봅니다 (하강 기류 포함, cm)
+    TIMING_MARGIN = 0.5      # 앞 기동의 예상 종료 시각과 다음 단계 사이에 필요한 여유 (초)
+    BATTERY_DRAIN = 0.13     # 비행 중 초당 배터리 소모량 추정치 (%, 약 13분 비행 기준)
+    BATTERY_RESERVE = 20     # 안무가 끝난 뒤에도 남아 있어야 하는 배터리 (%)
+    RC_REPEAT_INTERVAL = 0.2  # 유지 중인 rc 값을 다시 보내는 간격 (초)
+
+    def __init__(self, drones: int, start_positions: Optional[Sequence[Sequence[float]]] = None):
+        """
+        매개변수:
+            drones: 드론(트랙) 수, TelloSwarm의 드론 순서와 같습니다
+            start_positions: 드론별 이륙 위치 (x 앞, y 왼쪽, z 위; cm)와 선택적으로 요(deg).
+                None이면 y축을 따라 2 * ENVELOPE_RADIUS + 20cm 간격으로 놓인 것으로 봅니다
+        """
+        if drones < 1:
+            raise ValueError('A choreography needs at least one drone')
+        if start_positions is None:
+            spacing = 2 * Choreography.ENVELOPE_RADIUS + 20
+            start_positions = [(0.0, i * spacing, 0.0) for i in range(drones)]
+        if len(start_positions) != drones:
+            raise ValueError('Expected {} start positions, got {}'.format(drones, len(start_positions)))
+
+        self.start_positions = [tuple(float(v) for v in position) + (0.0,) * (4 - len(position))
+                                for position in start_positions]
+        self.tracks: List[List[ChoreographyStep]] = [[] for _ in range(drones)]
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def add(self, drone: int, t: Union[int, float], command: Union[str, Sequence[int]]) -> 'Choreography':
+        """drone의 트랙에 t초에 보낼 명령을 추가합니다. command가 4개의 정수이면 rc 스틱 값입니다.
+        트랙은 시각 순으로 유지되며, 연달아 호출할 수 있도록 자기 자신을 반환합니다.
+        """
+        if not isinstance(command, str):
+            command = 'rc ' + ' '.join(str(int(v)) for v in command)
+        track = self.tracks[drone]
+        track.append(ChoreographyStep(t, command))
+        track.sort(key=lambda step: step.t)
+        return self
+
+    def add_all(self, t: Union[int, float], command: Union[str, Sequence[int]]) -> 'Choreography':
+        """모든 드론의 트랙에 같은 시각, 같은 명령을 추가합니다"""
+        for drone in range(len(self.tracks)):
+            self.add(drone, t, command)
+        return self
+
+    @property
+    def duration(self) -> float:
+        """마지막 단계의 시각 (초)"""
+        return max((track[-1].t for track in self.tracks if track), default=0.0)
+
+    def to_dict(self) -> dict:
+        return {
+            'start_positions': [list(position) for position in self.start_positions],
+            'tracks': [[[step.t, step.command] for step in track] for track in self.tracks],
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Choreography':
+        tracks = data['tracks']
+        choreography = Choreography(len(tracks), data.get('start_positions'))
+        for drone, track in enumerate(tracks):
+            for t, command in track:
+                choreography.add(drone, t, command)
+        return choreography
+
+    def save(self, path: str):
+        """안무를 JSON 파일로 저장합니다"""
+        with open(path, 'w') as fd:
+            json.dump(self.to_dict(), fd, indent=2)
+
+    @staticmethod
+    def load(path: str) -> 'Choreography':
+        """save()로 저장한 JSON 파일을 불러옵니다.
+        형식: {"start_positions": [[x, y, z, yaw], ...], "tracks": [[[t, "command"], ...], ...]}
+        """
+        with open(path, 'r') as fd:
+            return Choreography.from_dict(json.load(fd))
+
+    def validate(self, battery: Optional[Sequence[float]] = None,
+                 margin: Optional[float] = None) -> 'ChoreographyReport':
+        """드론 없이 안무를 검사합니다. 문제가 있어도 예외를 던지지 않고 보고서에 담습니다.
+
+        매개변수:
+            battery: 드론별 현재 배터리 잔량 (%). 주어지면 BATTERY_RESERVE를 남기고 끝낼 수 있는지 검사합니다
+            margin: 앞 기동과 다음 단계 사이에 필요한 여유 (초, None이면 TIMING_MARGIN)
+        반환값:
+            ChoreographyReport
+        """
+        if margin is None:
+            margin = Choreography.TIMING_MARGIN
+        report = ChoreographyReport(len(self.tracks))
+
+        # 모든 드론이 같은 시각 축에서 샘플링되도록 가장 늦게 끝나는 트랙 뒤까지 비행합니다
+        flights = [self.fly(drone, margin, report) for drone in range(len(self.tracks))]
+        end = max([flight[-1] for flight in flights] + [self.duration])
+        report.times = np.arange(0.0, end + Choreography.SAMPLE_INTERVAL, Choreography.SAMPLE_INTERVAL)
+        samples = [self.sample(drone, flight[0], report.times) for drone, flight in enumerate(flights)]
+        report.positions = np.stack([positions for positions, _, _ in samples])
+        report.flying = np.stack([flying for _, flying, _ in samples])
+        report.flight_time = np.array([flight_time for _, _, flight_time in samples])
+        report.battery_needed = report.flight_time * Choreography.BATTERY_DRAIN
+        report.end_times = [flight[-1] for flight in flights]
+
+        if battery is not None:
+            if len(battery) != len(self.tracks):
+                raise ValueError('Expected {} battery levels, got {}'.format(len(self.tracks), len(battery)))
+            for drone, (level, needed) in enumerate(zip(battery, report.battery_needed)):
+                if level - needed < Choreography.BATTERY_RESERVE:
+                    report.error(drone, None, 'needs about {:.0f}% battery but has {:.0f}% ({}% reserve)'
+                                 .format(needed, level, Choreography.BATTERY_RESERVE))
+
+        report.check_separation()
+        return report
+
+    def fly(self, drone: int, margin: float, report: 'ChoreographyReport') -> Tuple[List, float]:
+        """트랙의 단계를 순서대로 검사하고, 샘플링에 쓸 (단계, 예상 기동 시간) 목록과
+        트랙이 끝나는 시각을 반환합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        model = self.model(drone)
+        timeline = []
+        busy_until = 0.0
+        busy_with: Optional[ChoreographyStep] = None
+        previous: Optional[ChoreographyStep] = None
+        now = 0.0
+
+        for step in self.tracks[drone]:
+            problem = step.check()
+            if problem is not None:
+                report.error(drone, step, problem)
+                continue
+            if step.t < 0:
+                report.error(drone, step, 'starts before the choreography')
+                continue
+            if previous is not None and step.t == previous.t:
+                report.error(drone, step, "is scheduled at the same time as '{}'".format(previous.command))
+            # 드론은 기동이 끝나기 전의 명령과 rc 값을 무시하거나 거부합니다
+            if busy_with is not None and step.t < busy_until + margin and step.name not in ('stop', 'emergency'):
+                report.error(drone, step, "starts before '{}' is expected to finish at {:.2f}s (+{:.2f}s margin)"
+                             .format(busy_with.command, busy_until, margin))
+            previous = step
+
+            model.step(step.t - now)
+            now = step.t
+            if step.name not in GROUND_COMMANDS and not model.flying:
+                report.error(drone, step, 'is sent while the drone is not flying')
+                continue
+            if step.name == 'takeoff' and model.flying:
+                report.error(drone, step, 'is sent while the drone is already flying')
+                continue
+
+            duration = Choreography.apply(model, step)
+            timeline.append((step, duration))
+            if not step.is_rc:
+                busy_with = step
+                busy_until = step.t + max(duration, Tello.TIME_BTW_COMMANDS)
+
+        # 마지막 기동(착륙 등)이 끝난 뒤의 상태를 봅니다 (부동소수점 오차만큼 더 진행)
+        model.step(max(0.0, busy_until - now) + Choreography.SAMPLE_INTERVAL)
+        last = self.tracks[drone][-1] if self.tracks[drone] else None
+        if last is not None and last.is_rc and any(int(v) for v in last.arguments):
+            report.error(drone, last, 'leaves the drone moving at the end of its track')
+        elif model.flying:
+            report.warning(drone, last, 'leaves the drone flying at the end of its track')
+        return timeline, max(busy_until, last.t if last is not None else 0.0)
+
+    def model(self, drone: int) -> DroneModel:
+        """이륙 위치에 놓인 운동 모델
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        model = DroneModel()
+        model.x, model.y, model.z, model.yaw = self.start_positions[drone]
+        model.flying = model.z > 0
+        return model
+
+    @staticmethod
+    def apply(model: DroneModel, step: ChoreographyStep) -> float:
+        """단계 하나를 운동 모델에 적용하고 예상 기동 시간(초)을 반환합니다.
+        명령 해석은 시뮬레이터(TelloSimulator.execute)와 같습니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        name = step.name
+        values = [int(v) for v in step.arguments] if name != 'flip' else []
+        maneuver = None
+        if name == 'rc':
+            model.set_rc(*values)
+        elif name == 'speed':
+            model.speed = values[0]
+        elif name == 'takeoff':
+            maneuver = model.takeoff()
+        elif name == 'land':
+            maneuver = model.land()
+        elif name == 'stop':
+            model.stop()
+        elif name == 'emergency':
+            model.emergency()
+        elif name in DroneModel.MOVE_COMMANDS:
+            forward, left, up = (axis * values[0] for axis in DroneModel.MOVE_COMMANDS[name])
+            maneuver = model.move_relative(forward, left, up, model.speed)
+        elif name in ('cw', 'ccw'):
+            maneuver = model.rotate(values[0] if name == 'cw' else -values[0])
+        elif name == 'flip':
+            maneuver = model.hold(DroneModel.FLIP_TIME)
+        elif name == 'go':
+            maneuver = model.move_relative(*values[:3], values[3])
+        elif name == 'curve':
+            # 곡선은 끝점까지의 직선으로 근사합니다
+            maneuver = model.move_relative(*values[3:6], values[6])
+        return maneuver.remaining if maneuver is not None else 0.0
+
+    def sample(self, drone: int, timeline: List, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        """트랙을 다시 비행하며 times 시각마다 (위치, 비행 여부)를 기록합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        model = self.model(drone)
+        positions = np.empty((len(times), 3))
+        flying = np.empty(len(times), dtype=bool)
+        pending = deque(timeline)
+        now = 0.0
+        for i, t in enumerate(times):
+            while pending and pending[0][0].t <= t:
+                step, _ = pending.popleft()
+                model.step(step.t - now)
+                now = step.t
+                Choreography.apply(model, step)
+            model.step(t - now)
+            now = t
+            positions[i] = model.x, model.y, model.z
+            flying[i] = model.flying
+        return positions, flying, model.flight_time
+
+    def compile(self, battery: Optional[Sequence[float]] = None,
+                margin: Optional[float] = None) -> 'CompiledChoreography':
+        """안무를 검증하고 실행할 수 있는 시간표로 만듭니다. 오류가 있으면 TelloException을 던집니다.
+        매개변수는 validate()와 같습니다.
+        """
+        report = self.validate(battery, margin)
+        for warning in report.warnings:
+            Tello.LOGGER.warning('Choreography: {}'.format(warning))
+        if report.errors:
+            raise TelloException('Choreography is not valid:\n' + '\n'.join(report.errors))
+        return CompiledChoreography(self, report)
+
+
+class ChoreographyReport:
+    """
+    Choreography.validate()의 결과.
+
+    Attributes:
+        errors: 실행을 막는 문제 목록
+        warnings: 실행은 가능하지만 확인이 필요한 문제 목록
+        times: 궤적 샘플 시각 (초)
+        positions: (드론 수, 샘플 수, 3) 예상 위치 (cm)
+        flying: (드론 수, 샘플 수) 비행 여부
+        flight_time: 드론별 예상 비행 시간 (초)
+        battery_needed: 드론별 예상 배터리 소모량 (%)
+        end_times: 드론별 마지막 기동이 끝나는 예상 시각 (초)
+        min_distances: 비행 중 가장 가까웠던 드론 쌍별 {(i, j): 수평 거리(cm)}
+    """
+
+    def __init__(self, drones: int):
+        self.drones = drones
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.times = np.empty(0)
+        self.positions = np.empty((drones, 0, 3))
+        self.flying = np.empty((drones, 0), dtype=bool)
+        self.flight_time = np.zeros(drones)
+        self.battery_needed = np.zeros(drones)
+        self.end_times = [0.0] * drones
+        self.min_distances = {}
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @staticmethod
+    def describe(drone: int, step: Optional[ChoreographyStep], problem: str) -> str:
+        if step is None:
+            return 'Drone {} {}'.format(drone, problem)
+        return "Drone {} at {:.2f}s: '{}' {}".format(drone, step.t, step.command, problem)
+
+    def error(self, drone: int, step: Optional[ChoreographyStep], problem: str):
+        self.errors.append(ChoreographyReport.describe(drone, step, problem))
+
+    def warning(self, drone: int, step: Optional[ChoreographyStep], problem: str):
+        self.warnings.append(ChoreographyReport.describe(drone, step, problem))
+
+    def check_separation(self):
+        """비행 중인 두 드론의 원기둥 범위가 겹치는 샘플을 찾습니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        diameter = 2 * Choreography.ENVELOPE_RADIUS
+        for i in range(self.drones - 1):
+            # 드론 i와 나머지 드론 사이를 모든 샘플에 대해 한 번에 계산합니다
+            delta = self.positions[i + 1:] - self.positions[i]
+            horizontal = np.hypot(delta[..., 0], delta[..., 1])
+            vertical = np.abs(delta[..., 2])
+            airborne = self.flying[i + 1:] & self.flying[i]
+            conflict = airborne & (horizontal < diameter) & (vertical < Choreography.ENVELOPE_HEIGHT)
+
+            for offset in range(self.drones - i - 1):
+                j = i + 1 + offset
+                if airborne[offset].any():
+                    self.min_distances[(i, j)] = float(horizontal[offset][airborne[offset]].min())
+                hits = np.flatnonzero(conflict[offset])
+                if len(hits):
+                    first = hits[0]
+                    self.errors.append('Drones {} and {} come within {:.0f} cm horizontally and {:.0f} cm '
+                                       'vertically at {:.2f}s'.format(i, j, horizontal[offset, first],
+                                                                      vertical[offset, first], self.times[first]))
+
+
+class CompiledStep:
+    """시간표의 한 단계: 미리 인코딩된 데이터그램과 전송 시각
+    """
+
+    __slots__ = ('t', 'drone', 'command', 'payload', 'is_rc')
+
+    def __init__(self, t: float, drone: int, command: str):
+        self.t = t
+        self.drone = drone
+        self.command = command
+        self.payload = command.encode('utf-8')
+        self.is_rc = command.startswith('rc ')
+
+    def __repr__(self):
+        return 'CompiledStep({:.2f}, {}, {!r})'.format(self.t, self.drone, self.command)
+
+
+class CompiledChoreography:
+    """
+    검증을 통과한 안무의 드론별 시간표. 유지되는 rc 값의 재전송까지 미리 펼쳐 두고 모든
+    데이터그램을 인코딩해 두므로, 실행 중에는 시각을 기다렸다가 보내기만 합니다.
+
+    보통 Choreography.compile()이나 TelloSwarm.perform()이 만듭니다.
+    """
+
+    START_DELAY = 1.0   # start_at이 없을 때 첫 단계까지의 준비 시간 (초)
+    STAGE_AHEAD = 0.5   # 명령을 스케줄러에 미리 넣어 두는 시간 (초)
+    MAX_LATENESS = 0.5  # 앞 명령의 응답이 늦을 때 기다려 주는 최대 시간 (초)
+    POLL_INTERVAL = 0.005  # 늦은 드론의 준비 여부를 다시 확인하는 간격 (초)
+
+    def __init__(self, choreography: Choreography, report: ChoreographyReport):
+        self.report = report
+        self.duration = max(report.end_times + [choreography.duration])
+        self.tracks: List[List[CompiledStep]] = []
+        for drone, track in enumerate(choreography.tracks):
+            steps = []
+            for i, step in enumerate(track):
+                steps.append(CompiledStep(step.t, drone, step.command))
+                if not step.is_rc or i + 1 == len(track):
+                    continue
+                # 다음 단계까지 rc 값을 유지합니다
+                repeat = step.t + Choreography.RC_REPEAT_INTERVAL
+                while repeat < track[i + 1].t - Tello.TIME_BTW_RC_CONTROL_COMMANDS:
+                    steps.append(CompiledStep(repeat, drone, step.command))
+                    repeat += Choreography.RC_REPEAT_INTERVAL
+            self.tracks.append(steps)
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def perform(self, swarm: TelloSwarm, start_at: Optional[float] = None,
+                land_on_error: bool = True) -> 'ChoreographyResult':
+        """안무를 실행하고 끝날 때까지 기다립니다.
+
+        호출한 스레드 하나가 드론별 다음 단계의 시각을 힙으로 관리하며 차례대로 보냅니다.
+        rc 단계는 바로 보내고, 응답이 있는 명령은 STAGE_AHEAD초 전에 드론의 스케줄러에
+        BroadcastGate와 함께 넣어 두었다가 시각이 되면 미리 인코딩한 데이터그램을 보냅니다.
+        앞 명령의 응답이 아직 없는 드론은 MAX_LATENESS초까지 기다리되, 그동안 다른 드론의
+        단계는 계속 보냅니다.
+
+        매개변수:
+            swarm: 안무의 트랙 순서와 같은 순서의 드론들
+            start_at: 안무 시작 시각 (time.monotonic() 기준, None이면 START_DELAY초 뒤)
+            land_on_error: 명령이 실패하거나 너무 늦으면 안무를 멈추고 모든 드론을 착륙시킵니다.
+                False이면 실패를 기록하고 계속합니다
+        반환값:
+            ChoreographyResult
+        """
+        if len(swarm) != len(self.tracks):
+            raise TelloException('Choreography has {} tracks but the swarm has {} drones'
+                                 .format(len(self.tracks), len(swarm)))
+        return ChoreographyRunner(self, swarm, start_at, land_on_error).run()
+
+
+class ChoreographyResult:
+    """
+    안무 실행 결과.
+
+    Attributes:
+        started_at: 안무 시작 시각 (time.monotonic())
+        sends: 보낸 단계별 (CompiledStep, 실제 전송 시각)
+        failures: (CompiledStep, 예외) 목록. 오류 응답, 타임아웃, 허용치를 넘은 지연이 포함됩니다
+        aborted: 실패로 안무를 중단하고 착륙했는지 여부
+    """
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.sends: List[Tuple[CompiledStep, float]] = []
+        self.failures: List[Tuple[CompiledStep, Exception]] = []
+        self.aborted = False
+
+    @property
+    def completed(self) -> bool:
+        return not self.failures and not self.aborted
+
+    @property
+    def lateness(self) -> np.ndarray:
+        """단계별로 예정 시각보다 늦게 보낸 시간 (초)"""
+        return np.array([sent_at - self.started_at - step.t for step, sent_at in self.sends])
+
+
+class ChoreographyRunner:
+    """CompiledChoreography.perform()의 실행 상태.
+    내부 클래스로, 일반적으로 직접 사용하지 않습니다.
+    """
+
+    STAGE, FIRE = 0, 1
+
+    def __init__(self, compiled: CompiledChoreography, swarm: TelloSwarm, start_at: Optional[float],
+                 land_on_error: bool):
+        self.compiled = compiled
+        self.swarm = swarm
+        self.land_on_error = land_on_error
+        if start_at is None:
+            start_at = time.monotonic() + CompiledChoreography.START_DELAY
+        self.start_at = start_at
+        self.result = ChoreographyResult(start_at)
+
+        # 전송 루프에서는 미리 찾아 둔 메서드만 사용합니다
+        self.senders = [(tello.get_control_socket().sendto, tello.address) for tello in swarm.tellos]
+        self.schedulers = [tello.get_command_scheduler() for tello in swarm.tellos]
+        self.positions = [0] * len(compiled.tracks)  # 드론별 다음에 보낼 단계
+        self.staged: List[Optional[Tuple[CompiledStep, BroadcastGate]]] = [None] * len(compiled.tracks)
+        self.futures: List[Future] = []
+        # 응답 콜백이 다른 스레드에서 추가하므로 deque를 사용합니다 (append는 원자적)
+        self.response_failures = deque()
+        # 러너가 관문을 중단시킨 오류. 이미 기록했으므로 응답 콜백에서 다시 기록하지 않습니다
+        self.abort_errors = set()
+        self.events = []
+        self.sequence = 0
+
+    def push(self, at: float, kind: int, drone: int):
+        self.sequence += 1
+        heapq.heappush(self.events, (at, self.sequence, kind, drone))
+
+    def schedule_next(self, drone: int):
+        """드론의 다음 단계를 이벤트 힙에 넣습니다"""
+        track = self.compiled.tracks[drone]
+        position = self.positions[drone]
+        if position >= len(track):
+            return
+        step = track[position]
+        due = self.start_at + step.t
+        if step.is_rc:
+            self.push(due, ChoreographyRunner.FIRE, drone)
+        else:
+            self.push(due - CompiledChoreography.STAGE_AHEAD, ChoreographyRunner.STAGE, drone)
+
+    def run(self) -> ChoreographyResult:
+        for drone in range(len(self.compiled.tracks)):
+            self.schedule_next(drone)
+
+        try:
+            while self.events:
+                at, _, kind, drone = heapq.heappop(self.events)
+                self.sleep_until(at)
+                if kind == ChoreographyRunner.STAGE:
+                    self.stage(drone, at + CompiledChoreography.STAGE_AHEAD)
+                else:
+                    self.fire(drone, at)
+
+                if self.response_failures:
+                    self.result.failures.extend(self.response_failures)
+                    self.response_failures.clear()
+                if self.result.failures and self.land_on_error:
+                    self.abort(land=True)
+                    break
+            wait(self.futures)
+            self.result.failures.extend(self.response_failures)
+        except BaseException:
+            # Ctrl+C 등으로 중단되어도 드론을 공중에 내버려 두지 않습니다
+            self.abort(land=True)
+            raise
+        return self.result
+
+    @staticmethod
+    def sleep_until(at: float):
+        delay = at - time.monotonic() - ScheduledBroadcast.SPIN_TIME
+        if delay > 0:
+            time.sleep(delay)
+        while time.monotonic() < at:
+            pass
+
+    def stage(self, drone: int, due: float):
+        """다음 명령을 관문과 함께 스케줄러에 넣고 전송 이벤트를 예약합니다"""
+        step = self.compiled.tracks[drone][self.positions[drone]]
+        gate = BroadcastGate(1, due)
+        try:
+            future = self.schedulers[drone].submit(step.command, None, gate)
+        except TelloException as e:
+            self.result.failures.append((step, e))
+            self.advance(drone)
+            return
+        future.add_internal_callback(lambda done: self.check_response(step, done))
+        self.futures.append(future)
+        self.staged[drone] = (step, gate)
+        self.push(due, ChoreographyRunner.FIRE, drone)
+
+    def fire(self, drone: int, due: float):
+        """드론의 다음 단계를 보냅니다. 앞 명령이 끝나지 않았으면 나중에 다시 시도합니다"""
+        track = self.compiled.tracks[drone]
+        step = track[self.positions[drone]]
+        sendto, address = self.senders[drone]
+
+        gate = None
+        if not step.is_rc:
+            _, gate = self.staged[drone]
+            if not gate.wait_ready(0):
+                late = time.monotonic() - (self.start_at + step.t)
+                if late < CompiledChoreography.MAX_LATENESS:
+                    self.push(time.monotonic() + CompiledChoreography.POLL_INTERVAL, ChoreographyRunner.FIRE, drone)
+                    return
+                error = TelloException("Drone {} was still busy {:.2f}s after '{}' was due"
+                                       .format(drone, late, step.command))
+                self.abort_errors.add(error)
+                gate.abort(error)
+                self.staged[drone] = None
+                self.result.failures.append((step, error))
+                self.advance(drone)
+                return
+
+        try:
+            sendto(step.payload, address)
+            self.result.sends.append((step, time.monotonic()))
+        except OSError as e:
+            self.result.failures.append((step, e))
+        finally:
+            if gate is not None:
+                gate.open()
+                self.staged[drone] = None
+        self.advance(drone)
+
+    def advance(self, drone: int):
+        self.positions[drone] += 1
+        self.schedule_next(drone)
+
+    def check_response(self, step: CompiledStep, future: Future):
+        """명령 응답이 'ok'가 아니면 실패로 기록합니다 (스케줄러 스레드에서 호출)"""
+        if future.cancelled():
+            error = TelloException("'{}' was cancelled by '{}'".format(step.command, future.cancelled_by))
+        elif future.exception() in self.abort_errors:
+            return
+        elif future.exception() is not None:
+            error = future.exception()
+        elif future.result() is None:
+            error = TelloException("Drone {} did not answer '{}' within {} seconds"
+                                   .format(step.drone, step.command, future.timeout))
+        elif 'ok' not in future.result().lower():
+            error = TelloException("Drone {} answered '{}' to '{}'".format(step.drone, future.result(), step.command))
+        else:
+            return
+        self.response_failures.append((step, error))
+
+    def abort(self, land: bool):
+        """남은 단계를 버리고, land이면 모든 드론을 멈춘 뒤 착륙시킵니다"""
+        self.result.aborted = True
+        self.events = []
+        error = TelloException('Choreography aborted')
+        self.abort_errors.add(error)
+        for staged in self.staged:
+            if staged is not None:
+                staged[1].abort(error)
+        self.staged = [None] * len(self.staged)
+
+        for failure in self.result.failures:
+            Tello.LOGGER.error('Choreography step failed: {}'.format(failure[1]))
+        if not land:
+            return
+
+        for sendto, address in self.senders:
+            sendto(b'rc 0 0 0 0', address)
+        Tello.LOGGER.warning('Choreography aborted, landing all drones')
+        # 착륙 실패(이미 착륙한 드론 등)는 무시합니다
+        self.swarm.send_all('land')
@@ -0,0 +1,402 @@
+"""Tello SDK 2.0 UDP 프로토콜을 흉내 내는 로컬 시뮬레이터.
+Local stand-in that speaks the Tello SDK 2.0 UDP protocol.
+"""
+
+import heapq
+import random
+import socket
+import time
+from contextlib import suppress
+from queue import Queue
+from threading import Thread, Condition, Event
+from typing import Optional
+
+from ..tello import Tello
+from .model import DroneModel
+from .video import VideoStreamer
+
+
+class DelayedSender:
+    """지연(latency + jitter)이 적용된 응답을 하나의 스레드에서 예약된 시각에 보냅니다.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.socket = sock
+        self.condition = Condition()
+        self.pending = []  # (보낼 시각, 순번, 데이터, 주소) 힙
+        self.counter = 0
+        self.stopped = False
+        self.worker = Thread(target=self.send_loop, daemon=True)
+        self.worker.start()
+
+    def schedule(self, delay: float, data: bytes, address):
+        with self.condition:
+            self.counter += 1
+            heapq.heappush(self.pending, (time.monotonic() + delay, self.counter, data, address))
+            self.condition.notify()
+
+    def send_loop(self):
+        while True:
+            with self.condition:
+                while not self.stopped:
+                    if self.pending:
+                        delay = self.pending[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self.condition.wait(delay)
+                    else:
+                        self.condition.wait()
+                if self.stopped:
+                    return
+                _, _, data, address = heapq.heappop(self.pending)
+
+            with suppress(OSError):
+                self.socket.sendto(data, address)
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+
+class TelloSimulator:
+    """
+    실제 드론 없이 djitellopy를 시험하기 위한 가상 Tello입니다. 제어 포트(8889)로
+    SDK 명령을 받아 응답하고, 상태 패킷을 state_rate Hz로 보내며, streamon 후에는
+    H.264 파일을 비디오 포트로 반복 전송합니다. 지연, 지터와 패킷 손실을 설정할 수 있어
+    벤치마크와 CI에서 네트워크 조건을 재현할 수 있습니다.
+
+    클라이언트 쪽에서는 전역 8889 소켓과 충돌하지 않도록 TelloTransport를 사용하세요.
+    여러 대를 띄우려면 127.0.0.2, 127.0.0.3 처럼 서로 다른 루프백 주소를 사용합니다.
+
+    ```python
+    from djitellopy import Tello, TelloTransport
+    from djitellopy.sim import TelloSimulator
+
+    with TelloSimulator('127.0.0.1', latency=0.01, time_scale=0.1):
+        tello = Tello('127.0.0.1', transport=TelloTransport())
+        tello.connect()
+        tello.takeoff()
+        tello.move_forward(100)
+        tello.land()
+    ```
+
+    명령줄에서도 실행할 수 있습니다: `python -m djitellopy.sim --latency 0.02`
+    """
+
+    TICK_RATE = 100  # 운동 모델 적분 주기 (Hz)
+
+    # 인자 없이 'ok'만 응답하는 명령
+    ACKNOWLEDGED_COMMANDS = {
+        'command', 'mon', 'moff', 'mdirection', 'setfps', 'setbitrate', 'setresolution',
+        'downvision', 'wifi', 'ap', 'motoron', 'motoroff', 'keepalive', 'EXT', 'reboot',
+    }
+
+    def __init__(self, host: str = '127.0.0.1', latency: float = 0.0, jitter: float = 0.0,
+                 loss: float = 0.0, state_rate: float = 10.0, video_path: Optional[str] = None,
+                 time_scale: float = 1.0, seed: Optional[int] = None,
+                 serial_number: str = '0TQSIM000000001', state_replay: Optional[str] = None,
+                 replay_speed: float = 1.0):
+        """
+        매개변수:
+            host: 제어 소켓을 바인딩할 주소
+            latency: 응답 지연 (초)
+            jitter: 응답 지연에 더해지는 0~jitter초의 무작위 지연
+            loss: 명령 패킷 손실 확률 (0~1), 손실된 명령에는 응답하지 않습니다
+            state_rate: 상태 패킷 전송 주기 (Hz)
+            video_path: streamon 시 전송할 Annex-B H.264 파일 (None이면 비디오 없음)
+            time_scale: 기동 시간 배율 (0.1이면 이동 명령이 10배 빨리 끝남)
+            seed: 지터와 손실에 사용하는 난수 시드
+            serial_number: sn? 응답
+            state_replay: 운동 모델 대신 상태 패킷으로 재생할 비행 기록 파일
+                (Tello.start_state_recording으로 기록한 파일)
+            replay_speed: 재생 속도 배율
+        """
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.state_rate = state_rate
+        self.video_path = video_path
+        self.serial_number = serial_number
+        self.state_replay = state_replay
+        self.replay_speed = replay_speed
+        self.replay_finished = Event()
+        self.random = random.Random(seed)
+        self.model = DroneModel(time_scale)
+
+        self.peer_host: Optional[str] = None
+        self.state_port = Tello.STATE_UDP_PORT
+        self.video_port = Tello.DEFAULT_VS_UDP_PORT
+
+        self.commands_received = 0
+        self.commands_dropped = 0
+        self.responses_sent = 0
+        self.state_packets_sent = 0
+
+        self.control_socket: Optional[socket.socket] = None
+        self.state_socket: Optional[socket.socket] = None
+        self.sender: Optional[DelayedSender] = None
+        self.video: Optional[VideoStreamer] = None
+        self.command_queue: Queue = Queue()
+        self.stopped = Event()
+        self.threads = []
+
+    def start(self) -> 'TelloSimulator':
+        """소켓을 열고 수신, 명령 처리, 시뮬레이션 스레드를 시작합니다"""
+        self.control_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.control_socket.bind((self.host, Tello.CONTROL_UDP_PORT))
+        self.state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.state_socket.bind((self.host, 0))
+        self.sender = DelayedSender(self.control_socket)
+        if self.video_path is not None:
+            self.video = VideoStreamer(self.video_path, self.host)
+
+        self.stopped.clear()
+        workers = [self.receive_loop, self.command_loop, self.simulation_loop]
+        if self.state_replay is not None:
+            workers.append(self.replay_loop)
+        self.threads = [Thread(target=worker, daemon=True) for worker in workers]
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """모든 스레드를 멈추고 소켓을 닫습니다"""
+        self.stopped.set()
+        self.model.stop()
+        self.command_queue.put(None)
+        if self.video is not None:
+            self.video.close()
+        if self.sender is not None:
+            self.sender.stop()
+        for sock in (self.control_socket, self.state_socket):
+            if sock is not None:
+                # close()만으로는 recvfrom이 깨어나지 않습니다
+                with suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+                sock.close()
+        for thread in self.threads:
+            thread.join(1)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reply(self, response: str, address):
+        """설정된 지연을 적용해 응답을 보냅니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        self.responses_sent += 1
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        data = response.encode('utf-8')
+        if delay > 0:
+            self.sender.schedule(delay, data, address)
+        else:
+            with suppress(OSError):
+                self.control_socket.sendto(data, address)
+
+    def receive_loop(self):
+        """제어 소켓을 읽는 스레드 워커 함수. rc, stop, emergency는 즉시 처리하고
+        나머지 명령은 명령 처리 스레드로 넘깁니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        while not self.stopped.is_set():
+            try:
+                data, address = self.control_socket.recvfrom(1024)
+            except OSError:
+                return
+            if address is None:
+                return  # 소켓 종료
+
+            self.commands_received += 1
+            if self.loss and self.random.random() < self.loss:
+                self.commands_dropped += 1
+                continue
+
+            command = data.decode('utf-8', errors='replace').strip()
+            self.peer_host = address[0]
+
+            if command.startswith('rc '):
+                try:
+                    self.model.set_rc(*(int(v) for v in command.split()[1:5]))
+                except (TypeError, ValueError):
+                    pass  # 실제 드론처럼 잘못된 rc 명령은 무시
+            elif command == 'emergency':
+                self.model.emergency()
+            elif command == 'stop':
+                self.model.stop()
+                self.reply('ok', address)
+            else:
+                self.command_queue.put((command, address))
+
+    def command_loop(self):
+        """명령을 순서대로 실행하는 스레드 워커 함수. 이동 명령은 기동이 끝난 뒤에 응답합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        while True:
+            item = self.command_queue.get()
+            if item is None or self.stopped.is_set():
+                return
+            command, address = item
+            try:
+                response = self.execute(command)
+            except (IndexError, ValueError):
+                response = 'error'
+            self.reply(response, address)
+
+    def wait(self, maneuver) -> str:
+        maneuver.finished.wait()
+        return 'error' if maneuver.cancelled else 'ok'
+
+    def execute(self, command: str) -> str:
+        """SDK 명령 하나를 실행하고 응답 문자열을 반환합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        parts = command.split()
+        name = parts[0] if parts else ''
+        model = self.model
+
+        if name.endswith('?'):
+            return self.query(name)
+        if name in TelloSimulator.ACKNOWLEDGED_COMMANDS:
+            return 'ok'
+
+        if name == 'port':
+            self.state_port, self.video_port = int(parts[1]), int(parts[2])
+            return 'ok'
+        if name == 'streamon':
+            if self.video is not None:
+                self.video.start((self.peer_host, self.video_port))
+            return 'ok'
+        if name == 'streamoff':
+            if self.video is not None:
+                self.video.stop()
+            return 'ok'
+        if name == 'speed':
+            speed = int(parts[1])
+            if not 10 <= speed <= 100:
+                return 'error'
+            model.speed = speed
+            return 'ok'
+
+        if name == 'takeoff':
+            if model.flying:
+                return 'error'
+            return self.wait(model.takeoff())
+        if name == 'throwfly':
+            return self.wait(model.takeoff())
+        if not model.flying:
+            return 'error Not joystick'
+
+        if name == 'land':
+            return self.wait(model.land())
+        if name in DroneModel.MOVE_COMMANDS:
+            distance = int(parts[1])
+            if not 20 <= distance <= 500:
+                return 'error'
+            forward, left, up = (axis * distance for axis in DroneModel.MOVE_COMMANDS[name])
+            return self.wait(model.move_relative(forward, left, up, model.speed))
+        if name in ('cw', 'ccw'):
+            degrees = int(parts[1])
+            if not 1 <= degrees <= 360:
+                return 'error'
+            return self.wait(model.rotate(degrees if name == 'cw' else -degrees))
+        if name == 'flip':
+            if parts[1] not in ('l', 'r', 'f', 'b'):
+                return 'error'
+            return self.wait(model.hold(DroneModel.FLIP_TIME))
+        if name in ('go', 'jump'):
+            x, y, z, speed = (int(v) for v in parts[1:5])
+            return self.wait(model.move_relative(x, y, z, speed))
+        if name == 'curve':
+            x, y, z, speed = int(parts[4]), int(parts[5]), int(parts[6]), int(parts[7])
+            return self.wait(model.move_relative(x, y, z, speed))
+
+        return 'error'
+
+    def query(self, name: str) -> str:
+        """읽기 명령(?)의 응답
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        model = self.model
+        if name == 'battery?':
+            return str(int(model.battery))
+        if name == 'speed?':
+            return str(int(model.speed))
+        if name == 'time?':
+            return str(int(model.flight_time))
+        if name == 'height?':
+            return str(int(model.z))
+        if name == 'temp?':
+            return '61'
+        if name == 'attitude?':
+            return 'pitch:0;roll:0;yaw:{};'.format(int(round(model.yaw)))
+        if name == 'baro?':
+            return str(int(model.z / 100))
+        if name == 'tof?':
+            return '{}mm'.format(int(model.z * 10) + 100)
+        if name == 'wifi?':
+            return '90'
+        if name == 'sdk?':
+            return '30'
+        if name == 'sn?':
+            return self.serial_number
+        if name == 'active?':
+            return 'ok'
+        return 'error'
+
+    def simulation_loop(self):
+        """운동 모델을 적분하고 상태 패킷을 보내는 스레드 워커 함수
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        tick = 1 / TelloSimulator.TICK_RATE
+        # 기록을 재생하는 동안에는 replay_loop가 상태 패킷을 보냅니다
+        state_interval = 1 / self.state_rate if self.state_rate > 0 and self.state_replay is None else None
+        last_step = next_state = time.monotonic()
+
+        while not self.stopped.wait(tick):
+            now = time.monotonic()
+            self.model.step(now - last_step)
+            last_step = now
+
+            # 실제 드론처럼 첫 명령을 받은 뒤부터 상태 패킷을 보냅니다
+            if state_interval is None or self.peer_host is None or now < next_state:
+                continue
+            next_state = max(next_state + state_interval, now)
+            try:
+                self.state_socket.sendto(self.model.state_line(), (self.peer_host, self.state_port))
+                self.state_packets_sent += 1
+            except OSError:
+                if self.stopped.is_set():
+                    return
+
+    def replay_loop(self):
+        """기록된 상태 패킷을 기록된 간격 그대로 한 번씩 보내는 스레드 워커 함수.
+        첫 명령을 받은 뒤에 재생을 시작하며, 끝나면 replay_finished가 설정됩니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        # flight_recorder는 numpy를 사용하므로 재생할 때만 import 합니다
+        from ..flight_recorder import load_state_recording, format_state_record
+
+        records = load_state_recording(self.state_replay)
+        while self.peer_host is None:
+            if self.stopped.wait(0.01):
+                return
+
+        if len(records):
+            first_timestamp = float(records[0]['timestamp'])
+            started = time.monotonic()
+            for record in records:
+                due = started + (float(record['timestamp']) - first_timestamp) / self.replay_speed
+                delay = due - time.monotonic()
+                if delay > 0 and self.stopped.wait(delay):
+                    return
+                try:
+                    self.state_socket.sendto(format_state_record(record), (self.peer_host, self.state_port))
+                    self.state_packets_sent += 1
+                except OSError:
+                    return
+        self.replay_finished.set()
@@ -2,11 +2,15 @@
 Library for controlling multiple DJI Ryze Tello drones.
 """
 
-from threading import Thread, Barrier
-from queue import Queue
-from typing import List, Callable
-
-from .tello import Tello, TelloException
+import ipaddress
+import select
+import socket
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Barrier, local
+from typing import List, Callable, Optional, Union, Any, Dict, Sequence, Tuple
+
+from .tello import Tello, TelloException, BroadcastGate
 from .enforce_types import enforce_types
 
 
@@ -16,11 +20,18 @@ class TelloSwarm:
     Swarm library for controlling multiple Tellos simultaneously
     """
 
+    DISCOVERY_TIMEOUT = 2.0          # discover()가 응답을 기다리는 시간 (초)
+    DISCOVERY_RESEND_INTERVAL = 0.5  # 응답하지 않은 주소로 다시 보내는 간격 (초)
+    STATE_WAIT_TIMEOUT = 1.0         # discover() 후 첫 상태 패킷을 기다리는 시간 (초)
+    BROADCAST_READY_TIMEOUT = Tello.RESPONSE_TIMEOUT  # broadcast()가 진행 중인 명령을 기다리는 시간 (초)
+
     tellos: List[Tello]
     barrier: Barrier
-    funcBarier: Barrier
-    funcQueues: List[Queue]
-    threads: List[Thread]
+    executor: ThreadPoolExecutor
+    serial_numbers: List[Optional[str]]
+    sdk_versions: List[Optional[str]]
+    # 상태 행렬 (get_state_matrix()를 처음 호출할 때 만들어집니다)
+    state_aggregate: Optional['SwarmStateMatrix'] = None
 
     @staticmethod
     def fromFile(path: str):
@@ -36,22 +47,155 @@ class TelloSwarm:
         return TelloSwarm.fromIps(ips)
 
     @staticmethod
-    def fromIps(ips: list):
+    def fromIps(ips: list, transport=None):
         """IP 주소 목록에서 TelloSwarm을 생성합니다.
         Create TelloSwarm from a list of IP addresses.
 
         Arguments:
             ips: IP 주소 목록 / list of IP Addresses
+            transport: 드론들이 함께 사용할 TelloTransport 또는 SwarmTransport (None이면 전역 소켓) /
+                shared TelloTransport or SwarmTransport (None uses the global sockets)
         """
         if not ips:
             raise TelloException("No ips provided")
 
         tellos = []
         for ip in ips:
-            tellos.append(Tello(ip.strip()))
+            tellos.append(Tello(ip.strip(), transport=transport))
 
         return TelloSwarm(tellos)
 
+    @staticmethod
+    def discover(subnet: str, timeout: Union[int, float] = DISCOVERY_TIMEOUT, expected: Optional[int] = None,
+                 transport=None, wait_for_state: bool = True):
+        """서브넷의 모든 주소에 `command`를 한 번에 보내 응답한 드론으로 TelloSwarm을 만듭니다.
+        소켓 하나에서 브로드캐스트와 각 주소로의 유니캐스트를 연달아 보내고, 응답한 드론에는
+        곧바로 `sn?`과 `sdk?`를 보내므로 드론 수와 관계없이 대략 한 번의 응답 대기 시간
+        안에 끝납니다. 반환된 드론은 이미 SDK 모드이므로 connect()를 다시 호출할 필요가 없습니다.
+        Create a TelloSwarm from every drone answering `command` in a subnet. Broadcast
+        and unicast datagrams to every address are sent back-to-back from one socket and
+        responders are asked `sn?` and `sdk?` right away, so bringing up many drones
+        takes about one round trip instead of one handshake per drone. The returned
+        drones are already in SDK mode, no need to call connect() again.
+
+        ```python
+        swarm = TelloSwarm.discover('192.168.0.0/24', expected=10)
+        print(swarm.serial_numbers)
+        swarm.takeoff()
+        ```
+
+        Arguments:
+            subnet: 검색할 네트워크 (예: '192.168.0.0/24') / network to scan
+            timeout: 응답을 기다리는 최대 시간(초) / seconds to wait for answers
+            expected: 이 수만큼 찾으면 timeout 전에 끝냅니다 / stop early once this many drones answered
+            transport: 드론들이 함께 사용할 TelloTransport 또는 SwarmTransport (None이면 전역 소켓) /
+                shared TelloTransport or SwarmTransport (None uses the global sockets)
+            wait_for_state: 모든 드론의 첫 상태 패킷을 기다릴지 여부 / wait for the first state packets
+        """
+        network = ipaddress.ip_network(subnet, strict=False)
+        hosts = [str(host) for host in network.hosts()]
+        found = TelloSwarm.scan(hosts, str(network.broadcast_address), timeout, expected)
+        if not found:
+            raise TelloException("No Tello answered in {} within {} seconds".format(subnet, timeout))
+
+        tellos = [Tello(host, transport=transport) for host in found]
+        swarm = TelloSwarm(tellos)
+        swarm.serial_numbers = [found[host].get('sn?') for host in found]
+        swarm.sdk_versions = [found[host].get('sdk?') for host in found]
+
+        if transport is not None and transport.state_port != Tello.STATE_UDP_PORT:
+            # 전용 상태 포트로 상태 패킷을 보내도록 설정 (connect()와 같음)
+            futures = [tello.send_control_command_async('port {} {}'.format(transport.state_port, tello.vs_udp_port))
+                       for tello in tellos]
+            for future in futures:
+                future.result()
+
+        if wait_for_state:
+            deadline = time.monotonic() + TelloSwarm.STATE_WAIT_TIMEOUT
+            while not all(tello.get_current_state() for tello in tellos):
+                if time.monotonic() > deadline:
+                    missing = [tello.address[0] for tello in tellos if not tello.get_current_state()]
+                    raise TelloException("Did not receive a state packet from {}".format(', '.join(missing)))
+                time.sleep(0.01)
+
+        return swarm
+
+    @staticmethod
+    def scan(hosts: List[str], broadcast: Optional[str], timeout: Union[int, float],
+             expected: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+        """hosts에 `command`를 보내고 응답한 드론의 `sn?`, `sdk?` 응답을 모읍니다.
+        드론마다 다음에 받을 응답(command → sn? → sdk?)을 기억하는 작은 상태 기계로
+        소켓 하나에서 모든 드론을 동시에 처리합니다. IP 순서의 {주소: {질의: 응답}}을 반환합니다.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        queries = ('command', 'sn?', 'sdk?')
+        stages: Dict[str, int] = {}  # 주소 -> 보낸 질의의 위치 (queries 기준)
+        answers: Dict[str, Dict[str, str]] = {}
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.setblocking(False)
+        sock.bind(("", 0))
+
+        def send(host, query):
+            try:
+                sock.sendto(query.encode('utf-8'), (host, Tello.CONTROL_UDP_PORT))
+            except OSError as e:
+                # 브로드캐스트가 허용되지 않는 네트워크 등
+                Tello.LOGGER.debug("Discovery send to {} failed: {}".format(host, e))
+
+        def finished():
+            return sum(1 for stage in stages.values() if stage == len(queries)) >= expected
+
+        deadline = time.monotonic() + timeout
+        next_resend = 0.0
+        try:
+            while expected is None or not finished():
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+
+                if now >= next_resend:
+                    # 응답이 없는 주소와 답을 기다리는 질의를 (다시) 보냅니다
+                    if broadcast is not None:
+                        send(broadcast, 'command')
+                    for host in hosts:
+                        if host not in stages:
+                            send(host, 'command')
+                    for host, stage in stages.items():
+                        if stage < len(queries):
+                            send(host, queries[stage])
+                    next_resend = now + TelloSwarm.DISCOVERY_RESEND_INTERVAL
+
+                readable, _, _ = select.select([sock], [], [], min(deadline, next_resend) - now)
+                while readable:
+                    try:
+                        data, address = sock.recvfrom(1024)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except OSError:
+                        continue  # ICMP port unreachable 등
+
+                    host = address[0]
+                    response = data.decode('utf-8', errors='replace').strip()
+                    if host not in stages:
+                        if response.lower() != 'ok':
+                            continue
+                        stages[host] = 1
+                        answers[host] = {}
+                        send(host, queries[1])
+                    elif stages[host] < len(queries):
+                        if response.lower() == 'ok':
+                            continue  # 브로드캐스트와 유니캐스트 양쪽에 대한 중복 응답
+                        answers[host][queries[stages[host]]] = response
+                        stages[host] += 1
+                        if stages[host] < len(queries):
+                            send(host, queries[stages[host]])
+        finally:
+            sock.close()
+
+        return {host: answers[host] for host in sorted(answers, key=ipaddress.ip_address)}
+
     def __init__(self, tellos: List[Tello]):
         """TelloSwarm 인스턴스를 초기화합니다.
         Initialize a TelloSwarm instance
@@ -60,25 +204,19 @@ class TelloSwarm:
             tellos: [Tello][tello] 인스턴스 목록 / list of [Tello][tello] instances
         """
         self.tellos = tellos
+        self.serial_numbers = [None] * len(tellos)
+        self.sdk_versions = [None] * len(tellos)
         self.barrier = Barrier(len(tellos))
-        self.funcBarrier = Barrier(len(tellos) + 1)
-        self.funcQueues = [Queue() for tello in tellos]
-
-        def worker(i):
-            queue = self.funcQueues[i]
-            tello = self.tellos[i]
-
-            while True:
-                func = queue.get()
-                self.funcBarrier.wait()
-                func(i, tello)
-                self.funcBarrier.wait()
-
-        self.threads = []
-        for i, _ in enumerate(tellos):
-            thread = Thread(target=worker, daemon=True, args=(i,))
-            thread.start()
-            self.threads.append(thread)
+        # 작업 스레드마다 자신이 속한 parallel() 호출의 배리어 (sync()가 사용)
+        self.worker_state = local()
+        self.executor = self.create_executor()
+
+    def create_executor(self) -> ThreadPoolExecutor:
+        """드론마다 동시에 하나씩 실행되어야 sync()가 가능하므로 드론 수만큼의 스레드를
+        두고, parallel() 호출 사이에 재사용합니다.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        return ThreadPoolExecutor(max_workers=max(len(self.tellos), 1), thread_name_prefix='TelloSwarm')
 
     def sequential(self, func: Callable[[int, Tello], None]):
         """각 Tello에 대해 순차적으로 `func`를 호출합니다. 함수는 두 개의 인자를 받습니다:
@@ -95,26 +233,219 @@ class TelloSwarm:
         for i, tello in enumerate(self.tellos):
             func(i, tello)
 
-    def parallel(self, func: Callable[[int, Tello], None]):
+    def parallel(self, func: Callable[[int, Tello], Any], timeout: Optional[Union[int, float]] = None) -> List:
         """각 Tello에 대해 병렬로 `func`를 호출합니다. 함수는 두 개의 인자를 받습니다:
         현재 드론의 인덱스 `i`와 현재 [Tello][tello] 인스턴스 `tello`.
         Call `func` for each tello in parallel. The function retrieves
         two arguments: The index `i` of the current drone and `tello` the
         current [Tello][tello] instance.
 
+        드론 순서대로 각 드론의 반환값을 담은 목록을 반환합니다. 함수가 예외를 던진
+        드론은 그 예외 객체가, timeout 안에 끝나지 않은 드론은 TelloException이 들어갑니다.
+        한 드론이 실패하면 `swarm.sync()`에서 기다리던 다른 드론은 BrokenBarrierError로
+        깨어나므로 교착 상태가 되지 않습니다.
+        Returns a list with the return value of each drone, in drone order. Drones
+        whose function raised get the exception instance, drones that did not finish
+        within `timeout` get a TelloException. When one drone fails, the others
+        waiting in `swarm.sync()` are released with a BrokenBarrierError instead of
+        deadlocking.
+
         스레드 간 동기화를 위해 `swarm.sync()`를 사용할 수 있습니다.
         You can use `swarm.sync()` for syncing between threads.
 
         ```python
-        swarm.parallel(lambda i, tello: tello.move_up(50 + i * 10))
+        results = swarm.parallel(lambda i, tello: tello.move_up(50 + i * 10), timeout=10)
+        failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
         ```
+
+        Arguments:
+            func: 각 드론에서 실행할 함수 / function to run for each drone
+            timeout: 최대 대기 시간(초), None이면 무제한 / seconds to wait, None waits forever
+        """
+        # 호출마다 새 배리어를 사용하므로 이전 호출에서 남은 작업이 이번 호출의 sync()에 끼어들지 않습니다
+        barrier = self.barrier = Barrier(len(self.tellos))
+        futures = [self.executor.submit(self.run_worker, func, i, tello, barrier)
+                   for i, tello in enumerate(self.tellos)]
+        _, not_done = wait(futures, timeout)
+        if not_done:
+            # 남은 드론이 sync()에서 영원히 기다리지 않도록 합니다
+            barrier.abort()
+            # 끝나지 않은 작업이 스레드를 계속 붙잡고 있으므로, 다음 호출은 새 스레드 풀에서
+            # 드론마다 스레드를 하나씩 받도록 합니다
+            self.executor.shutdown(wait=False)
+            self.executor = self.create_executor()
+
+        results = []
+        for i, future in enumerate(futures):
+            if future in not_done:
+                results.append(TelloException("Drone {} ({}) did not finish within {} seconds"
+                                              .format(i, self.tellos[i].address[0], timeout)))
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+        return results
+
+    def run_worker(self, func: Callable[[int, Tello], Any], i: int, tello: Tello, barrier: Barrier):
+        """parallel()에서 드론 하나의 함수를 실행합니다. 실패하면 배리어를 깨뜨립니다.
+        Internal method, you normally wouldn't call this yourself.
         """
+        self.worker_state.barrier = barrier
+        try:
+            return func(i, tello)
+        except Exception as e:
+            Tello.LOGGER.error("Drone {} ({}) failed: {}".format(i, tello.address[0], e))
+            barrier.abort()
+            raise
+        finally:
+            self.worker_state.barrier = None
+
+    def send_all(self, command: str, timeout: Optional[Union[int, float]] = None) -> List:
+        """모든 드론에 제어 명령을 보내고 응답을 기다립니다. parallel()과 달리 드론마다
+        스레드를 쓰지 않고 Future로 기다리므로, SwarmTransport와 함께 사용하면 드론이
+        많아도 스레드가 늘지 않습니다. 드론 순서대로 True 또는 발생한 예외를 반환합니다.
+        Send a control command to every drone and wait for the responses. Unlike
+        parallel() no thread per drone is used, so together with a SwarmTransport
+        large swarms need no extra threads. Returns True or the raised exception
+        for each drone, in drone order.
+
+        ```python
+        results = swarm.send_all('takeoff')
+        ```
 
-        for queue in self.funcQueues:
-            queue.put(func)
+        Arguments:
+            command: 보낼 명령 / command to send
+            timeout: 명령 하나의 응답 대기 시간(초), None이면 명령 종류별 기본값 /
+                per-attempt response timeout, None uses the default of the command class
+        """
+        futures = [tello.send_control_command_async(command, timeout) for tello in self.tellos]
+        wait(futures)
+        return [future.exception() or future.result() for future in futures]
+
+    def broadcast(self, command: str, timeout: Optional[Union[int, float]] = None) -> 'BroadcastResult':
+        """모든 드론에 같은 명령을 한 스레드에서 연달아 보냅니다. 드론별 데이터그램을 미리
+        인코딩해 두고 모든 드론의 스케줄러가 준비되면 한 번에 보내므로, 스레드 스케줄링에
+        따라 수십 ms씩 벌어지는 parallel()과 달리 전송 시각의 차이가 매우 작습니다.
+        전송 직후 BroadcastResult를 반환합니다. `swarm.at(t).send(command)`와 같습니다.
+        Send the same command to every drone back-to-back from one thread. The
+        datagrams are encoded up front and sent once every drone's scheduler is ready,
+        so unlike parallel() the send times are not skewed by thread scheduling.
+        Returns a BroadcastResult right after sending. Same as `swarm.at(t).send(command)`.
 
-        self.funcBarrier.wait()
-        self.funcBarrier.wait()
+        ```python
+        result = swarm.broadcast('flip f')
+        print('skew: {:.3f} ms'.format(result.skew * 1e3))
+        print(result.results())
+        ```
+        """
+        return self.at(None).send(command, timeout)
+
+    def at(self, t: Optional[Union[int, float]]) -> 'ScheduledBroadcast':
+        """time.monotonic() 기준 시각 t에 보낼 브로드캐스트를 만듭니다 (None이면 즉시).
+        Prepare a broadcast sent at time.monotonic() timestamp t (None sends right away).
+
+        ```python
+        start = time.monotonic() + 1.0
+        swarm.at(start).send('takeoff')
+        swarm.at(start + 8.0).send('flip f')
+        ```
+        """
+        return ScheduledBroadcast(self, t)
+
+    def perform(self, choreography, start_at: Optional[Union[int, float]] = None,
+                land_on_error: bool = True, check_battery: bool = True) -> 'ChoreographyResult':
+        """안무(Choreography)를 검증하고 실행합니다. 드론의 현재 배터리 잔량으로 배터리 소모량을
+        검사하며, 문제가 있거나 배터리 잔량을 모르는 드론이 있으면 아무것도 보내지 않고
+        TelloException을 던집니다. 실행 중에는
+        한 스레드가 드론마다 다음 단계를 제시간에 보내므로 단계마다 sync()로 기다리지 않습니다.
+        Validate and run a Choreography. The battery budget is checked against the
+        drones' current battery levels, and nothing is sent when validation fails or
+        a drone has not reported its battery yet.
+        One thread then dispatches every drone's next step on time, with no
+        per-step barrier like sync().
+
+        ```python
+        show = Choreography(len(swarm))
+        show.add_all(0, 'takeoff')
+        show.add(0, 3, 'flip f').add(1, 3, 'cw 90')
+        show.add_all(6, 'land')
+        result = swarm.perform(show)
+        print(result.completed, result.lateness.max())
+        ```
+
+        Arguments:
+            choreography: Choreography 또는 이미 컴파일된 CompiledChoreography / the show to run
+            start_at: 시작 시각 (time.monotonic() 기준, None이면 곧바로) / start time, None starts shortly
+            land_on_error: 단계가 실패하면 안무를 멈추고 착륙합니다 / stop and land when a step fails
+            check_battery: False이면 배터리 검사를 건너뜁니다 / skip the battery budget check when False
+        Returns:
+            ChoreographyResult
+        """
+        # choreography 모듈은 numpy를 사용하므로 여기서 import 합니다
+        from .choreography import Choreography
+
+        if isinstance(choreography, Choreography):
+            battery = None
+            if check_battery:
+                battery = [tello.get_current_state().get('bat') for tello in self.tellos]
+                unknown = [i for i, level in enumerate(battery) if level is None]
+                if unknown:
+                    raise TelloException('Battery level of drone(s) {} is unknown (no state packet yet); '
+                                         'connect() first or pass check_battery=False'.format(unknown))
+            else:
+                Tello.LOGGER.info('Choreography: battery budget is not checked')
+            choreography = choreography.compile(battery)
+        return choreography.perform(self, start_at, land_on_error)
+
+    def get_state_matrix(self) -> 'SwarmStateMatrix':
+        """스웜의 상태 행렬을 가져옵니다. 처음 호출할 때 만들어지며, 그 뒤로는 각 드론의
+        상태 수신 스레드가 패킷마다 자기 행을 갱신합니다.
+        Get the state matrix of the swarm, creating it on first use. From then on the
+        state receiver updates the drone's row on every state packet.
+
+        Returns:
+            SwarmStateMatrix
+        """
+        if self.state_aggregate is None:
+            # swarm_state 모듈은 numpy를 사용하므로 여기서 import 합니다
+            from .swarm_state import SwarmStateMatrix
+            self.state_aggregate = SwarmStateMatrix(self.tellos)
+        return self.state_aggregate
+
+    def state_matrix(self, fields: Optional[Sequence[str]] = None) -> Tuple['np.ndarray', 'np.ndarray']:
+        """모든 드론의 최신 상태를 (드론 수, 필드 수) NumPy 배열로, 마지막 상태 패킷 이후
+        경과 시간(초)을 드론별 배열로 반환합니다. 값이 없으면 nan, 받은 적이 없으면 경과 시간이 inf입니다.
+        Return the latest state of every drone as an (n_drones, n_fields) NumPy array
+        and the seconds since each drone's last state packet. Missing values are nan,
+        drones that never sent state have an age of inf.
+
+        ```python
+        values, ages = swarm.state_matrix(('bat', 'h'))
+        print(values[:, 0].min(), ages.max())
+        ```
+
+        Arguments:
+            fields: 열로 사용할 상태 필드 (None이면 전체) / state fields to use as columns (None for all)
+        """
+        return self.get_state_matrix().snapshot(fields)
+
+    def min_battery(self) -> float:
+        """스웜에서 가장 낮은 배터리 잔량 (%).
+        Lowest battery level in the swarm (%).
+        """
+        return self.get_state_matrix().min_battery()
+
+    def any_stale(self, max_age: Union[int, float]) -> bool:
+        """max_age초 넘게 상태 패킷이 오지 않은 드론이 있는지 확인합니다.
+        Check whether any drone sent no state packet for more than max_age seconds.
+        """
+        return self.get_state_matrix().any_stale(max_age)
+
+    def centroid(self) -> 'np.ndarray':
+        """미션 패드를 인식한 드론들의 평균 위치 (x, y, z; cm).
+        Mean mission pad position (x, y, z; cm) of the drones that detect a pad.
+        """
+        return self.get_state_matrix().centroid()
 
     def sync(self, timeout: float = None):
         """병렬 Tello 스레드를 동기화합니다. 모든 스레드가 `swarm.sync`를 호출할 때까지
@@ -136,11 +467,17 @@ class TelloSwarm:
         swarm.parallel(doStuff)
         ```
         """
-        return self.barrier.wait(timeout)
+        barrier = getattr(self.worker_state, 'barrier', None) or self.barrier
+        return barrier.wait(timeout)
 
     def __getattr__(self, attr):
         """모든 Tello에서 표준 Tello 함수를 병렬로 호출합니다.
         Call a standard tello function in parallel on all tellos.
+        드론별 반환값 목록을 반환하며, 한 드론이라도 실패하면 실패한 드론 번호를 담은
+        TelloException을 던집니다. 드론별 예외를 직접 다루려면 parallel()을 사용하세요.
+        Returns the per-drone return values. If any drone fails, a TelloException
+        listing the failed drones is raised; use parallel() to handle the per-drone
+        exceptions yourself.
 
         ```python
         swarm.command()
@@ -149,10 +486,26 @@ class TelloSwarm:
         ```
         """
         def callAll(*args, **kwargs):
-            self.parallel(lambda i, tello: getattr(tello, attr)(*args, **kwargs))
+            results = self.parallel(lambda i, tello: getattr(tello, attr)(*args, **kwargs))
+            failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+            if failed:
+                # 한 드론이 이륙하지 못했는데 다음 명령을 계속 보내지 않도록 합니다
+                first = results[failed[0]]
+                raise TelloException("'{}' failed on drone(s) {}: {}".format(attr, failed, first)) from first
+            return results
 
         return callAll
 
+    def end(self):
+        """모든 Tello의 연결을 종료하고 스웜의 스레드를 정리합니다.
+        Call end on all tellos and release the swarm's worker threads.
+        """
+        if self.state_aggregate is not None:
+            self.state_aggregate.close()
+            self.state_aggregate = None
+        self.parallel(lambda i, tello: tello.end())
+        self.executor.shutdown(wait=False)
+
     def __iter__(self):
         """스웜의 모든 드론을 반복합니다.
         Iterate over all drones in the swarm.
@@ -173,3 +526,127 @@ class TelloSwarm:
         ```
         """
         return len(self.tellos)
+
+
+
+class ScheduledBroadcast:
+    """
+    TelloSwarm.at(t)가 반환하는 예약 브로드캐스트.
+    A broadcast scheduled by TelloSwarm.at(t).
+    """
+
+    SPIN_TIME = 0.002  # 전송 시각 직전 이 시간 동안은 sleep 대신 바쁜 대기로 정확히 맞춥니다 (초)
+
+    def __init__(self, swarm: TelloSwarm, at: Optional[float]):
+        self.swarm = swarm
+        self.at = at
+
+    def send(self, command: str, timeout: Optional[Union[int, float]] = None) -> 'BroadcastResult':
+        """모든 드론이 준비되면 (그리고 예약 시각이 되면) 명령을 연달아 보냅니다.
+        드론마다 진행 중인 명령이 끝나기를 최대 BROADCAST_READY_TIMEOUT초 기다리며,
+        그 안에 준비되지 않으면 아무것도 보내지 않고 TelloException을 던집니다.
+        Wait until every drone is ready (and the scheduled time is reached), then send
+        the command back-to-back. Drones get up to BROADCAST_READY_TIMEOUT seconds to
+        finish their in-flight commands, otherwise nothing is sent and a
+        TelloException is raised.
+
+        Arguments:
+            command: 보낼 명령 / command to send
+            timeout: 전송 후 응답 대기 시간(초), None이면 명령 종류별 기본값 /
+                response timeout after sending, None uses the default of the command class
+        """
+        tellos = self.swarm.tellos
+        gate = BroadcastGate(len(tellos), self.at)
+
+        # 전송 루프에서는 미리 찾아 둔 메서드와 인코딩된 데이터그램만 사용합니다
+        payload = command.encode('utf-8')
+        datagrams = [(tello.get_control_socket().sendto, tello.address) for tello in tellos]
+        futures = [tello.get_command_scheduler().submit(command, timeout, gate) for tello in tellos]
+
+        ready_timeout = TelloSwarm.BROADCAST_READY_TIMEOUT
+        if self.at is not None:
+            ready_timeout = max(ready_timeout, self.at - time.monotonic())
+        if not gate.wait_ready(ready_timeout):
+            busy = [tello.address[0] for tello, future in zip(tellos, futures) if not future.running()]
+            error = TelloException("Broadcast of '{}' aborted, drones not ready: {}".format(command, ', '.join(busy)))
+            gate.abort(error)
+            raise error
+
+        if self.at is not None:
+            delay = self.at - time.monotonic() - ScheduledBroadcast.SPIN_TIME
+            if delay > 0:
+                time.sleep(delay)
+            while time.monotonic() < self.at:
+                pass
+
+        send_times = []
+        try:
+            for sendto, address in datagrams:
+                sendto(payload, address)
+                send_times.append(time.monotonic())
+        finally:
+            gate.open()
+
+        result = BroadcastResult(command, futures, send_times, self.at)
+        Tello.LOGGER.info("Broadcast '{}' to {} drones, skew {:.3f} ms".format(command, len(tellos),
+                                                                               result.skew * 1e3))
+        return result
+
+
+class BroadcastResult:
+    """
+    브로드캐스트의 전송 시각과 드론별 응답.
+    Send times and per-drone responses of a broadcast.
+
+    Attributes:
+        command: 보낸 명령 / the command sent
+        futures: 드론별 응답 Future (응답 문자열, 타임아웃이면 None) / per-drone response futures
+        send_times: 드론별 sendto 완료 시각 (time.monotonic()) / per-drone send completion times
+        scheduled_at: 예약 시각 (없으면 None) / the scheduled time, if any
+    """
+
+    def __init__(self, command: str, futures: List[Future], send_times: List[float], scheduled_at: Optional[float]):
+        self.command = command
+        self.futures = futures
+        self.send_times = send_times
+        self.scheduled_at = scheduled_at
+
+    @property
+    def skew(self) -> float:
+        """첫 전송과 마지막 전송 사이의 시간 (초)
+        Time between the first and the last send (seconds)
+        """
+        return self.send_times[-1] - self.send_times[0] if self.send_times else 0.0
+
+    @property
+    def lateness(self) -> float:
+        """예약 시각보다 첫 전송이 늦은 시간 (초, 예약이 없으면 0)
+        How late the first send was compared to the scheduled time (seconds, 0 when not scheduled)
+        """
+        if self.scheduled_at is None or not self.send_times:
+            return 0.0
+        return self.send_times[0] - self.scheduled_at
+
+    def results(self, timeout: Optional[float] = None) -> List:
+        """응답을 기다려 드론 순서대로 반환합니다. 'ok'는 True, 읽기 명령은 응답 문자열,
+        응답이 없거나 실패하면 TelloException입니다.
+        Wait for the responses and return them in drone order: True for 'ok', the
+        response text for read commands, a TelloException on timeout or failure.
+        """
+        wait(self.futures, timeout)
+        results = []
+        for future in self.futures:
+            if not future.done():
+                results.append(TelloException("No response to '{}' yet".format(self.command)))
+            elif future.cancelled():
+                results.append(TelloException("'{}' was cancelled by '{}'".format(self.command, future.cancelled_by)))
+            elif future.exception() is not None:
+                results.append(future.exception())
+            elif future.result() is None:
+                results.append(TelloException("No response to '{}' within {} seconds"
+                                              .format(self.command, future.timeout)))
+            elif 'ok' in future.result().lower():
+                results.append(True)
+            else:
+                results.append(future.result())
+        return results
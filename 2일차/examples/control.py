@@ -158,21 +158,29 @@ class TelloController:
 
     def _stream_loop(self):
         """비디오 스트리밍 루프"""
+        last_seq = 0
         while self.is_streaming:
-            if self.frame_reader:
-                frame = self.frame_reader.frame
-                if frame is not None:
-                    frame = cv2.resize(frame, (640, 480))
-                    if self.frame_queue.full():
-                        try:
-                            self.frame_queue.get_nowait()
-                        except:
-                            pass
-                    try:
-                        self.frame_queue.put_nowait(frame.copy())
-                    except:
-                        pass
-            time.sleep(0.03)
+            if not self.frame_reader:
+                time.sleep(0.1)
+                continue
+
+            # 새 프레임이 디코딩될 때까지 대기 (이미 처리한 프레임은 건너뜀)
+            item = self.frame_reader.wait_for_latest(last_seq, timeout=0.5)
+            if item is None:
+                continue
+            last_seq = item.sequence
+
+            # resize가 새 배열을 만들므로 별도의 copy()는 필요 없음
+            frame = cv2.resize(item.frame, (640, 480))
+            if self.frame_queue.full():
+                try:
+                    self.frame_queue.get_nowait()
+                except:
+                    pass
+            try:
+                self.frame_queue.put_nowait(frame)
+            except:
+                pass
 
     def get_frame(self):
         """현재 프레임 반환"""
@@ -50,6 +50,9 @@ class FrontEnd(object):
         self.tello.connect()
         self.tello.set_speed(self.speed)
 
+        # Send RC values at a fixed 20 Hz; update() below only refreshes the latest values.
+        self.tello.get_rc_streamer(rate=20)
+
         # In case streaming is on. This happens when we quit this program without the escape key.
         self.tello.streamoff()
         self.tello.streamon()
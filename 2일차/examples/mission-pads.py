@@ -10,13 +10,23 @@ tello.connect()
 tello.enable_mission_pads()
 tello.set_mission_pad_detection_direction(1)  # forward detection only
 
-tello.takeoff()
+# 배터리가 부족해지면 알림
+# Warn when the battery runs low
+tello.on_low_battery(20, lambda state: print("Battery low: {}%".format(state.bat)))
 
-pad = tello.get_mission_pad_id()
+tello.takeoff()
 
 # detect and react to pads until we see pad #1
 # Detect and react to mission pads until we see pad #1
-while pad != 1:
+# wait_until은 상태 패킷이 올 때마다 깨어나므로 CPU를 점유하지 않습니다
+# wait_until wakes up on each state packet instead of busy-polling the getter
+while True:
+    state = tello.wait_until(lambda s: s.mid in (1, 3, 4))
+    pad = state.mid
+
+    if pad == 1:
+        break
+
     if pad == 3:
         tello.move_back(30)
         tello.rotate_clockwise(90)
@@ -25,8 +35,6 @@ while pad != 1:
         tello.move_up(30)
         tello.flip_forward()
 
-    pad = tello.get_mission_pad_id()
-
 # graceful termination
 # Safe program termination
 tello.disable_mission_pads()
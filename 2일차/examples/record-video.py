@@ -1,38 +1,24 @@
-import time, cv2
-from threading import Thread
 from djitellopy import Tello
 
 tello = Tello()
 
 tello.connect()
 
-keepRecording = True
 tello.streamon()
-frame_read = tello.get_frame_read()
 
-def videoRecorder():
-    # create a VideoWrite object, recoring to ./video.avi
-    # create a VideoWrite object to store video frames in ./video.avi
-    height, width, _ = frame_read.frame.shape
-    video = cv2.VideoWriter('video.avi', cv2.VideoWriter_fourcc(*'XVID'), 30, (width, height))
+# we only record, so the video is not decoded at all
+# 녹화만 하므로 영상을 디코딩하지 않습니다
+frame_read = tello.get_frame_read(decode=False)
 
-    while keepRecording:
-        video.write(frame_read.frame)
-        time.sleep(1 / 30)
-
-    video.release()
-
-# we need to run the recorder in a seperate thread, otherwise blocking options
-#  would prevent frames from getting added to the video
-# we need to record video frames in a separate thread, otherwise blocking operations
-# would prevent frames from being recorded
-recorder = Thread(target=videoRecorder)
-recorder.start()
+# store the received H.264 packets in ./video.mp4 without re-encoding,
+#  which costs almost no CPU and keeps the original quality
+# 수신한 H.264 패킷을 재인코딩 없이 ./video.mp4에 저장합니다
+# CPU를 거의 사용하지 않으며 원본 화질이 유지됩니다
+frame_read.start_recording('video.mp4')
 
 tello.takeoff()
 tello.move_up(100)
 tello.rotate_counter_clockwise(360)
 tello.land()
 
-keepRecording = False
-recorder.join()
+frame_read.stop_recording()
@@ -1,9 +1,7 @@
 from flask import Flask, render_template, Response, jsonify, request, send_from_directory
 import cv2
-import threading
-from queue import Queue
 import os
-from djitellopy import Tello
+from djitellopy import Tello, FrameHub
 import time
 from datetime import datetime
 import numpy as np
@@ -30,8 +28,8 @@ class TelloController:
         self.tello = Tello()
         self.frame_reader = None
         self.is_streaming = False
-        self.frame_queue = Queue(maxsize=10)
-        self.stream_thread = None
+        self.frame_hub = None
+        self.mjpeg_frames = None  # MJPEG 스트림용 구독 (가장 최근 프레임만 유지)
         self.is_flying = False  # 이륙 상태 추적
         pygame.mixer.init()
 
@@ -61,18 +59,14 @@ class TelloController:
         """비디오 스트리밍 중지"""
         print("비디오 스트림 정지 중...")
         self.is_streaming = False
-        if self.stream_thread:
-            self.stream_thread.join(timeout=2)
+        if self.frame_hub:
+            self.frame_hub.stop()
+            self.frame_hub = None
+            self.mjpeg_frames = None
         try:
             self.tello.streamoff()
         except:
             pass
-        # 큐 비우기
-        while not self.frame_queue.empty():
-            try:
-                self.frame_queue.get_nowait()
-            except:
-                pass
 
     def start_video_stream(self):
         """비디오 스트리밍 시작"""
@@ -82,31 +76,11 @@ class TelloController:
             self.frame_reader = self.tello.get_frame_read()
             self.is_streaming = True
             
-            self.stream_thread = threading.Thread(target=self._stream_loop)
-            self.stream_thread.daemon = True
-            self.stream_thread.start()
+            self.frame_hub = FrameHub(self.frame_reader)
+            self.mjpeg_frames = self.frame_hub.subscribe('mjpeg', FrameHub.LATEST)
+            self.frame_hub.start()
             print("비디오 스트리밍 시작됨")
 
-    def _stream_loop(self):
-        """비디오 스트리밍 루프"""
-        while self.is_streaming:
-            if self.frame_reader:
-                frame = self.frame_reader.frame
-                if frame is not None:
-                    frame = cv2.resize(frame, (640, 480))
-                    
-                    if self.frame_queue.full():
-                        try:
-                            self.frame_queue.get_nowait()
-                        except:
-                            pass
-                    
-                    try:
-                        self.frame_queue.put_nowait(frame.copy())
-                    except:
-                        pass
-            time.sleep(0.03)
-
     def take_photo(self):
         """사진 촬영"""
         if not os.path.exists('photos'):
@@ -272,8 +246,13 @@ controller = None
 def get_frame():
     """프레임 스트리밍을 위한 제너레이터 함수"""
     while True:
-        if controller and not controller.frame_queue.empty():
-            frame = controller.frame_queue.get()
+        subscription = controller.mjpeg_frames if controller else None
+        if subscription:
+            # 새 프레임이 올 때까지 대기 (FrameHub가 공유 참조로 전달)
+            item = subscription.get(timeout=0.5)
+            if item is None:
+                continue
+            frame = cv2.resize(item.frame, (640, 480))
             _, buffer = cv2.imencode('.jpg', frame)
             frame_bytes = buffer.tobytes()
             yield (b'--frame\r\n'
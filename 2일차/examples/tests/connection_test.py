@@ -1,38 +1,15 @@
-from djitellopy import Tello
-import time
-import socket
-import os
-
-def cleanup_port(port):
-    try:
-        # Create a test socket
-        temp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        temp_socket.bind(('', port))
-        temp_socket.close()
-        return True
-    except:
-        # Port is in use, try to force close it
-        try:
-            os.system(f'kill -9 $(lsof -t -i:{port})')
-            time.sleep(1)
-            return True
-        except:
-            return False
+from djitellopy import Tello, TelloTransport
 
 def test_drone_connection():
     print("드론 연결 테스트를 시작합니다...")
     
-    # Clean up the Tello ports before connecting
-    print("1. 포트 정리 중...")
-    if cleanup_port(8889):
-        print("✓ 포트 8889 정리 완료")
-    else:
-        print("❌ 포트 8889를 정리할 수 없습니다")
-        print("컴퓨터를 재시작해주세요")
-        return False
+    # 전용 소켓(임시 제어 포트 + 임시 상태 포트)을 사용하므로
+    # 다른 프로세스가 8889/8890 포트를 사용 중이어도 연결할 수 있습니다
+    print("1. 전용 소켓 준비 중...")
+    transport = TelloTransport()
+    print(f"✓ 상태 포트 {transport.state_port} 준비 완료")
     
-    time.sleep(1)
-    tello = Tello()
+    tello = Tello(transport=transport)
     
     try:
         print("\n2. 드론에 연결 시도 중...")
@@ -59,6 +36,7 @@ def test_drone_connection():
         
     finally:
         tello.end()
+        transport.close()
 
 if __name__ == "__main__":
     test_drone_connection() 
\ No newline at end of file
@@ -9,7 +9,7 @@ long_description = long_description.replace("](examples/", "]({}/examples/".form
 
 setuptools.setup(
     name='djitellopy',
-    packages=['djitellopy'],
+    packages=['djitellopy', 'djitellopy.sim'],
     version='2.5.0',
     license='MIT',
     description='Tello drone library including support for video streaming, swarms, state packets and more',
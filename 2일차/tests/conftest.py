@@ -0,0 +1,54 @@
+import ipaddress
+import itertools
+import logging
+
+import pytest
+
+from djitellopy import Tello, TelloTransport
+from djitellopy.sim import TelloSimulator
+
+# 테스트마다 다른 루프백 주소를 써서 앞선 테스트의 늦은 패킷과 섞이지 않게 합니다
+_hosts = (str(ipaddress.ip_address('127.0.1.1') + i) for i in itertools.count())
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    level = Tello.LOGGER.level
+    Tello.LOGGER.setLevel(logging.WARNING)
+    yield
+    Tello.LOGGER.setLevel(level)
+
+
+@pytest.fixture
+def simulator():
+    """TelloSimulator를 만들어 시작하는 함수. 테스트가 끝나면 모두 멈춥니다"""
+    simulators = []
+
+    def start(**kwargs):
+        kwargs.setdefault('time_scale', 0.05)
+        sim = TelloSimulator(next(_hosts), **kwargs).start()
+        simulators.append(sim)
+        return sim
+
+    yield start
+    for sim in simulators:
+        sim.stop()
+
+
+@pytest.fixture
+def tello(simulator):
+    """시뮬레이터에 연결된 Tello를 만드는 함수. 테스트가 끝나면 연결을 닫습니다"""
+    tellos = []
+
+    def connect(sim=None, **kwargs):
+        sim = sim or simulator()
+        transport = TelloTransport()
+        drone = Tello(sim.host, transport=transport, **kwargs)
+        tellos.append(drone)
+        drone.connect()
+        return drone
+
+    yield connect
+    for drone in tellos:
+        drone.end()
+        drone.transport.close()
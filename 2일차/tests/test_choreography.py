@@ -0,0 +1,128 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from djitellopy import Tello, TelloException, TelloSwarm, TelloTransport
+from djitellopy.choreography import Choreography
+
+
+@pytest.fixture
+def swarm(simulator):
+    simulators = [simulator() for _ in range(3)]
+    transport = TelloTransport()
+    swarm = TelloSwarm([Tello(sim.host, transport=transport) for sim in simulators])
+    yield swarm
+    swarm.end()
+    transport.close()
+
+
+def pair():
+    return Choreography(2, start_positions=[(0, 0, 0), (0, 200, 0)])
+
+
+def test_valid_show_compiles():
+    show = pair()
+    show.add_all(0, 'takeoff')
+    show.add(0, 4, 'up 50').add(1, 4, 'cw 90')
+    show.add_all(8, 'land')
+
+    report = show.validate(battery=[90, 90])
+    assert report.errors == []
+    compiled = show.compile([90, 90])
+    assert [len(track) for track in compiled.tracks] == [3, 3]
+
+
+def test_out_of_range_command():
+    show = pair()
+    show.add_all(0, 'takeoff')
+    show.add(0, 4, 'up 600')
+    show.add_all(10, 'land')
+    assert any('up 600' in error for error in show.validate().errors)
+
+
+def test_step_before_previous_maneuver_finishes():
+    show = pair()
+    show.add_all(0, 'takeoff')
+    show.add(0, 0.5, 'up 50')
+    show.add_all(8, 'land')
+    assert any('expected to finish' in error for error in show.validate().errors)
+
+
+def test_command_while_landed():
+    show = pair()
+    show.add(0, 0, 'forward 50')
+    assert any('not flying' in error for error in show.validate().errors)
+
+
+def test_drones_too_close():
+    show = Choreography(2, start_positions=[(0, 0, 0), (0, 200, 0)])
+    show.add_all(0, 'takeoff')
+    show.add(1, 4, 'right 200')
+    show.add_all(10, 'land')
+    assert any('come within' in error for error in show.validate().errors)
+
+
+def test_low_battery():
+    show = pair()
+    show.add_all(0, 'takeoff')
+    show.add_all(60, 'land')
+    assert show.validate(battery=[90, 90]).errors == []
+    assert any('battery' in error for error in show.validate(battery=[90, 10]).errors)
+
+
+def test_compile_raises_on_errors():
+    show = pair()
+    show.add(0, 0, 'flip x')
+    with pytest.raises(TelloException):
+        show.compile()
+
+
+def test_perform_refuses_unknown_battery(swarm):
+    show = Choreography(len(swarm), start_positions=[(0, 150 * i, 0) for i in range(len(swarm))])
+    show.add_all(0, 'takeoff')
+    show.add_all(4, 'land')
+    swarm.send_all('command')
+    with pytest.raises(TelloException, match='Battery level'):
+        swarm.perform(show)
+
+
+def test_perform(swarm):
+    show = Choreography(len(swarm), start_positions=[(0, 150 * i, 0) for i in range(len(swarm))])
+    show.add_all(0, 'takeoff')
+    show.add(0, 3, 'up 20').add(2, 3, 'cw 90')
+    show.add_all(5, 'land')
+    swarm.connect()
+
+    result = swarm.perform(show)
+    assert result.completed
+    assert len(result.sends) == 8
+    assert result.lateness.max() < 0.5
+
+
+def test_late_step_is_reported_once(simulator):
+    # 시뮬레이터가 계획보다 4배 느리게 움직여서 다음 단계의 관문이 제때 열리지 않습니다
+    simulators = [simulator(time_scale=4.0)]
+    transport = TelloTransport()
+    swarm = TelloSwarm([Tello(sim.host, transport=transport) for sim in simulators])
+    show = Choreography(1)
+    show.add(0, 0, 'takeoff')
+    show.add(0, 3, 'land')
+    try:
+        swarm.connect()
+        result = swarm.perform(show, land_on_error=False)
+    finally:
+        swarm.end()
+        transport.close()
+
+    assert [step.command for step, _ in result.failures] == ['land']
+    assert 'still busy' in str(result.failures[0][1])
+
+
+def test_choreography_does_not_import_the_simulator():
+    code = 'import sys, djitellopy.choreography; print("djitellopy.sim.simulator" in sys.modules)'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == 'False'
@@ -0,0 +1,31 @@
+import time
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_send_rc_control_accepts_floats(simulator, tello):
+    sim = simulator()
+    drone = tello(sim)
+    drone.takeoff()
+    drone.last_rc_control_timestamp = 0
+    drone.send_rc_control(10.7, 0, -20.2, 150.0)
+    assert wait_for(lambda: sim.model.rc == (10, 0, -20, 100))
+
+
+def test_rc_streamer_accepts_floats_and_stops_sticks(simulator, tello):
+    sim = simulator()
+    drone = tello(sim)
+    drone.takeoff()
+    drone.get_rc_streamer()
+    drone.send_rc_control(10.7, 0, -20.2, 150.0)
+    assert drone.rc_streamer.packet == b'rc 10 0 -20 100'
+    assert wait_for(lambda: sim.model.rc == (10, 0, -20, 100))
+
+    # 스트리머를 멈추면 마지막 스틱 값이 유지되지 않도록 정지 패킷을 보냅니다
+    drone.stop_rc_streamer()
+    assert wait_for(lambda: sim.model.rc == (0, 0, 0, 0))
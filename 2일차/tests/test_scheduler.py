@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from djitellopy import CommandScheduler, TelloException
+
+
+def test_lane_of():
+    assert CommandScheduler.lane_of('emergency') == CommandScheduler.SAFETY
+    assert CommandScheduler.lane_of('forward 50') == CommandScheduler.FLIGHT
+    assert CommandScheduler.lane_of('battery?') == CommandScheduler.QUERY
+    assert CommandScheduler.lane_of('speed 50') == CommandScheduler.CONFIG
+
+
+def test_lanes_are_served_by_priority(tello):
+    drone = tello()
+    drone.takeoff()
+    scheduler = drone.get_command_scheduler()
+    order = []
+
+    def submit(command):
+        scheduler.submit(command).add_internal_callback(lambda f: order.append(command))
+
+    submit('forward 50')
+    time.sleep(0.05)
+    # forward가 진행 중인 동안 쌓인 명령은 SAFETY > FLIGHT > QUERY > CONFIG 순서로 보내집니다
+    for command in ('speed 50', 'battery?', 'back 50', 'stop'):
+        submit(command)
+
+    deadline = time.monotonic() + 10
+    while len(order) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert order == ['forward 50', 'stop', 'back 50', 'battery?', 'speed 50']
+
+
+def test_land_cancels_queued_flight_commands(tello):
+    drone = tello()
+    drone.takeoff()
+    moving = drone.move_forward(100, wait=False)
+    queued = [drone.move_left(50, wait=False), drone.move_right(50, wait=False)]
+    drone.land()
+
+    # 진행 중인 명령은 취소되지 않고 드론의 응답(착륙으로 중단되면 오류)을 기다립니다
+    moving.exception(timeout=10)
+    for future in queued:
+        with pytest.raises((CancelledError, TelloException)):
+            future.result(timeout=10)
+    assert drone.get_command_scheduler().stats()['lanes']['flight']['cancelled'] >= 1
+
+
+def test_retry_does_not_outlive_land(simulator, tello):
+    sim = simulator()
+    drone = tello(sim)
+    drone.takeoff()
+    sim.loss = 1.0
+    future = drone.send_control_command_async('forward 50', timeout=0.2)
+    time.sleep(0.3)
+    # 재시도를 기다리는 동안 land가 오면 재시도는 다시 대기열에 들어가지 않습니다
+    sim.loss = 0.0
+    drone.land()
+    with pytest.raises(TelloException, match="cancelled by 'land'"):
+        future.result(timeout=10)
+    assert sim.model.x == 0
+
+
+def test_retry_after_lost_command(simulator, tello):
+    sim = simulator()
+    drone = tello(sim)
+    sim.loss = 1.0
+    future = drone.send_control_command_async('speed 50', timeout=0.2)
+    time.sleep(0.1)
+    sim.loss = 0.0
+    assert future.result(timeout=10) is True
+    assert sim.commands_dropped >= 1
+
+
+def test_rtt_excludes_command_pacing(simulator, tello):
+    drone = tello(simulator(latency=0.01))
+    for _ in range(5):
+        drone.query_battery()
+    # 명령 사이의 TIME_BTW_COMMANDS 대기가 RTT 표본에 섞이지 않습니다
+    rtt = drone.get_command_scheduler().stats()['rtt']
+    assert rtt['srtt_ms'] < drone.TIME_BTW_COMMANDS * 1e3
+
+
+def test_future_callback_can_send_commands(tello):
+    drone = tello()
+    drone.takeoff()
+    results = []
+    future = drone.move_forward(50, wait=False)
+    future.add_done_callback(lambda f: results.append(drone.query_battery()))
+    future.result(timeout=10)
+
+    deadline = time.monotonic() + 5
+    while not results and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert results and results[0] > 0
+    assert drone.get_command_scheduler().stats()['in_flight'] is None
+
+
+def test_blocking_call_on_scheduler_thread_raises(tello):
+    drone = tello()
+    errors = []
+
+    def blocking(_):
+        try:
+            drone.query_battery()
+        except TelloException as e:
+            errors.append(e)
+
+    future = drone.get_command_scheduler().submit('battery?')
+    future.add_internal_callback(blocking)
+    future.result(timeout=10)
+    time.sleep(0.1)
+    assert len(errors) == 1
@@ -0,0 +1,44 @@
+from djitellopy import Tello, TelloState
+
+EDU = (b'mid:-1;x:0;y:0;z:0;mpry:0,0,0;pitch:1;roll:-2;yaw:30;vgx:0;vgy:0;vgz:0;'
+       b'templ:60;temph:62;tof:10;h:80;bat:87;baro:12.34;time:5;agx:-1.00;agy:2.00;agz:-998.00;\r\n')
+BASIC = (b'pitch:1;roll:-2;yaw:30;vgx:0;vgy:0;vgz:0;templ:60;temph:62;tof:10;h:80;'
+         b'bat:87;baro:12.34;time:5;agx:-1.00;agy:2.00;agz:-998.00;\r\n')
+
+
+def test_parse_edu_layout():
+    state = Tello.parse_state_bytes(EDU)
+    assert isinstance(state, TelloState)
+    assert state['mid'] == -1
+    assert state['mpry'] == '0,0,0'
+    assert state['bat'] == 87
+    assert state['baro'] == 12.34
+    assert state['agz'] == -998.0
+
+
+def test_parse_basic_layout_has_no_mission_pad():
+    state = Tello.parse_state_bytes(BASIC)
+    assert state['yaw'] == 30
+    assert 'mid' not in state
+    assert dict(state) == Tello.parse_state(BASIC.decode('ASCII'))
+
+
+def test_fast_layout_matches_slow_parser():
+    assert dict(Tello.parse_state_bytes(EDU)) == Tello.parse_state(EDU.decode('ASCII'))
+
+
+def test_extra_fields_fall_through_to_slow_parser():
+    # 새 펌웨어가 필드를 덧붙여도 앞부분만 읽고 나머지를 버리지 않습니다
+    state = Tello.parse_state_bytes(EDU.rstrip(b'\r\n') + b'wifi:90;\r\n')
+    assert state['bat'] == 87
+    assert state['wifi'] == '90'
+
+
+def test_reordered_fields_fall_through_to_slow_parser():
+    state = Tello.parse_state_bytes(b'bat:50;h:10;')
+    assert state['bat'] == 50
+    assert state['h'] == 10
+
+
+def test_packet_without_fields():
+    assert Tello.parse_state_bytes(b'ok') is None
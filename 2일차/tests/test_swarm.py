@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+from djitellopy import Tello, TelloException, TelloSwarm, TelloTransport
+
+
+@pytest.fixture
+def swarm(simulator):
+    simulators = [simulator() for _ in range(3)]
+    transport = TelloTransport()
+    swarm = TelloSwarm([Tello(sim.host, transport=transport) for sim in simulators])
+    yield swarm
+    swarm.end()
+    transport.close()
+
+
+def test_parallel_returns_results_in_order(swarm):
+    assert swarm.parallel(lambda i, tello: i * 10) == [0, 10, 20]
+
+
+def test_parallel_timeout_does_not_break_next_call(swarm):
+    release = threading.Event()
+    stale = []
+
+    def stuck(i, tello):
+        if i == 0:
+            release.wait()
+            # 시간이 지난 호출의 sync()는 다음 호출의 배리어에 끼어들지 않습니다
+            try:
+                swarm.sync()
+            except threading.BrokenBarrierError:
+                stale.append(i)
+            return
+        swarm.sync()
+
+    results = swarm.parallel(stuck, timeout=0.3)
+    assert all(isinstance(result, TelloException) for result in results)
+
+    def synced(i, tello):
+        swarm.sync()
+        time.sleep(0.02 * i)
+        swarm.sync()
+        return i
+
+    assert swarm.parallel(synced, timeout=5) == [0, 1, 2]
+    release.set()
+    assert swarm.parallel(synced, timeout=5) == [0, 1, 2]
+    assert stale == [0]
+
+
+def test_broadcast_call_raises_when_a_drone_fails(swarm):
+    swarm.connect()
+    swarm.parallel(lambda i, tello: tello.takeoff() if i else None)
+    # 드론 0은 이륙하지 않았으므로 이동 명령이 실패합니다
+    with pytest.raises(TelloException, match=r"'move_up' failed on drone\(s\) \[0\]"):
+        swarm.move_up(20)
+    assert len(swarm.query_battery()) == 3
@@ -0,0 +1,61 @@
+import time
+
+import numpy as np
+import pytest
+
+from djitellopy.frame_hub import FrameHub
+from djitellopy.tello import BackgroundFrameRead, Tello
+
+pytest.importorskip('av')
+
+
+@pytest.fixture(scope='module')
+def video(tmp_path_factory):
+    from djitellopy.sim import generate_test_video
+    return generate_test_video(str(tmp_path_factory.mktemp('video') / 'test.h264'), seconds=1.0,
+                               width=320, height=240)
+
+
+def decode(path, **options):
+    reader = BackgroundFrameRead(None, path, **options)
+    reader.start()
+    reader.worker.join(timeout=30)
+    return reader
+
+
+@pytest.mark.parametrize('pixel_format, shape', [
+    (Tello.PIXEL_FORMAT_RGB, (240, 320, 3)),
+    (Tello.PIXEL_FORMAT_BGR, (240, 320, 3)),
+    (Tello.PIXEL_FORMAT_YUV420P, (360, 320)),
+])
+def test_frames_are_decoded_in_the_requested_format(video, pixel_format, shape):
+    reader = decode(video, pixel_format=pixel_format)
+    assert reader.frame.shape == shape
+    assert reader.ring.latest().sequence > 1
+
+
+def test_ring_frames_are_not_overwritten(video):
+    reader = decode(video, ring_capacity=64)
+    latest = reader.ring.latest().sequence
+    frames = [reader.ring.get(sequence).frame for sequence in range(1, latest + 1)]
+    # 프레임마다 새 배열이므로 앞선 프레임이 다음 프레임으로 덮어써지지 않습니다
+    assert not any(np.shares_memory(a, b) for a, b in zip(frames, frames[1:]))
+
+
+def test_frame_hub_queue_keeps_frames_intact(video):
+    reader = decode(video, ring_capacity=64)
+    latest = reader.ring.latest().sequence
+    hub = FrameHub(reader)
+    queue = hub.subscribe('queue', FrameHub.QUEUE, maxsize=8)
+    hub.start()
+    deadline = time.monotonic() + 5
+    while queue.offered < latest and time.monotonic() < deadline:
+        time.sleep(0.01)
+    hub.stop()
+
+    items = [queue.get(timeout=0) for _ in range(8)]
+    assert [item.sequence for item in items] == list(range(latest - 7, latest + 1))
+    for item in items:
+        assert not item.frame.flags.writeable
+        assert np.array_equal(item.frame, reader.ring.get(item.sequence).frame)
+    assert not any(np.shares_memory(a.frame, b.frame) for a, b in zip(items, items[1:]))
@@ -0,0 +1,6 @@
+"""djitellopy 성능 측정 스크립트 모음.
+Benchmarks for djitellopy. Run from the project root, e.g.
+`python -m benchmarks.enforce_types_overhead`, or `python -m benchmarks`
+to run all of them and emit one JSON report. Network benchmarks run
+against the local simulator (djitellopy.sim), no drone is needed.
+"""
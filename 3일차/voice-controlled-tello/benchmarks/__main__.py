@@ -0,0 +1,61 @@
+"""모든 벤치마크를 실행하고 결과를 하나의 JSON 문서로 출력합니다.
+Runs every benchmark and emits a single JSON document, so results can be
+compared release over release.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks command_rtt state_ingest
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import sys
+
+BENCHMARKS = [
+    'command_rtt',
+    'state_ingest',
+    'video_decode',
+    'swarm_parallel',
+    'swarm_transport',
+    'swarm_broadcast',
+    'swarm_state',
+    'choreography',
+    'frame_convert',
+    'enforce_types_overhead',
+    'import_time',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='djitellopy benchmarks')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='benchmarks to run (default: all): ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--output', default=None, help='write the JSON result to this file')
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error('unknown benchmark: ' + ', '.join(unknown))
+
+    report = {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {},
+    }
+    for name in args.names or BENCHMARKS:
+        print('running {}...'.format(name), file=sys.stderr)
+        module = importlib.import_module('.' + name, __package__)
+        report['results'][name] = module.run()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as fd:
+            fd.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
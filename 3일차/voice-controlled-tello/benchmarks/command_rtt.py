@@ -0,0 +1,70 @@
+"""send_control_command의 왕복 시간(RTT)을 로컬 시뮬레이터로 측정합니다.
+Measures send_control_command round-trip times against the local simulator.
+
+    python -m benchmarks.command_rtt
+"""
+
+import json
+import logging
+import socket
+import time
+
+from djitellopy.tello import Tello, TelloTransport
+
+from .common import percentiles, simulator_process
+
+HOST = '127.0.0.1'
+
+
+def raw_round_trips(count):
+    """비교용: 라이브러리 없이 소켓 하나로 보낸 명령의 RTT"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(Tello.RESPONSE_TIMEOUT)
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        sock.sendto(b'command', (HOST, Tello.CONTROL_UDP_PORT))
+        sock.recvfrom(1024)
+        samples.append(time.perf_counter() - started)
+    sock.close()
+    return samples
+
+
+def library_round_trips(tello, count, command='command', pause=0.0):
+    samples = []
+    for _ in range(count):
+        if pause:
+            time.sleep(pause)
+        started = time.perf_counter()
+        tello.send_control_command(command)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run(count=200, latencies=(0.0, 0.005, 0.02)):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    result = {}
+    for latency in latencies:
+        with simulator_process(HOST, '--latency', str(latency)):
+            raw = raw_round_trips(count)
+
+            tello = Tello(HOST, transport=TelloTransport())
+            try:
+                # 연속 명령: TIME_BTW_COMMANDS 대기가 포함된 사용자 체감 시간
+                back_to_back = library_round_trips(tello, count)
+                # 명령 간격을 두면 라이브러리 자체의 오버헤드만 남습니다
+                spaced = library_round_trips(tello, count, pause=Tello.TIME_BTW_COMMANDS)
+            finally:
+                tello.end()
+                tello.transport.close()
+
+        result['latency_{}ms'.format(round(latency * 1e3))] = {
+            'raw_socket': percentiles(raw),
+            'send_control_command': percentiles(spaced),
+            'send_control_command_back_to_back': percentiles(back_to_back),
+        }
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
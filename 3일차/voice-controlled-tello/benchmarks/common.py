@@ -0,0 +1,61 @@
+"""벤치마크에서 공통으로 사용하는 도구.
+Helpers shared by the benchmarks.
+"""
+
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+from djitellopy.tello import Tello
+
+
+def percentiles(samples, points=(50, 90, 99)) -> dict:
+    """초 단위 표본 목록의 백분위수를 ms 단위로 반환합니다"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    result = {'p{}'.format(p): round(ordered[min(len(ordered) - 1, len(ordered) * p // 100)] * 1e3, 3)
+              for p in points}
+    result['mean'] = round(sum(ordered) / len(ordered) * 1e3, 3)
+    result['max'] = round(ordered[-1] * 1e3, 3)
+    return result
+
+
+@contextmanager
+def simulator_process(host='127.0.0.1', *options):
+    """별도 프로세스에서 djitellopy.sim을 실행합니다. 같은 프로세스에서 실행하면
+    시뮬레이터 스레드가 GIL을 두고 측정 대상과 경쟁하므로 결과가 왜곡됩니다.
+
+    ```python
+    with simulator_process('127.0.0.1', '--latency', '0.005'):
+        ...
+    ```
+    """
+    process = subprocess.Popen([sys.executable, '-m', 'djitellopy.sim', '--host', host] + list(options),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_simulator(host)
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def wait_for_simulator(host, timeout=10.0):
+    """시뮬레이터가 sdk? 에 응답할 때까지 기다립니다"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(0.1)
+    deadline = time.monotonic() + timeout
+    try:
+        while time.monotonic() < deadline:
+            sock.sendto(b'sdk?', (host, Tello.CONTROL_UDP_PORT))
+            try:
+                sock.recvfrom(1024)
+                return
+            except OSError:
+                continue
+        raise RuntimeError('simulator on {} did not start'.format(host))
+    finally:
+        sock.close()
@@ -0,0 +1,102 @@
+"""@enforce_types 래퍼의 호출당 오버헤드를 측정합니다.
+Measures the per-call overhead of the @enforce_types wrappers.
+
+    python -m benchmarks.enforce_types_overhead
+"""
+
+import inspect
+import json
+import timeit
+from contextlib import suppress
+from functools import wraps
+
+from djitellopy.enforce_types import enforce_types, strip_type_checks, _is_unparameterized_special_typing
+
+
+def legacy_enforce_types(target):
+    """비교용: 호출마다 어노테이션을 해석하던 이전 구현"""
+    def check_types(spec, *args, **kwargs):
+        parameters = dict(zip(spec.args, args))
+        parameters.update(kwargs)
+        for name, value in parameters.items():
+            with suppress(KeyError):
+                type_hint = spec.annotations[name]
+                if _is_unparameterized_special_typing(type_hint):
+                    continue
+
+                if hasattr(type_hint, "__origin__") and type_hint.__origin__ is not None:
+                    actual_type = type_hint.__origin__
+                elif hasattr(type_hint, "__args__") and type_hint.__args__ is not None:
+                    actual_type = type_hint.__args__
+                else:
+                    actual_type = type_hint
+
+                if not isinstance(value, actual_type):
+                    raise TypeError("Unexpected type for '{}' (expected {} but found {})"
+                                    .format(name, type_hint, type(value)))
+
+    def decorate(func):
+        spec = inspect.getfullargspec(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            check_types(spec, *args, **kwargs)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for name, func in inspect.getmembers(target, predicate=inspect.isfunction):
+        setattr(target, name, decorate(func))
+    return target
+
+
+def make_class():
+    """Tello의 getter/명령 메서드와 같은 모양의 메서드를 가진 클래스"""
+    class Drone:
+        state = {'yaw': 10}
+
+        def get_state_field(self, key: str):
+            return self.state[key]
+
+        def get_yaw(self) -> int:
+            return self.get_state_field('yaw')
+
+        def move(self, direction: str, x: int):
+            return direction, x
+
+    return Drone
+
+
+def measure(cls, number):
+    drone = cls()
+    result = {}
+    for name, stmt in (('get_yaw', lambda: drone.get_yaw()),
+                       ('move', lambda: drone.move('up', 20))):
+        seconds = min(timeit.repeat(stmt, number=number, repeat=5))
+        result[name] = seconds / number * 1e9  # ns per call
+    return result
+
+
+def run(number=200000):
+    plain = measure(make_class(), number)
+    variants = {
+        'undecorated': plain,
+        'legacy': measure(legacy_enforce_types(make_class()), number),
+        'compiled': measure(enforce_types(make_class()), number),
+        'stripped': measure(strip_type_checks(enforce_types(make_class())), number),
+    }
+
+    result = {
+        name: {method: round(ns, 1) for method, ns in values.items()}
+        for name, values in variants.items()
+    }
+    # 래퍼가 없는 호출 대비 추가 비용 (ns/call)
+    result['overhead_ns'] = {
+        name: {method: round(values[method] - plain[method], 1) for method in plain}
+        for name, values in variants.items() if name != 'undecorated'
+    }
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
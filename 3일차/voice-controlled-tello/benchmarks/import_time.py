@@ -0,0 +1,64 @@
+"""djitellopy import 시간을 새 인터프리터에서 측정합니다.
+Measures how long importing djitellopy takes in a fresh interpreter, and which
+heavy dependencies (PyAV, NumPy) get loaded along the way.
+
+    python -m benchmarks.import_time
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 측정 코드: 인터프리터 시작 시간은 빼고 import 자체만 잽니다
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in ('av', 'numpy', 'asyncio') if m in sys.modules))
+'''
+
+CASES = {
+    # 비디오를 쓰지 않는 CLI 스크립트 (battery_check.py 등)
+    'djitellopy': 'import djitellopy',
+    'tello_only': 'from djitellopy.tello import Tello',
+    # get_frame_read() / 텔레메트리 기록을 처음 사용할 때 치르는 비용
+    'av_numpy': 'import av, numpy',
+    # 이전처럼 모두 한 번에 불러올 때
+    'eager': 'import av, numpy, djitellopy',
+}
+
+
+def measure(statement, repeat):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+    samples = []
+    loaded = ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement)],
+                                cwd=root, env=env, stdout=subprocess.PIPE, check=True,
+                                universal_newlines=True).stdout.split()
+        samples.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ''
+    return {
+        'median_ms': round(statistics.median(samples) * 1e3, 1),
+        'min_ms': round(min(samples) * 1e3, 1),
+        'loaded': loaded.split(',') if loaded else [],
+    }
+
+
+def run(repeat=9):
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 버립니다
+    for statement in CASES.values():
+        measure(statement, 1)
+
+    result = {name: measure(statement, repeat) for name, statement in CASES.items()}
+    result['speedup'] = round(result['eager']['median_ms'] / result['djitellopy']['median_ms'], 2)
+    return result
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,97 @@
+"""udp_state_receiver + parse_state가 처리할 수 있는 초당 상태 패킷 수를 측정합니다.
+Measures how many state packets per second udp_state_receiver + parse_state sustain.
+
+    python -m benchmarks.state_ingest
+"""
+
+import json
+import logging
+import socket
+import time
+import timeit
+from contextlib import suppress
+from threading import Thread
+
+from djitellopy.sim import DroneModel
+from djitellopy.tello import Tello
+
+HOST = '127.0.0.1'
+
+
+class CountingDrone(dict):
+    """state가 갱신될 때마다 횟수를 세는 드론 항목"""
+
+    def __init__(self):
+        super().__init__(responses=[], state={})
+        self.updates = 0
+        self.last_update = 0.0
+
+    def __setitem__(self, key, value):
+        if key == 'state':
+            self.updates += 1
+            self.last_update = time.perf_counter()
+        super().__setitem__(key, value)
+
+
+def parse_only(parse, line, number):
+    seconds = min(timeit.repeat(lambda: parse(line), number=number, repeat=3))
+    return round(number / seconds)
+
+
+def receiver_throughput(line, packets, rate=None):
+    """packets개의 상태 패킷을 보내고 수신 스레드가 처리한 비율을 측정합니다.
+    rate가 None이면 가능한 한 빨리 보냅니다.
+    """
+    state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    state_socket.bind((HOST, 0))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.bind((HOST, 0))
+
+    drone = CountingDrone()
+    receiver = Thread(target=Tello.udp_state_receiver, args=(state_socket, {HOST: drone}), daemon=True)
+    receiver.start()
+
+    target = state_socket.getsockname()
+    interval = 1 / rate if rate else 0
+    started = time.perf_counter()
+    for i in range(packets):
+        sender.sendto(line, target)
+        if interval:
+            # busy wait: sleep()의 해상도로는 높은 전송률을 낼 수 없습니다
+            while time.perf_counter() < started + (i + 1) * interval:
+                pass
+    sent_in = time.perf_counter() - started
+
+    # 수신 버퍼에 남은 패킷을 처리할 시간
+    deadline = time.perf_counter() + 1.0
+    while drone.updates < packets and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    with suppress(OSError):
+        state_socket.shutdown(socket.SHUT_RDWR)  # recvfrom을 깨웁니다
+    state_socket.close()
+    sender.close()
+    receiver.join(1)
+
+    return {
+        'sent': packets,
+        'processed': drone.updates,
+        'loss': round(1 - drone.updates / packets, 4),
+        'send_rate': round(packets / sent_in),
+        'processed_per_sec': round(drone.updates / max(drone.last_update - started, 1e-9)),
+    }
+
+
+def run(packets=20000):
+    Tello.LOGGER.setLevel(logging.WARNING)
+    line = DroneModel().state_line()
+    return {
+        'parse_state_per_sec': parse_only(lambda data: Tello.parse_state(data.decode('ASCII')), line, 20000),
+        'parse_state_bytes_per_sec': parse_only(Tello.parse_state_bytes, line, 20000),
+        'receiver_unpaced': receiver_throughput(line, packets),
+        'receiver_1khz': receiver_throughput(line, 2000, rate=1000),
+    }
+
+
+if __name__ == '__main__':
+    print(json.dumps(run(), indent=2))
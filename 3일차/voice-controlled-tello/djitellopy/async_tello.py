@@ -0,0 +1,530 @@
+"""asyncio 기반으로 DJI Ryze Tello 드론을 제어하기 위한 라이브러리.
+Library for controlling DJI Ryze Tello drones from an asyncio event loop.
+"""
+
+import asyncio
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Optional, Dict, Union
+
+from .tello import Tello, TelloException
+from .enforce_types import enforce_types
+
+
+class _TelloControlProtocol(asyncio.DatagramProtocol):
+    """드론 한 대의 명령 응답을 받는 프로토콜
+    Receives command responses of a single drone.
+    Internal class, you normally wouldn't use this yourself.
+    """
+
+    def __init__(self, tello: 'AsyncTello'):
+        self.tello = tello
+
+    def datagram_received(self, data, addr):
+        self.tello._response_received(data, addr)
+
+    def error_received(self, exc):
+        Tello.LOGGER.error(exc)
+
+
+class _TelloStateProtocol(asyncio.DatagramProtocol):
+    """상태 포트로 들어오는 패킷을 IP 별로 분배하는 프로토콜
+    Dispatches state packets to the drones registered by IP address.
+    Internal class, you normally wouldn't use this yourself.
+    """
+
+    def __init__(self):
+        self.drones: Dict[str, 'AsyncTello'] = {}
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        tello = self.drones.get(addr[0])
+        if tello is None:
+            return
+
+        state = Tello.parse_state_bytes(data, datetime.now())
+        if state is not None:
+            tello.state = state
+
+    def error_received(self, exc):
+        Tello.LOGGER.error(exc)
+
+
+# (event loop, port) -> 공유 상태 수신 프로토콜을 만드는 작업 (바인딩 중에도 등록되어 있습니다)
+_state_protocols: Dict[tuple, asyncio.Task] = {}
+
+
+@enforce_types
+class AsyncTello:
+    """[Tello][tello]와 같은 명령어를 asyncio로 보내는 클래스. 모든 통신 메서드는
+    코루틴이므로 하나의 이벤트 루프에서 여러 대의 드론, 비디오, 웹 서버를
+    스레드 없이 함께 구동할 수 있습니다.
+    Async counterpart of [Tello][tello] sharing its command set. All methods
+    doing I/O are coroutines, so one event loop can drive many drones.
+
+    ```python
+    async def main():
+        tello = AsyncTello()
+        await tello.connect()
+        await tello.takeoff()
+        await tello.move_up(50)
+        print(tello.get_battery())
+        await tello.land()
+        await tello.end()
+
+    asyncio.run(main())
+    ```
+    """
+
+    RESPONSE_TIMEOUT = Tello.RESPONSE_TIMEOUT
+    TAKEOFF_TIMEOUT = Tello.TAKEOFF_TIMEOUT
+    TIME_BTW_COMMANDS = Tello.TIME_BTW_COMMANDS
+    RETRY_COUNT = Tello.RETRY_COUNT
+    LOGGER = Tello.LOGGER
+
+    def __init__(self,
+                 host=Tello.TELLO_IP,
+                 retry_count=RETRY_COUNT,
+                 state_port=Tello.STATE_UDP_PORT):
+        """AsyncTello 인스턴스를 초기화합니다. 소켓은 `connect()`에서 열립니다.
+        Initialize an AsyncTello instance. Sockets are opened in `connect()`.
+
+        Arguments:
+            host: 드론의 IP 주소 / IP address of the drone
+            retry_count: 실패한 명령어 재시도 횟수 / retries for failed commands
+            state_port: 상태 패킷을 받을 로컬 포트 / local port for state packets
+        """
+        self.address = (host, Tello.CONTROL_UDP_PORT)
+        self.retry_count = retry_count
+        self.state_port = state_port
+        self.state: Mapping = {}
+        self.is_flying = False
+        self.stream_on = False
+        self.last_received_command_timestamp = time.time()
+
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._state_protocol: Optional[_TelloStateProtocol] = None
+        self._pending: Optional[asyncio.Future] = None
+        self._command_lock: Optional[asyncio.Lock] = None
+        self._opening: Optional[asyncio.Task] = None
+
+    async def _open(self):
+        """제어 소켓과 공유 상태 소켓을 엽니다. 동시에 호출되어도 한 번만 엽니다.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        if self._transport is not None:
+            return
+
+        if self._opening is None:
+            self._opening = asyncio.get_running_loop().create_task(self._open_endpoints())
+        opening = self._opening
+        try:
+            await asyncio.shield(opening)
+        except BaseException:
+            # 실패하면 다음 호출에서 다시 열 수 있도록 합니다
+            if opening.done() and self._opening is opening:
+                self._opening = None
+            raise
+
+    async def _open_endpoints(self):
+        """_open이 한 번만 실행하는 작업. 두 소켓이 모두 열린 뒤에만 상태를 바꿉니다.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        loop = asyncio.get_running_loop()
+
+        key = (loop, self.state_port)
+        binding = _state_protocols.get(key)
+        if binding is None:
+            # 같은 상태 포트를 쓰는 드론이 동시에 연결해도 한 번만 바인딩하도록
+            # await 하기 전에 바인딩 작업을 등록해 둡니다
+            binding = loop.create_task(loop.create_datagram_endpoint(
+                _TelloStateProtocol, local_addr=('0.0.0.0', self.state_port)))
+            _state_protocols[key] = binding
+
+        try:
+            _, protocol = await asyncio.shield(binding)
+        except OSError:
+            if _state_protocols.get(key) is binding:
+                del _state_protocols[key]
+            raise
+
+        # 응답은 명령을 보낸 포트로 돌아오므로 제어 소켓은 임시 포트를 사용합니다
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _TelloControlProtocol(self),
+            local_addr=('0.0.0.0', 0))
+
+        self._command_lock = asyncio.Lock()
+        self._state_protocol = protocol
+        self._state_protocol.drones[self.address[0]] = self
+        self._transport = transport
+
+    def _response_received(self, data: bytes, addr):
+        """제어 프로토콜이 호출하는 응답 콜백
+        Internal method, you normally wouldn't call this yourself.
+        """
+        if addr[0] != self.address[0]:
+            return
+
+        if self._pending is None or self._pending.done():
+            self.LOGGER.debug('Dropping late response from {}: {}'.format(addr[0], data))
+            return
+
+        self._pending.set_result(data)
+
+    async def send_command_with_return(self, command: str, timeout: int = RESPONSE_TIMEOUT) -> str:
+        """명령을 보내고 응답을 기다립니다.
+        Send command to Tello and wait for its response.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        await self._open()
+
+        async with self._command_lock:
+            diff = time.time() - self.last_received_command_timestamp
+            if diff < self.TIME_BTW_COMMANDS:
+                await asyncio.sleep(self.TIME_BTW_COMMANDS - diff)
+
+            self.LOGGER.info("Send command: '{}'".format(command))
+            self._pending = asyncio.get_running_loop().create_future()
+            self._transport.sendto(command.encode('utf-8'), self.address)
+
+            try:
+                data = await asyncio.wait_for(self._pending, timeout)
+            except asyncio.TimeoutError:
+                message = "Aborting command '{}'. Did not receive a response after {} seconds".format(command, timeout)
+                self.LOGGER.warning(message)
+                return message
+            finally:
+                self._pending = None
+
+            self.last_received_command_timestamp = time.time()
+
+        try:
+            response = data.decode('utf-8').rstrip('\r\n')
+        except UnicodeDecodeError as e:
+            self.LOGGER.error(e)
+            return "response decode error"
+
+        self.LOGGER.info("Response {}: '{}'".format(command, response))
+        return response
+
+    async def send_command_without_return(self, command: str):
+        """응답을 기다리지 않고 명령을 보냅니다.
+        Send command to Tello without expecting a response.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        await self._open()
+        self.LOGGER.info("Send command (no response expected): '{}'".format(command))
+        self._transport.sendto(command.encode('utf-8'), self.address)
+
+    async def send_control_command(self, command: str, timeout: int = RESPONSE_TIMEOUT) -> bool:
+        """제어 명령을 보내고 'ok' 응답을 기다립니다.
+        Send control command to Tello and wait for its response.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        response = "max retries exceeded"
+        for i in range(0, self.retry_count):
+            response = await self.send_command_with_return(command, timeout=timeout)
+
+            if 'ok' in response.lower():
+                return True
+
+            self.LOGGER.debug("Command attempt #{} failed for command: '{}'".format(i, command))
+
+        self.raise_result_error(command, response)
+        return False  # never reached
+
+    async def send_read_command(self, command: str) -> str:
+        """조회 명령을 보내고 응답을 반환합니다.
+        Send given command to Tello and wait for its response.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        response = await self.send_command_with_return(command)
+
+        if any(word in response for word in ('error', 'ERROR', 'False')):
+            self.raise_result_error(command, response)
+
+        return response
+
+    async def send_read_command_int(self, command: str) -> int:
+        """조회 명령의 응답을 정수로 반환합니다.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        return int(await self.send_read_command(command))
+
+    def raise_result_error(self, command: str, response: str):
+        """Internal method, you normally wouldn't call this yourself.
+        """
+        tries = 1 + self.retry_count
+        raise TelloException("Command '{}' was unsuccessful for {} tries. Latest response:\t'{}'"
+                             .format(command, tries, response))
+
+    # 상태 필드 조회는 I/O 없이 마지막 상태 패킷을 읽으므로 Tello의 구현을 그대로 사용합니다
+    # State getters only read the latest state packet, so Tello's implementations are shared
+    get_current_state = Tello.get_current_state
+    get_state_field = Tello.get_state_field
+    get_last_state_update = Tello.get_last_state_update
+    get_mission_pad_id = Tello.get_mission_pad_id
+    get_mission_pad_distance_x = Tello.get_mission_pad_distance_x
+    get_mission_pad_distance_y = Tello.get_mission_pad_distance_y
+    get_mission_pad_distance_z = Tello.get_mission_pad_distance_z
+    get_pitch = Tello.get_pitch
+    get_roll = Tello.get_roll
+    get_yaw = Tello.get_yaw
+    get_speed_x = Tello.get_speed_x
+    get_speed_y = Tello.get_speed_y
+    get_speed_z = Tello.get_speed_z
+    get_acceleration_x = Tello.get_acceleration_x
+    get_acceleration_y = Tello.get_acceleration_y
+    get_acceleration_z = Tello.get_acceleration_z
+    get_lowest_temperature = Tello.get_lowest_temperature
+    get_highest_temperature = Tello.get_highest_temperature
+    get_temperature = Tello.get_temperature
+    get_height = Tello.get_height
+    get_distance_tof = Tello.get_distance_tof
+    get_barometer = Tello.get_barometer
+    get_flight_time = Tello.get_flight_time
+    get_battery = Tello.get_battery
+
+    def get_own_udp_object(self) -> dict:
+        """공유된 상태 조회 메서드가 사용하는 상태 객체
+        Internal method, you normally wouldn't call this yourself.
+        """
+        return {'state': self.state}
+
+    async def connect(self, wait_for_state=True):
+        """
+        SDK 모드로 진입합니다. 다른 제어 함수를 사용하기 전에 반드시 호출해야 합니다.
+
+        매개변수:
+            wait_for_state (bool): 상태 패킷을 기다릴지 여부
+        """
+        await self.send_control_command("command")
+
+        # 기본 포트가 아니면 드론이 그 포트로 상태 패킷을 보내도록 설정 (Tello.connect와 같음)
+        if self.state_port != Tello.STATE_UDP_PORT:
+            await self.send_control_command('port {} {}'.format(self.state_port, Tello.DEFAULT_VS_UDP_PORT))
+
+        if wait_for_state:
+            REPS = 20
+            for _ in range(REPS):
+                if self.state:
+                    break
+                await asyncio.sleep(1 / REPS)
+
+            if not self.state:
+                raise TelloException('Tello로부터 상태 패킷을 받지 못했습니다')
+
+    async def takeoff(self):
+        """
+        자동 이륙을 수행합니다.
+        """
+        await self.send_control_command("takeoff", timeout=self.TAKEOFF_TIMEOUT)
+        self.is_flying = True
+
+    async def land(self):
+        """
+        자동 착륙을 수행합니다.
+        """
+        await self.send_control_command("land")
+        self.is_flying = False
+
+    async def emergency(self):
+        """
+        비상 정지: 모든 모터를 즉시 정지시킵니다.
+        """
+        await self.send_command_without_return("emergency")
+        self.is_flying = False
+
+    async def streamon(self):
+        """
+        비디오 스트리밍을 시작합니다.
+        """
+        await self.send_control_command("streamon")
+        self.stream_on = True
+
+    async def streamoff(self):
+        """
+        비디오 스트리밍을 종료합니다.
+        """
+        await self.send_control_command("streamoff")
+        self.stream_on = False
+
+    async def move(self, direction: str, x: int):
+        """
+        지정된 방향으로 x cm만큼 이동합니다.
+
+        매개변수:
+            direction: 이동 방향 (up, down, left, right, forward, back)
+            x: 이동 거리 (20-500cm)
+        """
+        await self.send_control_command("{} {}".format(direction, x))
+
+    async def move_up(self, x: int):
+        """위로 x cm 이동합니다."""
+        await self.move("up", x)
+
+    async def move_down(self, x: int):
+        """아래로 x cm 이동합니다."""
+        await self.move("down", x)
+
+    async def move_left(self, x: int):
+        """왼쪽으로 x cm 이동합니다."""
+        await self.move("left", x)
+
+    async def move_right(self, x: int):
+        """오른쪽으로 x cm 이동합니다."""
+        await self.move("right", x)
+
+    async def move_forward(self, x: int):
+        """앞으로 x cm 이동합니다."""
+        await self.move("forward", x)
+
+    async def move_back(self, x: int):
+        """뒤로 x cm 이동합니다."""
+        await self.move("back", x)
+
+    async def rotate_clockwise(self, x: int):
+        """시계 방향으로 x도 회전합니다."""
+        await self.send_control_command("cw {}".format(x))
+
+    async def rotate_counter_clockwise(self, x: int):
+        """반시계 방향으로 x도 회전합니다."""
+        await self.send_control_command("ccw {}".format(x))
+
+    async def flip(self, direction: str):
+        """
+        지정된 방향으로 플립 동작을 수행합니다.
+
+        매개변수:
+            direction: l (왼쪽), r (오른쪽), f (앞쪽) 또는 b (뒤쪽)
+        """
+        await self.send_control_command("flip {}".format(direction))
+
+    async def flip_left(self):
+        """왼쪽으로 플립 동작을 수행합니다."""
+        await self.flip("l")
+
+    async def flip_right(self):
+        """오른쪽으로 플립 동작을 수행합니다."""
+        await self.flip("r")
+
+    async def flip_forward(self):
+        """앞으로 플립 동작을 수행합니다."""
+        await self.flip("f")
+
+    async def flip_back(self):
+        """뒤로 플립 동작을 수행합니다."""
+        await self.flip("b")
+
+    async def go_xyz_speed(self, x: int, y: int, z: int, speed: int):
+        """현재 위치를 기준으로 x, y, z 좌표로 speed(cm/s) 속도로 이동합니다."""
+        await self.send_control_command('go {} {} {} {}'.format(x, y, z, speed))
+
+    async def curve_xyz_speed(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int):
+        """x1 y1 z1을 거쳐 x2 y2 z2까지 곡선으로 비행합니다."""
+        await self.send_control_command('curve {} {} {} {} {} {} {}'.format(x1, y1, z1, x2, y2, z2, speed))
+
+    async def stop(self):
+        """드론을 현재 위치에서 정지(호버링)시킵니다."""
+        await self.send_control_command("stop")
+
+    async def set_speed(self, x: int):
+        """드론의 이동 속도를 설정합니다 (10-100cm/s)."""
+        await self.send_control_command("speed {}".format(x))
+
+    async def send_rc_control(self, left_right_velocity: Union[int, float],
+                              forward_backward_velocity: Union[int, float],
+                              up_down_velocity: Union[int, float], yaw_velocity: Union[int, float]):
+        """4채널 RC 제어 명령을 보냅니다 (-100~100, 실수는 정수로 자릅니다).
+        Send RC control via four channels. Floats are truncated to integers.
+        """
+        def clamp100(x: Union[int, float]) -> int:
+            return max(-100, min(100, int(x)))
+
+        await self.send_command_without_return('rc {} {} {} {}'.format(
+            clamp100(left_right_velocity),
+            clamp100(forward_backward_velocity),
+            clamp100(up_down_velocity),
+            clamp100(yaw_velocity)
+        ))
+
+    async def query_speed(self) -> int:
+        """속도 설정을 조회합니다 (cm/s)"""
+        return await self.send_read_command_int('speed?')
+
+    async def query_battery(self) -> int:
+        """배터리 잔량을 조회합니다 (%)"""
+        return await self.send_read_command_int('battery?')
+
+    async def query_flight_time(self) -> int:
+        """비행 시간을 조회합니다 (초)"""
+        return await self.send_read_command_int('time?')
+
+    async def query_height(self) -> int:
+        """높이를 조회합니다 (cm)"""
+        return await self.send_read_command_int('height?')
+
+    async def query_temperature(self) -> int:
+        """온도를 조회합니다 (°C)"""
+        return await self.send_read_command_int('temp?')
+
+    async def query_attitude(self) -> dict:
+        """IMU 자세 데이터를 조회합니다 ({'pitch': int, 'roll': int, 'yaw': int})"""
+        response = await self.send_read_command('attitude?')
+        return Tello.parse_state(response)
+
+    async def query_barometer(self) -> int:
+        """기압계 값을 조회합니다 (cm)"""
+        baro = await self.send_read_command_int('baro?')
+        return baro * 100
+
+    async def query_distance_tof(self) -> float:
+        """TOF 센서 거리를 조회합니다 (cm)"""
+        # 응답 예시: 801mm
+        tof = await self.send_read_command('tof?')
+        return int(tof[:-2]) / 10
+
+    async def query_wifi_signal_noise_ratio(self) -> str:
+        """Wi-Fi SNR을 조회합니다"""
+        return await self.send_read_command('wifi?')
+
+    async def query_sdk_version(self) -> str:
+        """SDK 버전을 조회합니다"""
+        return await self.send_read_command('sdk?')
+
+    async def query_serial_number(self) -> str:
+        """시리얼 번호를 조회합니다"""
+        return await self.send_read_command('sn?')
+
+    async def query_active(self) -> str:
+        """활성 상태를 조회합니다"""
+        return await self.send_read_command('active?')
+
+    async def end(self):
+        """
+        드론과의 연결을 안전하게 종료하고 소켓을 닫습니다.
+        """
+        try:
+            if self.is_flying:
+                await self.land()
+            if self.stream_on:
+                await self.streamoff()
+        except TelloException:
+            pass
+
+        if self._state_protocol is not None:
+            self._state_protocol.drones.pop(self.address[0], None)
+            if not self._state_protocol.drones:
+                self._state_protocol.transport.close()
+                key = (asyncio.get_running_loop(), self.state_port)
+                _state_protocols.pop(key, None)
+            self._state_protocol = None
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        self._opening = None
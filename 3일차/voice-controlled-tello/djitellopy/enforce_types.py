@@ -2,15 +2,22 @@
 이 파일은 @301_Moved_Permanently의 StackOverflow 게시물을 기반으로 합니다.
 참조: https://stackoverflow.com/a/50622643
 
-이 코드는 클래스 자체에 데코레이터를 추가하여 
+이 코드는 클래스 자체에 데코레이터를 추가하여
 클래스의 모든 메서드를 래핑할 수 있도록 수정되었습니다.
+
+타입 검사기는 데코레이트 시점에 함수마다 한 번만 만들어집니다
+(매개변수 위치 → isinstance에 넘길 타입 튜플). 환경 변수
+DJITELLOPY_TYPE_CHECKS=0 으로 import 하면 래퍼를 전혀 만들지 않으며,
+strip_type_checks(Tello)로 실행 중에 래퍼를 제거할 수도 있습니다.
 """
 
 import inspect
+import os
 import typing
-from contextlib import suppress
 from functools import wraps
 
+TYPE_CHECKS_ENV = "DJITELLOPY_TYPE_CHECKS"
+
 
 def _is_unparameterized_special_typing(type_hint):
     # typing.Any, typing.Union, typing.ClassVar(매개변수 없음)와 같은 특수 타입 체크
@@ -22,48 +29,117 @@ def _is_unparameterized_special_typing(type_hint):
         return False
 
 
+def type_checks_enabled():
+    """환경 변수로 타입 검사가 꺼져 있지 않은지 확인합니다"""
+    return os.environ.get(TYPE_CHECKS_ENV, "1").lower() not in ("0", "false", "no", "off")
+
+
+def _resolve_runtime_type(type_hint):
+    """타입 어노테이션을 isinstance의 두 번째 인자로 변환합니다.
+    검사할 수 없는 어노테이션(문자열 전방 참조, typing.Any 등)은 None을 반환합니다.
+    """
+    if isinstance(type_hint, str) or _is_unparameterized_special_typing(type_hint):
+        return None
+
+    origin = getattr(type_hint, "__origin__", None)
+    if origin is typing.Union:
+        # Optional[X] 등은 각 인자 타입 중 하나와 일치하면 통과
+        actual_type = tuple(_resolve_runtime_type(arg) for arg in type_hint.__args__)
+        if None in actual_type:
+            return None
+    elif origin is not None:
+        actual_type = origin
+    elif getattr(type_hint, "__args__", None) is not None:
+        actual_type = type_hint.__args__
+    else:
+        actual_type = type_hint
+
+    if isinstance(actual_type, type):
+        return actual_type
+    if isinstance(actual_type, tuple) and all(isinstance(t, type) for t in actual_type):
+        return actual_type
+    return None
+
+
+def _compile_checker(func):
+    """함수의 타입 검사 래퍼를 만듭니다. 검사할 어노테이션이 없으면 함수를 그대로 반환합니다.
+    """
+    spec = inspect.getfullargspec(func)
+
+    # 이름 -> (어노테이션, 런타임 타입)
+    checked = {}
+    for name in spec.args + spec.kwonlyargs:
+        if name not in spec.annotations:
+            continue  # 타입 어노테이션이 없는 매개변수는 모든 타입 허용
+        runtime_type = _resolve_runtime_type(spec.annotations[name])
+        if runtime_type is not None:
+            checked[name] = (spec.annotations[name], runtime_type)
+
+    if not checked:
+        return func
+
+    positional = tuple((index, name, checked[name][1])
+                       for index, name in enumerate(spec.args) if name in checked)
+
+    def fail(name, value):
+        raise TypeError("Unexpected type for '{}' (expected {} but found {})"
+                        .format(name, checked[name][0], type(value)))
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        arg_count = len(args)
+        for index, name, runtime_type in positional:
+            if index < arg_count and not isinstance(args[index], runtime_type):
+                fail(name, args[index])
+        if kwargs:
+            for name, value in kwargs.items():
+                if name in checked and not isinstance(value, checked[name][1]):
+                    fail(name, value)
+        return func(*args, **kwargs)
+
+    wrapper.__type_checked__ = True
+    return wrapper
+
+
+def _class_functions(target):
+    """클래스의 (이름, 함수, staticmethod 여부) 목록"""
+    for name, func in inspect.getmembers(target, predicate=inspect.isfunction):
+        yield name, func, isinstance(inspect.getattr_static(target, name), staticmethod)
+
+
 def enforce_types(target):
     """모든 멤버 함수에 타입 체크를 추가하는 클래스 데코레이터
     """
-    def check_types(spec, *args, **kwargs):
-        # 매개변수와 인자를 매핑
-        parameters = dict(zip(spec.args, args))
-        parameters.update(kwargs)
-        for name, value in parameters.items():
-            with suppress(KeyError):  # 타입 어노테이션이 없는 매개변수는 모든 타입 허용
-                type_hint = spec.annotations[name]
-                if _is_unparameterized_special_typing(type_hint):
-                    continue
-
-                if hasattr(type_hint, "__origin__") and type_hint.__origin__ is not None:
-                    actual_type = type_hint.__origin__
-                elif hasattr(type_hint, "__args__") and type_hint.__args__ is not None:
-                    actual_type = type_hint.__args__
-                else:
-                    actual_type = type_hint
-
-                if not isinstance(value, actual_type):
-                    raise TypeError("Unexpected type for '{}' (expected {} but found {})"
-                                    .format(name, type_hint, type(value)))
-
-    def decorate(func):
-        # 함수의 매개변수 정보 가져오기
-        spec = inspect.getfullargspec(func)
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            check_types(spec, *args, **kwargs)
-            return func(*args, **kwargs)
-
-        return wrapper
+    if not type_checks_enabled():
+        return target
 
     if inspect.isclass(target):
         # 클래스인 경우 모든 메서드에 데코레이터 적용
-        members = inspect.getmembers(target, predicate=inspect.isfunction)
-        for name, func in members:
-            setattr(target, name, decorate(func))
+        for name, func, is_static in _class_functions(target):
+            wrapper = _compile_checker(func)
+            if wrapper is not func:
+                setattr(target, name, staticmethod(wrapper) if is_static else wrapper)
 
         return target
     else:
         # 함수인 경우 해당 함수에만 데코레이터 적용
-        return decorate(target)
+        return _compile_checker(target)
+
+
+def strip_type_checks(target):
+    """enforce_types가 추가한 타입 검사 래퍼를 제거합니다 (운영 환경용).
+
+    ```python
+    from djitellopy import Tello
+    from djitellopy.enforce_types import strip_type_checks
+    strip_type_checks(Tello)
+    ```
+    """
+    if not inspect.isclass(target):
+        return getattr(target, "__wrapped__", target) if getattr(target, "__type_checked__", False) else target
+
+    for name, func, is_static in _class_functions(target):
+        if getattr(func, "__type_checked__", False):
+            setattr(target, name, staticmethod(func.__wrapped__) if is_static else func.__wrapped__)
+
+    return target
@@ -0,0 +1,153 @@
+"""상태 패킷을 고정 길이 바이너리 레코드로 저장하고 메모리 매핑으로 읽는 비행 기록기.
+Flight recorder storing state packets as fixed-width binary records.
+"""
+
+import os
+import struct
+import time
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+
+from .tello import Tello, TelloState, TelloException
+
+# 파일 머리말: 매직 16바이트 + 버전(uint32) + 레코드 크기(uint32)
+STATE_LOG_MAGIC = b'DJITELLOPY-STATE'
+STATE_LOG_VERSION = 1
+STATE_LOG_HEADER = struct.Struct('<16sII')
+
+# 레코드 형식: 수신 시각(unix time) + INT_STATE_FIELDS(int32) + FLOAT_STATE_FIELDS(float32)
+STATE_RECORD_DTYPE = np.dtype([('timestamp', '<f8')]
+                              + [(name, '<i4') for name in Tello.INT_STATE_FIELDS]
+                              + [(name, '<f4') for name in Tello.FLOAT_STATE_FIELDS])
+STATE_RECORD = struct.Struct('<d' + 'i' * len(Tello.INT_STATE_FIELDS) + 'f' * len(Tello.FLOAT_STATE_FIELDS))
+
+# 패킷에 없는 필드 (Tello EDU가 아닐 때의 미션 패드 필드 등)
+MISSING_INT = -2 ** 31
+MISSING_FLOAT = float('nan')
+
+
+class StateRecorder:
+    """
+    상태 패킷 하나를 STATE_RECORD_DTYPE 형식의 고정 길이 레코드 하나로 파일 끝에 덧붙입니다.
+    JSON과 달리 패킷당 크기가 일정하고(88바이트) 변환 비용이 거의 없어 몇 시간짜리 비행도
+    그대로 기록할 수 있습니다. 같은 파일에 다시 열면 이어서 기록합니다.
+
+    보통 직접 만들지 않고 Tello.start_state_recording()을 사용합니다.
+
+    ```python
+    tello.start_state_recording('flight.tlog')
+    ...
+    tello.stop_state_recording()
+
+    log = load_state_recording('flight.tlog')
+    print(log['h'].max(), log['bat'][-1])
+    ```
+    """
+
+    # TelloState.data에서 각 레코드 필드의 위치
+    SOURCE = tuple(TelloState.INDEX[name] for name in Tello.INT_STATE_FIELDS + Tello.FLOAT_STATE_FIELDS)
+    INT_COUNT = len(Tello.INT_STATE_FIELDS)
+
+    def __init__(self, path: str):
+        """
+        매개변수:
+            path: 기록할 파일 경로
+        """
+        self.path = path
+        self.lock = Lock()
+        self.records_written = 0
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            read_state_log_header(path)
+        self.file = open(path, 'ab')
+        if not exists:
+            self.file.write(STATE_LOG_HEADER.pack(STATE_LOG_MAGIC, STATE_LOG_VERSION, STATE_RECORD.size))
+
+    def write(self, state: TelloState, timestamp: Optional[float] = None):
+        """상태 하나를 기록합니다. timestamp는 unix time이며 None이면 state.received_at을 사용합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        if timestamp is None:
+            timestamp = state.received_at.timestamp() if state.received_at is not None else time.time()
+
+        data = state.data
+        values = [data[index] for index in StateRecorder.SOURCE]
+        if None in values:
+            values = [(MISSING_INT if i < StateRecorder.INT_COUNT else MISSING_FLOAT) if value is None else value
+                      for i, value in enumerate(values)]
+
+        record = STATE_RECORD.pack(timestamp, *values)
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.write(record)
+            self.records_written += 1
+
+    def flush(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.flush()
+
+    def close(self):
+        """파일을 닫습니다"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+def read_state_log_header(path: str) -> int:
+    """머리말을 확인하고 첫 레코드의 위치를 반환합니다"""
+    with open(path, 'rb') as fd:
+        header = fd.read(STATE_LOG_HEADER.size)
+    if len(header) < STATE_LOG_HEADER.size:
+        raise TelloException("'{}' is not a state recording".format(path))
+
+    magic, version, record_size = STATE_LOG_HEADER.unpack(header)
+    if magic != STATE_LOG_MAGIC:
+        raise TelloException("'{}' is not a state recording".format(path))
+    if version != STATE_LOG_VERSION or record_size != STATE_RECORD.size:
+        raise TelloException("Unsupported state recording version {} (record size {})"
+                             .format(version, record_size))
+    return STATE_LOG_HEADER.size
+
+
+def load_state_recording(path: str) -> np.ndarray:
+    """기록 파일을 NumPy 구조화 배열로 메모리 매핑합니다. 파일을 읽어 들이지 않으므로
+    몇 시간짜리 기록도 즉시 열리고 임의 위치에 바로 접근할 수 있습니다.
+
+    ```python
+    log = load_state_recording('flight.tlog')
+    heights = log['h']
+    duration = log['timestamp'][-1] - log['timestamp'][0]
+    ```
+    """
+    offset = read_state_log_header(path)
+    count = (os.path.getsize(path) - offset) // STATE_RECORD.size
+    if count == 0:
+        return np.zeros(0, dtype=STATE_RECORD_DTYPE)
+    # 기록 중인 파일이면 마지막의 불완전한 레코드는 제외됩니다
+    return np.memmap(path, dtype=STATE_RECORD_DTYPE, mode='r', offset=offset, shape=(count,))
+
+
+def format_state_record(record) -> bytes:
+    """레코드 하나를 Tello 상태 패킷 형식으로 되돌립니다 (재생용).
+    미션 패드 필드가 없던 레코드는 일반 Tello 형식으로 만듭니다.
+    """
+    parts = []
+    for name in TelloState.FIELDS:
+        if name == 'mpry':
+            if record['mid'] != MISSING_INT:
+                parts.append('mpry:0,0,0')
+            continue
+
+        value = record[name]
+        if name in Tello.FLOAT_STATE_FIELDS:
+            if not np.isnan(value):
+                parts.append('{}:{:.2f}'.format(name, value))
+        elif value != MISSING_INT:
+            parts.append('{}:{}'.format(name, int(value)))
+
+    return (';'.join(parts) + ';\r\n').encode('ASCII')
@@ -0,0 +1,173 @@
+"""하나의 비디오 스트림을 여러 소비자에게 나누어 주는 프레임 허브.
+Fans out the frames of one BackgroundFrameRead to multiple consumers.
+"""
+
+from collections import deque
+from threading import Thread, Condition, Lock, Event
+from typing import Optional, List
+
+from .tello import BackgroundFrameRead, TimestampedFrame
+
+
+class FrameSubscription:
+    """FrameHub 구독자 한 명의 수신함. 허브 스레드는 절대 이 수신함에서 대기하지
+    않으므로 느린 소비자가 다른 소비자(예: 화면 표시)를 막지 못합니다.
+    The mailbox of one FrameHub subscriber. The hub never blocks on it.
+    """
+
+    def __init__(self, name: str, policy: str, maxsize: int, every: int):
+        self.name = name
+        self.policy = policy
+        self.every = every
+        self.condition = Condition()
+        self.frames = deque([], 1 if policy == FrameHub.LATEST else maxsize)
+        self.closed = False
+
+        self.offered = 0    # 허브가 전달을 시도한 프레임 수
+        self.delivered = 0  # 소비자가 가져간 프레임 수
+        self.dropped = 0    # 소비자가 가져가기 전에 버려진 프레임 수
+
+    def offer(self, item: TimestampedFrame):
+        """허브 스레드가 새 프레임을 넘겨줍니다. 내부 메서드로, 직접 호출하지 않습니다.
+        """
+        self.offered += 1
+        if self.policy == FrameHub.EVERY_NTH and self.offered % self.every != 0:
+            return
+
+        with self.condition:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1  # deque가 가장 오래된 프레임을 버립니다
+            self.frames.append(item)
+            self.condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[TimestampedFrame]:
+        """다음 프레임을 가져옵니다. timeout 안에 프레임이 없거나 구독이 닫히면 None.
+        반환되는 프레임 배열은 다른 구독자와 공유되므로 읽기 전용입니다.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.frames or self.closed, timeout):
+                return None
+            if not self.frames:
+                return None
+            self.delivered += 1
+            return self.frames.popleft()
+
+    def close(self):
+        """구독을 닫고 대기 중인 get()을 깨웁니다.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def __iter__(self):
+        """구독이 닫힐 때까지 프레임을 반복합니다.
+
+        ```python
+        for item in subscription:
+            detector(item.frame)
+        ```
+        """
+        while True:
+            item = self.get()
+            if item is None:
+                return
+            yield item
+
+
+class FrameHub:
+    """
+    BackgroundFrameRead의 프레임을 여러 구독자(녹화기, 객체 감지기, MJPEG 서버, GUI 등)에게
+    복사 없이 전달합니다. 각 구독자는 자신의 드롭 정책을 가집니다:
+
+    - FrameHub.LATEST: 가장 최근 프레임 하나만 보관
+    - FrameHub.QUEUE: maxsize개까지 보관하고 가득 차면 가장 오래된 프레임을 버림
+    - FrameHub.EVERY_NTH: every번째 프레임만 maxsize개까지 보관
+
+    모든 구독자는 같은 디코딩 배열을 가리키는 읽기 전용 뷰를 받습니다. BackgroundFrameRead는
+    프레임마다 새 배열을 만들고 다시 쓰지 않으므로, QUEUE / EVERY_NTH 구독자가 maxsize개의
+    프레임을 쌓아 두어도 나중 프레임에 덮어써지지 않습니다. 배열을 재사용하는 프레임
+    소스를 연결하려면 구독자가 보관하는 프레임 수보다 재사용 주기가 길어야 합니다.
+
+    ```python
+    hub = FrameHub(tello.get_frame_read())
+    display = hub.subscribe('display', FrameHub.LATEST)
+    detector = hub.subscribe('detector', FrameHub.EVERY_NTH, every=5)
+    hub.start()
+
+    item = display.get(timeout=1)
+    ```
+    """
+
+    LATEST = 'latest'
+    QUEUE = 'queue'
+    EVERY_NTH = 'every_nth'
+
+    def __init__(self, frame_read: BackgroundFrameRead):
+        self.frame_read = frame_read
+        self.subscriptions: List[FrameSubscription] = []
+        self.lock = Lock()
+        self.stopped = Event()
+        self.worker = Thread(target=self.dispatch_loop, args=(), daemon=True)
+
+    def subscribe(self, name: str, policy: str = LATEST, maxsize: int = 8, every: int = 1) -> FrameSubscription:
+        """새 구독자를 등록합니다.
+
+        Arguments:
+            name: 구독자 이름 (통계 표시용)
+            policy: FrameHub.LATEST, FrameHub.QUEUE 또는 FrameHub.EVERY_NTH
+            maxsize: QUEUE / EVERY_NTH 정책의 최대 보관 프레임 수
+            every: EVERY_NTH 정책에서 전달할 프레임 간격
+        """
+        if policy not in (FrameHub.LATEST, FrameHub.QUEUE, FrameHub.EVERY_NTH):
+            raise ValueError("Unknown frame hub policy: '{}'".format(policy))
+
+        subscription = FrameSubscription(name, policy, maxsize, max(1, every))
+        with self.lock:
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription):
+        """구독을 해제하고 닫습니다.
+        """
+        with self.lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+        subscription.close()
+
+    def start(self):
+        """프레임 분배 스레드를 시작합니다.
+        """
+        self.worker.start()
+
+    def dispatch_loop(self):
+        """새 프레임마다 모든 구독자에게 읽기 전용 뷰를 넘겨주는 스레드 워커 함수
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        last_seq = 0
+        while not self.stopped.is_set():
+            item = self.frame_read.wait_for_next(last_seq, timeout=0.5)
+            if item is None:
+                continue
+            last_seq = item.sequence
+
+            # 구독자끼리 공유하는 배열을 수정하지 못하도록 읽기 전용 뷰를 넘깁니다.
+            # 리더는 프레임마다 새 배열을 만들므로 보관된 뷰가 덮어써지지 않습니다
+            view = item.frame.view()
+            view.flags.writeable = False
+            shared = item._replace(frame=view)
+
+            # 구독 목록은 교체 방식으로 갱신되므로 잠금 없이 순회할 수 있습니다
+            for subscription in self.subscriptions:
+                subscription.offer(shared)
+
+    def stats(self) -> dict:
+        """구독자별 전달/드롭 통계
+        """
+        return {s.name: {'offered': s.offered, 'delivered': s.delivered, 'dropped': s.dropped}
+                for s in self.subscriptions}
+
+    def stop(self):
+        """분배 스레드를 중지하고 모든 구독을 닫습니다.
+        """
+        self.stopped.set()
+        for subscription in self.subscriptions:
+            subscription.close()
@@ -0,0 +1,89 @@
+"""드론의 H.264 스트림을 디코딩/재인코딩 없이 파일로 저장하는 녹화기.
+Records the drone's H.264 stream to MP4/MKV without decoding or re-encoding.
+"""
+
+import time
+from fractions import Fraction
+from threading import Lock
+from typing import Optional
+
+
+class H264Recorder:
+    """
+    BackgroundFrameRead가 수신한 H.264 패킷을 그대로 MP4/MKV 컨테이너에 리먹싱합니다.
+    디코딩과 재인코딩을 하지 않으므로 CPU를 거의 사용하지 않고 원본 비트레이트의
+    화질이 유지됩니다. Tello의 원시 H.264 스트림에는 타임스탬프가 없으므로 패킷 수신
+    시각으로 PTS를 만듭니다. 재생 가능한 파일이 되도록 첫 키프레임부터 기록합니다.
+
+    보통 직접 만들지 않고 BackgroundFrameRead.start_recording()을 사용합니다.
+    """
+
+    TIME_BASE = Fraction(1, 90000)
+
+    def __init__(self, path: str, input_stream, container_format: Optional[str] = None):
+        """
+        매개변수:
+            path: 저장할 파일 경로 (.mp4 / .mkv)
+            input_stream: 패킷을 받을 입력 비디오 스트림 (코덱 설정을 복사)
+            container_format: 컨테이너 포맷 (None이면 확장자로 결정)
+        """
+        # PyAV는 import 시간이 길어 녹화를 시작할 때 import 합니다
+        import av
+
+        self.path = path
+        self.lock = Lock()
+        self.output = av.open(path, 'w', format=container_format)
+
+        if hasattr(self.output, 'add_stream_from_template'):
+            self.stream = self.output.add_stream_from_template(input_stream)
+        else:
+            self.stream = self.output.add_stream(template=input_stream)
+        self.stream.time_base = H264Recorder.TIME_BASE
+
+        self.started_at: Optional[float] = None
+        self.last_pts = -1
+        self.packets_written = 0
+        self.bytes_written = 0
+        self.closed = False
+
+    def write(self, packet, received_at: Optional[float] = None):
+        """패킷 하나를 기록합니다. received_at은 time.monotonic() 기준 수신 시각입니다.
+        패킷의 stream이 출력 스트림으로 바뀌므로 디코딩이 끝난 뒤에 호출해야 합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        if packet.size == 0:
+            return  # 스트림 끝을 알리는 빈 패킷
+
+        if received_at is None:
+            received_at = time.monotonic()
+
+        with self.lock:
+            if self.closed:
+                return
+
+            if self.started_at is None:
+                if not packet.is_keyframe:
+                    return
+                self.started_at = received_at
+
+            # 수신 시각 기반 PTS, 같은 시각에 도착한 패킷도 단조 증가하도록 보정
+            pts = max(int((received_at - self.started_at) / H264Recorder.TIME_BASE), self.last_pts + 1)
+            self.last_pts = pts
+
+            packet.pts = pts
+            packet.dts = pts
+            packet.time_base = H264Recorder.TIME_BASE
+            packet.stream = self.stream
+            self.output.mux(packet)
+
+            self.packets_written += 1
+            self.bytes_written += packet.size
+
+    def close(self):
+        """파일을 마무리하고 닫습니다.
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.output.close()
@@ -0,0 +1,17 @@
+"""실제 드론 없이 djitellopy를 시험하기 위한 로컬 Tello 시뮬레이터.
+Local Tello simulator for offline testing and benchmarking.
+"""
+
+from .model import DroneModel
+
+
+def __getattr__(name):
+    # 안무 검증처럼 운동 모델만 쓰는 곳에서 소켓, 스레드, 비디오 모듈을 불러오지 않도록
+    # 시뮬레이터는 처음 사용할 때 가져옵니다
+    if name == 'TelloSimulator':
+        from .simulator import TelloSimulator
+        return TelloSimulator
+    if name == 'generate_test_video':
+        from .video import generate_test_video
+        return generate_test_video
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
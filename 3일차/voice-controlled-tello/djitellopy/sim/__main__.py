@@ -0,0 +1,61 @@
+"""명령줄에서 시뮬레이터를 실행합니다.
+
+    python -m djitellopy.sim --latency 0.02 --jitter 0.01 --video sim.h264
+    python -m djitellopy.sim --host 127.0.0.2 --count 50
+"""
+
+import argparse
+import ipaddress
+import logging
+import os
+import time
+
+from ..tello import Tello
+from . import TelloSimulator, generate_test_video
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m djitellopy.sim', description='Local Tello SDK simulator')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind the control port (8889) to')
+    parser.add_argument('--count', type=int, default=1,
+                        help='number of drones, bound to consecutive addresses starting at --host')
+    parser.add_argument('--latency', type=float, default=0.0, help='response latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency in seconds')
+    parser.add_argument('--loss', type=float, default=0.0, help='command packet loss probability (0-1)')
+    parser.add_argument('--state-rate', type=float, default=10.0, help='state packets per second')
+    parser.add_argument('--video', default=None, help='Annex-B H.264 file to stream after streamon')
+    parser.add_argument('--generate-video', action='store_true', help='create --video first if it does not exist')
+    parser.add_argument('--time-scale', type=float, default=1.0, help='maneuver duration multiplier')
+    parser.add_argument('--seed', type=int, default=None, help='random seed for jitter and loss')
+    parser.add_argument('--replay', default=None, help='state recording to replay instead of the simulated state')
+    parser.add_argument('--replay-speed', type=float, default=1.0, help='replay speed multiplier')
+    args = parser.parse_args()
+
+    Tello.LOGGER.setLevel(logging.INFO)
+    if args.video and args.generate_video and not os.path.exists(args.video):
+        generate_test_video(args.video)
+
+    first = ipaddress.ip_address(args.host)
+    simulators = []
+    for i in range(args.count):
+        host = str(first + i)
+        simulators.append(TelloSimulator(host, latency=args.latency, jitter=args.jitter, loss=args.loss,
+                                         state_rate=args.state_rate, video_path=args.video,
+                                         time_scale=args.time_scale, seed=args.seed,
+                                         serial_number='0TQSIM{:09d}'.format(i + 1),
+                                         state_replay=args.replay, replay_speed=args.replay_speed))
+    try:
+        for simulator in simulators:
+            simulator.start()
+            Tello.LOGGER.info("Simulated Tello listening on {}:{}".format(simulator.host, Tello.CONTROL_UDP_PORT))
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for simulator in simulators:
+            simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""시뮬레이터 드론의 간단한 운동 모델.
+Simple kinematic model of a simulated Tello.
+"""
+
+import math
+from threading import Lock, Event
+from typing import Optional
+
+
+class Maneuver:
+    """일정 시간 동안 일정한 속도로 움직이는 기동 (move, go, cw, takeoff 등)
+    """
+
+    def __init__(self, duration: float, vx: float = 0.0, vy: float = 0.0, vz: float = 0.0,
+                 yaw_rate: float = 0.0, on_finish=None):
+        self.remaining = duration
+        self.vx, self.vy, self.vz = vx, vy, vz  # cm/s, 월드 좌표계
+        self.yaw_rate = yaw_rate  # deg/s
+        self.on_finish = on_finish
+        self.finished = Event()
+        self.cancelled = False  # stop/emergency 등으로 중단된 경우 True
+
+
+class DroneModel:
+    """
+    위치(cm), 요(deg), 속도와 배터리를 가진 점 질량 모델. rc 명령은 스틱 값에 비례한
+    속도로, move/go/cw 같은 명령은 Maneuver로 적분됩니다. 좌표계: x 앞, y 왼쪽, z 위.
+    """
+
+    RC_MAX_SPEED = 100.0      # rc 100일 때 속도 (cm/s)
+    RC_MAX_YAW_RATE = 100.0   # rc 100일 때 회전 속도 (deg/s)
+    YAW_RATE = 90.0           # cw/ccw 회전 속도 (deg/s)
+    TAKEOFF_HEIGHT = 80.0     # 이륙 후 높이 (cm)
+    TAKEOFF_TIME = 2.0        # 이륙에 걸리는 시간 (s)
+    FLIP_TIME = 1.0           # 플립에 걸리는 시간 (s)
+    BATTERY_DRAIN = 0.1       # 비행 중 초당 배터리 소모량 (%)
+    # 이동 명령별 기체 좌표 방향 (앞, 왼쪽, 위). 시뮬레이터와 안무 검증이 함께 사용합니다
+    MOVE_COMMANDS = {
+        'forward': (1, 0, 0), 'back': (-1, 0, 0), 'left': (0, 1, 0),
+        'right': (0, -1, 0), 'up': (0, 0, 1), 'down': (0, 0, -1),
+    }
+
+    def __init__(self, time_scale: float = 1.0):
+        """
+        매개변수:
+            time_scale: 기동 시간 배율 (0.01이면 이동 명령이 100배 빨리 끝남)
+        """
+        self.time_scale = time_scale
+        self.lock = Lock()
+
+        self.x = self.y = self.z = 0.0
+        self.yaw = 0.0
+        self.vx = self.vy = self.vz = 0.0
+        self.speed = 100.0  # speed 명령으로 설정되는 이동 속도 (cm/s)
+        self.rc = (0, 0, 0, 0)
+        self.flying = False
+        self.battery = 100.0
+        self.flight_time = 0.0
+        self.maneuver: Optional[Maneuver] = None
+
+    def set_rc(self, left_right: int, forward_backward: int, up_down: int, yaw: int):
+        with self.lock:
+            self.rc = tuple(max(-100, min(100, v)) for v in (left_right, forward_backward, up_down, yaw))
+
+    def body_to_world(self, forward: float, left: float):
+        """기체 좌표(앞, 왼쪽)를 월드 좌표(x, y)로 변환"""
+        rad = math.radians(self.yaw)
+        return (forward * math.cos(rad) + left * math.sin(rad),
+                -forward * math.sin(rad) + left * math.cos(rad))
+
+    def start_maneuver(self, maneuver: Maneuver) -> Maneuver:
+        """진행 중인 기동을 취소하고 새 기동을 시작합니다"""
+        with self.lock:
+            self.cancel_locked()
+            self.maneuver = maneuver
+        return maneuver
+
+    def move_relative(self, forward: float, left: float, up: float, speed: float) -> Maneuver:
+        """기체 좌표 기준 상대 이동 (move, go, curve)"""
+        distance = math.sqrt(forward ** 2 + left ** 2 + up ** 2)
+        duration = distance / max(speed, 1.0) * self.time_scale
+        if duration <= 0:
+            duration = 1e-3
+        wx, wy = self.body_to_world(forward, left)
+        return self.start_maneuver(Maneuver(duration, wx / duration, wy / duration, up / duration))
+
+    def rotate(self, degrees: float) -> Maneuver:
+        """시계 방향이 양수인 회전 (cw/ccw)"""
+        duration = max(abs(degrees) / DroneModel.YAW_RATE * self.time_scale, 1e-3)
+        return self.start_maneuver(Maneuver(duration, yaw_rate=degrees / duration))
+
+    def takeoff(self) -> Maneuver:
+        duration = DroneModel.TAKEOFF_TIME * self.time_scale
+        with self.lock:
+            self.flying = True
+        return self.start_maneuver(Maneuver(duration, vz=(DroneModel.TAKEOFF_HEIGHT - self.z) / duration))
+
+    def land(self) -> Maneuver:
+        duration = max(self.z / 50.0 * self.time_scale, 1e-3)
+
+        def landed():
+            self.flying = False
+            self.z = 0.0
+
+        return self.start_maneuver(Maneuver(duration, vz=-self.z / duration, on_finish=landed))
+
+    def hold(self, seconds: float) -> Maneuver:
+        """제자리에서 시간만 흐르는 기동 (flip 등)"""
+        return self.start_maneuver(Maneuver(max(seconds * self.time_scale, 1e-3)))
+
+    def cancel_locked(self):
+        if self.maneuver is not None:
+            self.maneuver.cancelled = True
+            self.maneuver.finished.set()
+            self.maneuver = None
+
+    def stop(self):
+        """진행 중인 기동과 rc 입력을 멈추고 호버링합니다"""
+        with self.lock:
+            self.cancel_locked()
+            self.rc = (0, 0, 0, 0)
+
+    def emergency(self):
+        """모터를 즉시 정지합니다"""
+        with self.lock:
+            self.cancel_locked()
+            self.rc = (0, 0, 0, 0)
+            self.flying = False
+            self.z = 0.0
+            self.vx = self.vy = self.vz = 0.0
+
+    def step(self, dt: float):
+        """dt초만큼 상태를 적분합니다"""
+        with self.lock:
+            maneuver = self.maneuver
+            if maneuver is not None:
+                step = min(dt, maneuver.remaining)
+                self.vx, self.vy, self.vz = maneuver.vx, maneuver.vy, maneuver.vz
+                yaw_rate = maneuver.yaw_rate
+                maneuver.remaining -= step
+            elif self.flying:
+                step = dt
+                left_right, forward_backward, up_down, yaw = self.rc
+                scale = DroneModel.RC_MAX_SPEED / 100
+                self.vx, self.vy = self.body_to_world(forward_backward * scale, -left_right * scale)
+                self.vz = up_down * scale
+                yaw_rate = yaw * DroneModel.RC_MAX_YAW_RATE / 100
+            else:
+                step = dt
+                self.vx = self.vy = self.vz = 0.0
+                yaw_rate = 0.0
+
+            self.x += self.vx * step
+            self.y += self.vy * step
+            self.z = max(0.0, self.z + self.vz * step)
+            self.yaw = (self.yaw + yaw_rate * step + 180) % 360 - 180
+
+            if self.flying:
+                self.flight_time += dt
+                self.battery = max(0.0, self.battery - DroneModel.BATTERY_DRAIN * dt)
+
+            if maneuver is not None and maneuver.remaining <= 0:
+                self.maneuver = None
+                self.vx = self.vy = self.vz = 0.0
+                if maneuver.on_finish is not None:
+                    maneuver.on_finish()
+                maneuver.finished.set()
+
+    def state_line(self) -> bytes:
+        """Tello 상태 패킷 형식의 한 줄"""
+        with self.lock:
+            # Tello 좌표계에서 vgy는 오른쪽이 양수입니다
+            return ('mid:-1;x:0;y:0;z:0;mpry:0,0,0;pitch:0;roll:0;yaw:{yaw};'
+                    'vgx:{vgx};vgy:{vgy};vgz:{vgz};templ:60;temph:62;tof:{tof};h:{h};bat:{bat};'
+                    'baro:{baro:.2f};time:{time};agx:0.00;agy:0.00;agz:-1000.00;\r\n').format(
+                yaw=int(round(self.yaw)),
+                vgx=int(round(self.vx / 10)), vgy=int(round(-self.vy / 10)), vgz=int(round(self.vz / 10)),
+                tof=int(round(self.z)) + 10, h=int(round(self.z)), bat=int(self.battery),
+                baro=self.z / 100, time=int(self.flight_time)).encode('ASCII')
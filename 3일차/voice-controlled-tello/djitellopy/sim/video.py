@@ -0,0 +1,119 @@
+"""시뮬레이터의 H.264 비디오 스트림.
+H.264 video stream of the simulator.
+"""
+
+import socket
+import time
+from threading import Thread, Event
+from typing import List, Tuple
+
+from ..tello import Tello
+
+# Tello는 H.264 스트림을 1460바이트 이하의 UDP 패킷으로 나누어 보냅니다
+VIDEO_DATAGRAM_SIZE = 1460
+
+
+def generate_test_video(path: str, seconds: float = 2.0, width: int = 960, height: int = 720,
+                        fps: int = 30) -> str:
+    """시뮬레이터가 반복 재생할 수 있는 Annex-B H.264 테스트 영상을 만듭니다.
+
+    매개변수:
+        path: 저장할 파일 경로 (.h264)
+        seconds: 영상 길이
+        width, height: 해상도 (Tello 기본값 960x720)
+        fps: 초당 프레임 수
+    """
+    # 비디오를 쓰지 않는 시뮬레이터 실행에서는 PyAV와 numpy를 불러오지 않습니다
+    import av
+    import numpy as np
+
+    output = av.open(path, 'w', format='h264')
+    codec = 'libx264' if 'libx264' in av.codecs_available else 'h264'
+    stream = output.add_stream(codec, rate=fps)
+    stream.width = width
+    stream.height = height
+    stream.pix_fmt = 'yuv420p'
+    stream.options = {'g': str(fps), 'bf': '0', 'tune': 'zerolatency'}
+
+    frame_count = int(seconds * fps)
+    for i in range(frame_count):
+        # 움직이는 세로 막대가 있는 그라데이션
+        image = np.zeros((height, width, 3), dtype=np.uint8)
+        image[:, :, 0] = np.linspace(0, 255, width, dtype=np.uint8)
+        image[:, :, 1] = (i * 255 // max(frame_count, 1))
+        bar = (i * width // max(frame_count, 1))
+        image[:, bar:bar + width // 20, :] = 255
+
+        frame = av.VideoFrame.from_ndarray(image, format='rgb24')
+        for packet in stream.encode(frame):
+            output.mux(packet)
+
+    for packet in stream.encode():
+        output.mux(packet)
+    output.close()
+    return path
+
+
+def load_access_units(path: str) -> Tuple[List[bytes], float]:
+    """H.264 파일을 프레임 단위 바이트 목록과 fps로 읽습니다"""
+    import av
+
+    container = av.open(path)
+    stream = container.streams.video[0]
+    fps = float(stream.guessed_rate or stream.average_rate or 30)
+    units = [bytes(packet) for packet in container.demux(stream) if packet.size]
+    container.close()
+    return units, fps
+
+
+class VideoStreamer:
+    """
+    H.264 파일을 실제 Tello처럼 UDP 패킷으로 나누어 fps에 맞춰 반복 전송합니다.
+    """
+
+    def __init__(self, path: str, source_host: str):
+        self.units, self.fps = load_access_units(path)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((source_host, 0))
+        self.target = None
+        self.stopped = Event()
+        self.worker = None
+        self.frames_sent = 0
+
+    def start(self, target):
+        """target (ip, port)로 전송을 시작합니다"""
+        self.target = target
+        if self.worker is not None and self.worker.is_alive():
+            return
+        self.stopped.clear()
+        self.worker = Thread(target=self.send_loop, daemon=True)
+        self.worker.start()
+
+    def send_loop(self):
+        interval = 1 / self.fps
+        next_send = time.monotonic()
+        while not self.stopped.is_set():
+            for unit in self.units:
+                if self.stopped.is_set():
+                    return
+                try:
+                    for offset in range(0, len(unit), VIDEO_DATAGRAM_SIZE):
+                        self.socket.sendto(unit[offset:offset + VIDEO_DATAGRAM_SIZE], self.target)
+                except OSError as e:
+                    Tello.LOGGER.error(e)
+                    return
+                self.frames_sent += 1
+
+                next_send += interval
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    self.stopped.wait(delay)
+                else:
+                    next_send = time.monotonic()
+
+    def stop(self):
+        self.stopped.set()
+
+    def close(self):
+        self.stop()
+        self.socket.close()
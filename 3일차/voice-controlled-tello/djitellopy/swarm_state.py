@@ -0,0 +1,135 @@
+"""스웜 전체의 최신 상태를 드론 × 필드 NumPy 행렬 하나로 유지하는 집계기.
+Swarm state aggregated into one NumPy matrix of drones x fields.
+"""
+
+import time
+from datetime import datetime
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .tello import Tello, TelloState, StateListener
+
+
+class SwarmStateMatrix:
+    """
+    드론마다 한 행, 상태 필드마다 한 열인 행렬에 가장 최근 상태 패킷을 기록합니다.
+    각 드론의 상태 수신 스레드가 패킷을 받을 때 자기 행만 갱신하므로, 질의할 때는
+    드론별 getter 호출이나 딕셔너리 조회 없이 벡터 연산 몇 번으로 끝납니다.
+    아직 상태를 받지 못한 드론과 패킷에 없는 필드는 nan입니다.
+
+    보통 직접 만들지 않고 TelloSwarm.get_state_matrix()나 TelloSwarm.state_matrix()를 사용합니다.
+
+    ```python
+    values, ages = swarm.state_matrix(('bat', 'h', 'temph'))
+    if swarm.min_battery() < 20 or swarm.any_stale(0.5):
+        swarm.land()
+    ```
+    """
+
+    COLUMNS = Tello.INT_STATE_FIELDS + Tello.FLOAT_STATE_FIELDS
+    INDEX = {name: index for index, name in enumerate(COLUMNS)}
+    # TelloState.data에서 각 열의 위치
+    SOURCE = tuple(TelloState.INDEX[name] for name in COLUMNS)
+
+    def __init__(self, tellos: Sequence[Tello]):
+        """
+        매개변수:
+            tellos: 행 순서대로의 드론 목록
+        """
+        self.lock = Lock()
+        self.values = np.full((len(tellos), len(SwarmStateMatrix.COLUMNS)), np.nan)
+        # 마지막 패킷을 받은 시각 (time.monotonic()), 받은 적이 없으면 -inf
+        self.updated = np.full(len(tellos), -np.inf)
+        self.listeners: List[StateListener] = []
+
+        for row, tello in enumerate(tellos):
+            state = tello.get_current_state()
+            if isinstance(state, TelloState):
+                age = (datetime.now() - state.received_at).total_seconds() if state.received_at else 0.0
+                self.update(row, state, time.monotonic() - age)
+            self.listeners.append(tello.add_state_listener(StateListener(self.updater(row))))
+
+    def updater(self, row: int):
+        """row 행을 갱신하는 상태 콜백.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        return lambda state: self.update(row, state)
+
+    def update(self, row: int, state: TelloState, timestamp: Optional[float] = None):
+        """상태 패킷 하나로 한 행을 덮어씁니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        data = state.data
+        values = [data[index] for index in SwarmStateMatrix.SOURCE]
+        if None in values:
+            values = [np.nan if value is None else value for value in values]
+
+        with self.lock:
+            self.values[row] = values
+            self.updated[row] = timestamp
+
+    def column_indices(self, fields: Sequence[str]) -> List[int]:
+        try:
+            return [SwarmStateMatrix.INDEX[field] for field in fields]
+        except KeyError as e:
+            raise ValueError("Unknown state field: {} (expected one of {})"
+                             .format(e, ', '.join(SwarmStateMatrix.COLUMNS)))
+
+    def snapshot(self, fields: Optional[Sequence[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(값 행렬, 경과 시간) 복사본을 반환합니다.
+
+        매개변수:
+            fields: 열로 사용할 필드 (None이면 COLUMNS 전체)
+        반환값:
+            (n_drones, n_fields) 값 행렬과 드론별 마지막 패킷 이후 경과 시간(초, 받은 적이 없으면 inf)
+        """
+        columns = None if fields is None else self.column_indices(fields)
+        now = time.monotonic()
+        with self.lock:
+            values = self.values.copy() if columns is None else self.values[:, columns]
+            ages = now - self.updated
+        return values, ages
+
+    def column(self, field: str) -> np.ndarray:
+        """한 필드의 드론별 값 (복사본)"""
+        index = self.column_indices((field,))[0]
+        with self.lock:
+            return self.values[:, index].copy()
+
+    def ages(self) -> np.ndarray:
+        """드론별 마지막 패킷 이후 경과 시간 (초, 받은 적이 없으면 inf)"""
+        now = time.monotonic()
+        with self.lock:
+            return now - self.updated
+
+    def min_battery(self) -> float:
+        """가장 낮은 배터리 잔량 (%). 상태를 받은 드론이 없으면 nan"""
+        battery = self.column('bat')
+        # fmin은 nan을 건너뛰므로 모두 nan일 때만 nan이 됩니다
+        return float(np.fmin.reduce(battery)) if len(battery) else float('nan')
+
+    def any_stale(self, max_age: float) -> bool:
+        """max_age초 넘게 상태 패킷이 오지 않은 드론이 있는지 (받은 적이 없는 드론 포함)"""
+        return bool(np.any(self.ages() > max_age))
+
+    def centroid(self) -> np.ndarray:
+        """미션 패드를 인식한 드론들의 평균 위치 (x, y, z; cm).
+        SDK가 알려주는 절대 위치는 미션 패드 좌표뿐이므로 enable_mission_pads()가 필요합니다.
+        미션 패드를 인식한 드론이 없으면 nan입니다.
+        """
+        values, _ = self.snapshot(('mid', 'x', 'y', 'z'))
+        located = values[values[:, 0] > 0, 1:]
+        if not len(located):
+            return np.full(3, np.nan)
+        return located.mean(axis=0)
+
+    def close(self):
+        """상태 구독을 해제합니다"""
+        for listener in self.listeners:
+            listener.cancel()
+        self.listeners = []
@@ -0,0 +1,362 @@
+"""여러 드론의 명령과 상태 패킷을 스레드 하나로 처리하는 스웜 전송 계층.
+Swarm transport driving many drones from one socket and one thread.
+"""
+
+import heapq
+import itertools
+import selectors
+import socket
+import time
+from threading import Thread, Lock, current_thread
+from typing import Callable, Dict, Optional
+
+from .tello import Tello, CommandScheduler, CommandRequest, BroadcastGate
+
+
+class MultiplexedScheduler(CommandScheduler):
+    """
+    CommandScheduler와 같은 우선순위 대기열을 사용하지만 워커 스레드가 없습니다.
+    SwarmTransport의 이벤트 루프가 드론마다 진행 중인 명령 하나를 작은 상태 기계로
+    처리합니다: 대기 → (명령 간격) → 전송 → 응답 또는 타임아웃 → 다음 명령.
+
+    보통 직접 만들지 않고 SwarmTransport를 사용하는 Tello가 자동으로 만듭니다.
+    """
+
+    def __init__(self, tello: Tello, transport: 'SwarmTransport'):
+        super().__init__(tello)
+        self.worker = None  # 이벤트 루프가 워커 스레드를 대신합니다
+        self.transport = transport
+        self.address = tello.address
+        self.last_response = 0.0  # 마지막 응답을 받은 시각 (time.monotonic())
+        self.sent_at = 0.0
+        self.dispatch_scheduled = False
+
+    def start(self):
+        self.transport.register(self)
+
+    def submit(self, command: str, timeout=None, gate: Optional[BroadcastGate] = None,
+               epoch: Optional[int] = None):
+        future = super().submit(command, timeout, gate, epoch)
+        self.transport.wake(self)
+        return future
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        self.transport.call_later(delay, callback)
+
+    def is_worker_thread(self) -> bool:
+        # 응답을 처리하는 스레드는 전송 계층의 이벤트 루프입니다
+        return current_thread() is self.transport.worker
+
+    def stop(self):
+        super().stop()
+        self.transport.unregister(self)
+
+    def run(self):
+        raise RuntimeError('MultiplexedScheduler is driven by its SwarmTransport')
+
+
+class SwarmTransport:
+    """
+    스웜 전체가 함께 사용하는 제어/상태 소켓과 이벤트 루프 스레드 하나.
+    TelloTransport는 수신 스레드 2개를, CommandScheduler는 드론마다 워커 스레드를
+    만들고 각 호출자가 응답을 기다리며 블록되지만, SwarmTransport는 하나의 셀렉터
+    스레드가 응답과 상태 패킷을 보낸 주소로 나누어 드론별 상태 기계를 진행합니다.
+    드론이 100대를 넘어도 스레드 수는 늘지 않고 CPU와 메모리도 거의 일정합니다.
+
+    명령은 Future로 다루면 호출자 스레드도 필요 없습니다
+    (Tello.send_control_command_async, TelloSwarm.send_all). Future의 콜백은 이벤트 루프가
+    아닌 콜백 스레드에서 실행되므로 콜백 안에서 다른 명령을 보내도 됩니다 (CommandFuture).
+
+    ```python
+    transport = SwarmTransport()
+    swarm = TelloSwarm.discover('192.168.0.0/24', transport=transport)
+    swarm.send_all('takeoff')
+    ...
+    swarm.end()
+    transport.close()
+    ```
+    """
+
+    def __init__(self, control_port: int = 0, state_port: int = 0):
+        """
+        매개변수:
+            control_port: 제어 소켓 포트 (0이면 임시 포트)
+            state_port: 상태 소켓 포트 (0이면 임시 포트)
+        """
+        self.drones = {}
+        self.channels: Dict[str, MultiplexedScheduler] = {}
+
+        self.control_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.control_socket.bind(("", control_port))
+        self.control_socket.setblocking(False)
+        self.state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.state_socket.bind(("", state_port))
+        self.state_socket.setblocking(False)
+        self.state_port = self.state_socket.getsockname()[1]
+
+        # 다른 스레드에서 submit / call_later가 호출되면 이벤트 루프를 깨웁니다
+        self.wakeup_receive, self.wakeup_send = socket.socketpair()
+        self.wakeup_receive.setblocking(False)
+        self.wakeup_send.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.control_socket, selectors.EVENT_READ, self.read_responses)
+        self.selector.register(self.state_socket, selectors.EVENT_READ, self.read_states)
+        self.selector.register(self.wakeup_receive, selectors.EVENT_READ, self.read_wakeup)
+
+        self.lock = Lock()
+        self.ready = set()  # 대기열에 새 명령이 들어온 채널
+        self.timers = []    # (시각, 순번, 콜백) 힙
+        self.timer_sequence = itertools.count()
+        self.signalled = False
+        self.closed = False
+
+        self.worker = Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def create_scheduler(self, tello: Tello) -> MultiplexedScheduler:
+        """이 전송 계층을 사용하는 드론의 스케줄러를 만듭니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        return MultiplexedScheduler(tello, self)
+
+    def register(self, channel: MultiplexedScheduler):
+        with self.lock:
+            self.channels[channel.address[0]] = channel
+
+    def unregister(self, channel: MultiplexedScheduler):
+        with self.lock:
+            if self.channels.get(channel.address[0]) is channel:
+                del self.channels[channel.address[0]]
+
+    def wake(self, channel: Optional[MultiplexedScheduler] = None):
+        """이벤트 루프를 깨웁니다. channel이 주어지면 그 대기열을 확인합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        with self.lock:
+            if channel is not None:
+                self.ready.add(channel)
+            if self.signalled:
+                return
+            self.signalled = True
+        try:
+            self.wakeup_send.send(b'\0')
+        except OSError:
+            pass  # 닫힌 뒤
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        """delay초 뒤에 이벤트 루프에서 callback을 호출합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        with self.lock:
+            heapq.heappush(self.timers, (time.monotonic() + delay, next(self.timer_sequence), callback))
+        self.wake()
+
+    def run(self):
+        """소켓 이벤트, 새 명령, 타이머를 처리하는 이벤트 루프 스레드 워커 함수
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        while not self.closed:
+            with self.lock:
+                timeout = max(0.0, self.timers[0][0] - time.monotonic()) if self.timers else None
+
+            try:
+                events = self.selector.select(timeout)
+            except OSError:
+                break  # 닫힌 뒤
+
+            for key, _ in events:
+                self.guarded(key.data)
+
+            with self.lock:
+                ready = self.ready
+                self.ready = set()
+            for channel in ready:
+                self.guarded(lambda: self.dispatch(channel))
+
+            now = time.monotonic()
+            due = []
+            with self.lock:
+                while self.timers and self.timers[0][0] <= now:
+                    due.append(heapq.heappop(self.timers)[2])
+            for callback in due:
+                self.guarded(callback)
+
+    @staticmethod
+    def guarded(callback: Callable[[], None]):
+        """콜백의 예외가 이벤트 루프를 멈추지 않도록 합니다"""
+        try:
+            callback()
+        except Exception as e:
+            Tello.LOGGER.error(e)
+
+    def read_wakeup(self):
+        with self.lock:
+            self.signalled = False
+        try:
+            while self.wakeup_receive.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def read_responses(self):
+        """제어 소켓의 응답을 보낸 주소의 드론에 전달합니다"""
+        while True:
+            try:
+                data, address = self.control_socket.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                if self.closed:
+                    return
+                Tello.LOGGER.debug('Control socket error: {}'.format(e))
+                continue
+
+            channel = self.channels.get(address[0])
+            if channel is not None:
+                self.complete(channel, data)
+
+    def read_states(self):
+        """상태 패킷을 보낸 주소의 드론에 기록합니다"""
+        while True:
+            try:
+                data, address = self.state_socket.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                if self.closed:
+                    return
+                Tello.LOGGER.debug('State socket error: {}'.format(e))
+                continue
+
+            drone = self.drones.get(address[0])
+            if drone is not None:
+                Tello.handle_state_packet(drone, data)
+
+    def dispatch(self, channel: MultiplexedScheduler):
+        """보낼 수 있으면 채널의 다음 명령을 보냅니다 (대기 → 전송).
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        with channel.condition:
+            if channel.in_flight is not None or channel.stopped or not any(channel.lanes):
+                return
+
+            # 응답 직후 바로 보내면 드론이 응답하지 않으므로 명령 사이 간격을 둡니다
+            now = time.monotonic()
+            earliest = channel.last_response + Tello.TIME_BTW_COMMANDS
+            if now < earliest:
+                if not channel.dispatch_scheduled:
+                    channel.dispatch_scheduled = True
+                    self.call_later(earliest - now, lambda: self.dispatch_later(channel))
+                return
+
+            request = None
+            while any(channel.lanes):
+                candidate = channel.next_request_locked()
+                if candidate.future.set_running_or_notify_cancel():
+                    request = candidate
+                    break
+            if request is None:
+                return
+            channel.in_flight = request
+            channel.sent_at = now
+            channel.total_wait += now - request.submitted_at
+
+        if request.gate is not None:
+            # 데이터그램은 BroadcastGate의 조정 스레드가 보냅니다. 취소되면 이벤트 루프에서 끝냅니다
+            def aborted(error):
+                self.call_later(0, lambda: self.finish(channel, request, exception=error))
+
+            if not request.gate.arrive(aborted):
+                self.finish(channel, request, exception=request.gate.error)
+                return
+            # 예약 전송이면 전송 시각까지의 대기 시간을 타임아웃에 더합니다
+            delay = max(0.0, (request.gate.at or now) - now)
+            self.call_later(request.timeout + delay, lambda: self.expire(channel, request))
+            return
+
+        Tello.LOGGER.info("Send command: '{}'".format(request.command))
+        try:
+            self.control_socket.sendto(request.command.encode('utf-8'), channel.address)
+        except OSError as e:
+            self.finish(channel, request, exception=e)
+            return
+        self.call_later(request.timeout, lambda: self.expire(channel, request))
+
+    def dispatch_later(self, channel: MultiplexedScheduler):
+        channel.dispatch_scheduled = False
+        self.dispatch(channel)
+
+    def complete(self, channel: MultiplexedScheduler, data: bytes):
+        """응답을 진행 중인 명령에 전달합니다 (전송 → 응답).
+        진행 중인 명령이 없으면 타임아웃 뒤에 늦게 도착한 응답이므로 버립니다.
+        """
+        request = channel.in_flight
+        if request is None:
+            Tello.LOGGER.debug('Discarding stale response from {}'.format(channel.address[0]))
+            return
+
+        try:
+            response = data.decode('utf-8').rstrip('\r\n')
+        except UnicodeDecodeError as e:
+            Tello.LOGGER.error(e)
+            response = 'response decode error'
+
+        channel.last_response = time.monotonic()
+        Tello.LOGGER.info("Response {}: '{}'".format(request.command, response))
+        self.finish(channel, request, response)
+
+    def expire(self, channel: MultiplexedScheduler, request: CommandRequest):
+        """응답 없이 타임아웃이 지난 명령을 끝냅니다 (전송 → 타임아웃)"""
+        if channel.in_flight is request:
+            self.finish(channel, request, None)
+
+    def finish(self, channel: MultiplexedScheduler, request: CommandRequest, response: Optional[str] = None,
+               exception: Optional[Exception] = None):
+        """진행 중인 명령의 Future를 완료하고 다음 명령을 보냅니다"""
+        service = time.monotonic() - channel.sent_at
+        with channel.condition:
+            if channel.in_flight is not request:
+                return
+            channel.in_flight = None
+            channel.completed[request.lane] += 1
+            channel.total_service += service
+            if response is None and exception is None:
+                channel.timeouts += 1
+
+        # 기동 시간이 응답 시간에 포함되지 않는 명령만 RTT 표본으로 사용합니다
+        if exception is None and request.gate is None and \
+                request.lane in (CommandScheduler.QUERY, CommandScheduler.CONFIG):
+            if response is None:
+                channel.rtt.backoff()
+            else:
+                channel.rtt.sample(service)
+
+        # 사용자 콜백은 CommandFuture가 콜백 스레드로 넘기므로 이벤트 루프를 막지 않습니다
+        if exception is not None:
+            request.future.set_exception(exception)
+        else:
+            request.future.set_result(response)
+        self.dispatch(channel)
+
+    def stats(self) -> dict:
+        """등록된 드론 수, 진행 중인 명령 수, 대기 중인 타이머 수"""
+        with self.lock:
+            channels = list(self.channels.values())
+            timers = len(self.timers)
+        return {
+            'drones': len(channels),
+            'in_flight': sum(1 for channel in channels if channel.in_flight is not None),
+            'timers': timers,
+        }
+
+    def close(self):
+        """이벤트 루프를 멈추고 소켓을 닫습니다.
+        """
+        self.closed = True
+        self.wake()
+        if self.worker is not None and self.worker.is_alive():
+            self.worker.join(1.0)
+        self.selector.close()
+        for sock in (self.control_socket, self.state_socket, self.wakeup_receive, self.wakeup_send):
+            sock.close()
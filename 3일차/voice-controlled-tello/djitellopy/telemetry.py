@@ -0,0 +1,135 @@
+"""드론별 상태 패킷 기록을 NumPy 배열로 보관하는 텔레메트리 저장소.
+Per-drone telemetry history kept in preallocated NumPy columns.
+"""
+
+import time
+from threading import Lock
+from typing import Optional, Tuple
+
+from .tello import TelloState
+
+
+class TelemetryHistory:
+    """
+    상태 패킷을 열(column) 단위 링 버퍼에 기록합니다. 배열은 미리 할당되므로 패킷마다
+    파이썬 객체가 쌓이지 않고, 질의는 벡터 연산으로 처리됩니다. 버퍼가 가득 차면 가장
+    오래된 기록부터 덮어씁니다. 시각은 time.monotonic() 기준입니다.
+
+    보통 직접 만들지 않고 Tello.get_telemetry_history()를 사용합니다.
+    udp_state_receiver가 상태 패킷을 받을 때마다 자동으로 기록합니다.
+
+    ```python
+    history = tello.get_telemetry_history()
+    heights = history.history('h', last=5.0)
+    print(history.mean('h', last=1.0), history.variance('yaw', last=1.0))
+    ```
+    """
+
+    COLUMNS = ('pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'agx', 'agy', 'agz',
+               'h', 'tof', 'bat', 'baro')
+    INDEX = {name: index for index, name in enumerate(COLUMNS)}
+    # TelloState.data에서 각 열의 위치
+    SOURCE = tuple(TelloState.INDEX[name] for name in COLUMNS)
+
+    def __init__(self, capacity: int):
+        """
+        매개변수:
+            capacity: 보관할 최대 패킷 수 (10Hz에서 3000이면 5분)
+        """
+        # djitellopy를 import 할 때 numpy까지 불러오지 않도록 여기서 import 합니다
+        import numpy as np
+
+        self.capacity = capacity
+        self.lock = Lock()
+        # 열마다 연속된 메모리가 되도록 (열 수, capacity) 모양으로 할당합니다
+        self.columns = np.full((len(TelemetryHistory.COLUMNS), capacity), np.nan)
+        self.timestamps = np.zeros(capacity)
+        self.count = 0  # 지금까지 기록된 패킷 수
+
+    def append(self, state: TelloState, timestamp: Optional[float] = None):
+        """상태 패킷 하나를 기록합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        data = state.data
+        row = [data[index] for index in TelemetryHistory.SOURCE]
+        if None in row:
+            row = [float('nan') if value is None else value for value in row]
+
+        with self.lock:
+            position = self.count % self.capacity
+            self.columns[:, position] = row
+            self.timestamps[position] = timestamp
+            self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def window(self, last: Optional[float] = None, now: Optional[float] = None) -> 'np.ndarray':
+        """시간순으로 정렬된 최근 기록의 버퍼 위치.
+        last초 이내의 기록만 선택합니다 (None이면 전부).
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        import numpy as np
+
+        size = min(self.count, self.capacity)
+        start = self.count - size
+        positions = np.arange(start, self.count) % self.capacity
+
+        if last is not None and size:
+            if now is None:
+                now = time.monotonic()
+            # 시각은 기록 순서대로 증가하므로 이진 탐색으로 시작점을 찾습니다
+            first = np.searchsorted(self.timestamps[positions], now - last, side='left')
+            positions = positions[first:]
+        return positions
+
+    def history(self, field: str, last: Optional[float] = None) -> 'np.ndarray':
+        """한 필드의 기록을 오래된 것부터 반환합니다.
+
+        매개변수:
+            field: COLUMNS 중 하나 (예: 'h', 'yaw', 'bat')
+            last: 최근 몇 초의 기록만 반환할지 (None이면 전부)
+        """
+        column = self.column_index(field)
+        with self.lock:
+            return self.columns[column, self.window(last)]
+
+    def history_with_timestamps(self, field: str, last: Optional[float] = None) -> Tuple['np.ndarray', 'np.ndarray']:
+        """(시각, 값) 배열 쌍을 반환합니다. 그래프나 미분에 사용합니다.
+        """
+        column = self.column_index(field)
+        with self.lock:
+            positions = self.window(last)
+            return self.timestamps[positions], self.columns[column, positions]
+
+    def mean(self, field: str, last: Optional[float] = None) -> float:
+        """구간 평균 (기록이 없으면 nan)"""
+        import numpy as np
+
+        values = self.history(field, last)
+        return float(np.nanmean(values)) if values.size else float('nan')
+
+    def variance(self, field: str, last: Optional[float] = None) -> float:
+        """구간 분산 (기록이 없으면 nan)"""
+        import numpy as np
+
+        values = self.history(field, last)
+        return float(np.nanvar(values)) if values.size else float('nan')
+
+    def latest(self, field: str) -> float:
+        """가장 최근 값 (기록이 없으면 nan)"""
+        column = self.column_index(field)
+        with self.lock:
+            if not self.count:
+                return float('nan')
+            return float(self.columns[column, (self.count - 1) % self.capacity])
+
+    def column_index(self, field: str) -> int:
+        try:
+            return TelemetryHistory.INDEX[field]
+        except KeyError:
+            raise ValueError("Unknown telemetry field: '{}' (expected one of {})"
+                             .format(field, ', '.join(TelemetryHistory.COLUMNS)))
@@ -5,17 +5,23 @@ DJI Tello 드론을 제어하기 위한 라이브러리.
 
 # coding=utf-8
 import logging
+import random
 import socket
 import time
 from datetime import datetime
-from collections import deque
-from threading import Thread, Lock
-from typing import Optional, Union, Type, Dict
+import re
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import Future, CancelledError, ThreadPoolExecutor
+from contextlib import suppress
+from threading import Thread, Lock, Condition, Event, Timer, current_thread
+from typing import Optional, Union, Type, Dict, Tuple, Callable
 
 from .enforce_types import enforce_types
+from .recorder import H264Recorder
 
-import av
-import numpy as np
+# av(PyAV)와 numpy는 import 시간이 길어 비디오를 사용할 때 처음 import 합니다
+# (BackgroundFrameRead). 비디오를 쓰지 않는 스크립트는 이 비용을 치르지 않습니다.
 
 
 threads_initialized = False
@@ -43,10 +49,17 @@ class Tello:
     # 통신 관련 상수
     RESPONSE_TIMEOUT = 7  # 응답 대기 시간 (초)
     TAKEOFF_TIMEOUT = 20  # 이륙 대기 시간 (초)
+    QUERY_TIMEOUT_RANGE = (0.3, 3.0)   # 읽기 명령 타임아웃 범위, 측정된 RTT로 결정 (초)
+    CONFIG_TIMEOUT_RANGE = (0.5, 7.0)  # 설정 명령 타임아웃 범위, 측정된 RTT로 결정 (초)
+    RETRY_BACKOFF_BASE = 0.1  # 재시도 전 대기 시간의 기준값, 시도마다 두 배 (초)
+    RETRY_BACKOFF_MAX = 2.0   # 재시도 전 대기 시간의 최대값 (초)
     FRAME_GRAB_TIMEOUT = 5  # 프레임 획득 타임아웃
+    FRAME_RING_CAPACITY = 8  # BackgroundFrameRead가 보관하는 최근 프레임 수
     TIME_BTW_COMMANDS = 0.1  # 명령어 사이의 대기 시간 (초)
     TIME_BTW_RC_CONTROL_COMMANDS = 0.001  # RC 제어 명령어 사이의 대기 시간 (초)
     RETRY_COUNT = 3  # 실패한 명령어 재시도 횟수
+    RC_STREAMER_RATE = 20  # RcStreamer의 기본 RC 전송 주기 (Hz)
+    TELEMETRY_CAPACITY = 3000  # 텔레메트리 기록의 기본 크기 (10Hz에서 5분)
     TELLO_IP = '192.168.10.1'  # Tello 드론의 IP 주소
 
     # 비디오 스트리밍 관련 상수
@@ -73,6 +86,11 @@ class Tello:
     CAMERA_FORWARD = 0      # 전방 카메라
     CAMERA_DOWNWARD = 1     # 하방 카메라
 
+    # BackgroundFrameRead가 반환하는 프레임의 픽셀 포맷
+    PIXEL_FORMAT_RGB = 'rgb24'        # (h, w, 3) RGB
+    PIXEL_FORMAT_BGR = 'bgr24'        # (h, w, 3) BGR, OpenCV에서 바로 사용
+    PIXEL_FORMAT_YUV420P = 'yuv420p'  # (h * 3 / 2, w) Y, U, V 평면을 이어붙인 원본
+
     # Set up logger
     HANDLER = logging.StreamHandler()
     FORMATTER = logging.Formatter('[%(levelname)s] %(filename)s - %(lineno)d - %(message)s')
@@ -103,6 +121,10 @@ class Tello:
 
     # VideoCapture object
     background_frame_read: Optional['BackgroundFrameRead'] = None
+    # 고정 주기 RC 전송 스레드
+    rc_streamer: Optional['RcStreamer'] = None
+    # 명령 우선순위 스케줄러
+    command_scheduler: Optional['CommandScheduler'] = None
 
     stream_on = False
     is_flying = False
@@ -110,7 +132,16 @@ class Tello:
     def __init__(self,
                  host=TELLO_IP,
                  retry_count=RETRY_COUNT,
-                 vs_udp=VS_UDP_PORT):
+                 vs_udp=VS_UDP_PORT,
+                 transport=None):
+        """
+        매개변수:
+            host: 드론의 IP 주소
+            retry_count: 실패한 명령어 재시도 횟수
+            vs_udp: 비디오 스트림을 받을 로컬 UDP 포트
+            transport: 전용 소켓을 사용하려면 TelloTransport 인스턴스를 전달합니다.
+                None이면 모듈 전역 소켓(8889/8890)을 공유합니다.
+        """
 
         global threads_initialized, client_socket, drones
 
@@ -118,9 +149,11 @@ class Tello:
         self.stream_on = False
         self.retry_count = retry_count
         self.last_received_command_timestamp = time.time()
+        self.last_sent_command_timestamp = time.monotonic()
         self.last_rc_control_timestamp = time.time()
+        self.transport = transport
 
-        if not threads_initialized:
+        if transport is None and not threads_initialized:
             # Run Tello command responses UDP receiver on background
             client_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             client_socket.bind(("", Tello.CONTROL_UDP_PORT))
@@ -135,9 +168,13 @@ class Tello:
 
             threads_initialized = True
 
-        drones[host] = {'responses': [], 'state': {}}
+        # 응답 수신 스레드가 새 응답을 넣으면 condition으로 대기 중인 호출자를 즉시 깨웁니다
+        # 상태 수신 스레드는 state_condition과 listeners로 wait_until / on_state 구독자를 깨웁니다
+        self.get_drones_dict()[host] = {'responses': [], 'state': {}, 'condition': Condition(),
+                                        'state_condition': Condition(), 'listeners': []}
 
-        self.LOGGER.info("Tello instance was initialized. Host: '{}'. Port: '{}'.".format(host, Tello.CONTROL_UDP_PORT))
+        local_port = self.get_control_socket().getsockname()[1]
+        self.LOGGER.info("Tello instance was initialized. Host: '{}'. Port: '{}'.".format(host, local_port))
 
         self.vs_udp_port = vs_udp
 
@@ -148,74 +185,136 @@ class Tello:
         self.vs_udp_port = udp_port
         self.send_control_command(f'port 8890 {self.vs_udp_port}')
 
+    def get_drones_dict(self) -> dict:
+        """Get the dict of drones served by the same receiver threads: the
+        global drones dict, or the one of this drone's TelloTransport.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        if self.transport is not None:
+            return self.transport.drones
+        return drones
+
+    def get_control_socket(self) -> socket.socket:
+        """Get the socket used for sending commands to this drone.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        if self.transport is not None:
+            return self.transport.control_socket
+        return client_socket
+
     def get_own_udp_object(self):
-        """Get own object from the global drones dict. This object is filled
+        """Get own object from the drones dict. This object is filled
         with responses and state information by the receiver threads.
         Internal method, you normally wouldn't call this yourself.
         """
-        global drones
-
         host = self.address[0]
-        return drones[host]
+        return self.get_drones_dict()[host]
 
     @staticmethod
-    def udp_response_receiver():
+    def udp_response_receiver(sock=None, drone_dict=None):
         """Setup drone UDP receiver. This method listens for responses of Tello.
         Must be run from a background thread in order to not block the main thread.
+        Uses the global client_socket and drones dict unless others are given.
         Internal method, you normally wouldn't call this yourself.
         """
+        if sock is None:
+            sock = client_socket
+        if drone_dict is None:
+            drone_dict = drones
+
         while True:
             try:
-                data, address = client_socket.recvfrom(1024)
+                data, address = sock.recvfrom(1024)
+                if address is None:
+                    break  # 소켓이 shutdown 되었습니다
 
                 address = address[0]
                 Tello.LOGGER.debug('Data received from {} at client_socket'.format(address))
 
-                if address not in drones:
+                if address not in drone_dict:
                     continue
 
-                drones[address]['responses'].append(data)
+                drone = drone_dict[address]
+                with drone['condition']:
+                    drone['responses'].append(data)
+                    drone['condition'].notify_all()
 
             except Exception as e:
-                Tello.LOGGER.error(e)
+                # 소켓이 닫힌 경우(TelloTransport.close)는 정상 종료입니다
+                if sock.fileno() != -1:
+                    Tello.LOGGER.error(e)
                 break
 
     @staticmethod
-    def udp_state_receiver():
+    def udp_state_receiver(state_socket=None, drone_dict=None):
         """Setup state UDP receiver. This method listens for state information from
         Tello. Must be run from a background thread in order to not block
         the main thread.
+        Binds the global state port unless a socket and drones dict are given.
         Internal method, you normally wouldn't call this yourself.
         """
-        state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        state_socket.bind(("", Tello.STATE_UDP_PORT))
+        if state_socket is None:
+            state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            state_socket.bind(("", Tello.STATE_UDP_PORT))
+        if drone_dict is None:
+            drone_dict = drones
 
         while True:
             try:
                 data, address = state_socket.recvfrom(1024)
+                if address is None:
+                    break  # 소켓이 shutdown 되었습니다
 
                 address = address[0]
-                Tello.LOGGER.debug('Data received from {} at state_socket'.format(address))
+                Tello.LOGGER.debug('Data received from %s at state_socket', address)
 
-                if address not in drones:
+                drone = drone_dict.get(address)
+                if drone is None:
                     continue
 
-                data = data.decode('ASCII')
-                data = Tello.parse_state(data)
-                data['received_at'] = datetime.now()
-                drones[address]['state'] = data
+                Tello.handle_state_packet(drone, data)
 
             except Exception as e:
-                Tello.LOGGER.error(e)
+                if state_socket.fileno() != -1:
+                    Tello.LOGGER.error(e)
                 break
 
+    @staticmethod
+    def handle_state_packet(drone: dict, data: bytes):
+        """Store a state packet in a drone's dict and notify its subscribers,
+        telemetry history and state recorder.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        state = Tello.parse_state_bytes(data, datetime.now())
+        if state is None:
+            return
+
+        previous = drone['state']
+        drone['state'] = state
+
+        for listener in drone.get('listeners', ()):
+            listener.notify(state, previous)
+
+        condition = drone.get('state_condition')
+        if condition is not None:
+            with condition:
+                condition.notify_all()
+
+        history = drone.get('telemetry')
+        if history is not None:
+            history.append(state)
+
+        recorder = drone.get('state_recorder')
+        if recorder is not None:
+            recorder.write(state)
+
     @staticmethod
     def parse_state(state: str) -> Dict[str, Union[int, float, str]]:
         """Parse a state line to a dictionary
         Internal method, you normally wouldn't call this yourself.
         """
         state = state.strip()
-        Tello.LOGGER.debug('Raw state data: {}'.format(state))
+        Tello.LOGGER.debug('Raw state data: %s', state)
 
         if state == 'ok':
             return {}
@@ -243,9 +342,40 @@ class Tello:
 
         return state_dict
 
-    def get_current_state(self) -> dict:
-        """Call this function to attain the state of the Tello. Returns a dict
-        with all fields.
+    @staticmethod
+    def parse_state_bytes(data: bytes, received_at: Optional[datetime] = None) -> Optional['TelloState']:
+        """Parse a raw state packet to a [TelloState][tellostate] record.
+        Uses the fixed field layout of the Tello state packet and falls back to
+        parse_state for unknown layouts. Returns None for packets without fields.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        # 필드가 더 붙은 패킷은 일부만 읽히지 않도록 범용 파서로 넘깁니다
+        match = TelloState.LAYOUT_EDU.fullmatch(data)
+        if match is not None:
+            values = tuple([convert(value) for convert, value in zip(TelloState.CONVERTERS, match.groups())])
+            return TelloState(values, received_at)
+
+        match = TelloState.LAYOUT_BASIC.fullmatch(data)
+        if match is not None:
+            converters = TelloState.CONVERTERS[TelloState.BASIC_OFFSET:]
+            values = TelloState.MISSION_PAD_ABSENT + tuple([convert(value) for convert, value
+                                                            in zip(converters, match.groups())])
+            return TelloState(values, received_at)
+
+        # 알 수 없는 펌웨어 형식: 느린 범용 파서
+        try:
+            state_dict = Tello.parse_state(data.decode('ASCII'))
+        except UnicodeDecodeError as e:
+            Tello.LOGGER.error(e)
+            return None
+        if not state_dict:
+            return None
+        return TelloState.from_dict(state_dict, received_at)
+
+    def get_current_state(self) -> Mapping:
+        """Call this function to attain the state of the Tello. Returns a
+        [TelloState][tellostate] record with all fields, which can also be used
+        like a read-only dict (an empty dict before the first state packet).
         Internal method, you normally wouldn't call this yourself.
         """
         return self.get_own_udp_object()['state']
@@ -254,11 +384,9 @@ class Tello:
         """Get a specific sate field by name.
         Internal method, you normally wouldn't call this yourself.
         """
-        state = self.get_current_state()
-
-        if key in state:
-            return state[key]
-        else:
+        try:
+            return self.get_current_state()[key]
+        except KeyError:
             raise TelloException('Could not get state property: {}'.format(key))
 
     def get_last_state_update(self) -> datetime:
@@ -269,6 +397,80 @@ class Tello:
         """
         return self.get_state_field('received_at')
 
+    def wait_until(self, predicate: Callable[['TelloState'], bool],
+                   timeout: Optional[Union[int, float]] = None) -> Optional['TelloState']:
+        """Block until a state packet satisfies `predicate`, without polling.
+        The predicate is checked against the current state first and then once per
+        received state packet.
+
+        ```python
+        state = tello.wait_until(lambda s: s.mid == 1, timeout=30)
+        ```
+        Arguments:
+            predicate: function receiving the TelloState
+            timeout: seconds to wait, None waits forever
+        Returns:
+            TelloState: the matching state, or None on timeout
+        """
+        drone = self.get_own_udp_object()
+        condition = drone['state_condition']
+        with condition:
+            if condition.wait_for(lambda: drone['state'] and predicate(drone['state']), timeout):
+                return drone['state']
+        return None
+
+    def on_state(self, fields: Optional[Union[str, list, tuple]], callback: Callable[['TelloState'], None]) -> 'StateListener':
+        """Call `callback(state)` from the state receiver thread whenever one of `fields`
+        changes, or for every state packet if `fields` is None. Keep the callback short,
+        it delays the processing of the next packet.
+
+        ```python
+        listener = tello.on_state('mid', lambda s: print('mission pad', s.mid))
+        ...
+        listener.cancel()
+        ```
+        Returns:
+            StateListener: call cancel() to unsubscribe
+        """
+        if isinstance(fields, str):
+            fields = (fields,)
+        return self.add_state_listener(StateListener(callback, fields=fields))
+
+    def on_threshold(self, field: str, callback: Callable[['TelloState'], None],
+                     below: Optional[Union[int, float]] = None, above: Optional[Union[int, float]] = None) -> 'StateListener':
+        """Call `callback(state)` once when `field` drops below `below` or rises above
+        `above`. The alert is re-armed when the value is back in range.
+        Returns:
+            StateListener: call cancel() to unsubscribe
+        """
+        def out_of_range(state):
+            value = state.get(field)
+            if value is None:
+                return False
+            return (below is not None and value < below) or (above is not None and value > above)
+
+        return self.add_state_listener(StateListener(callback, predicate=out_of_range))
+
+    def on_low_battery(self, percent: int, callback: Callable[['TelloState'], None]) -> 'StateListener':
+        """Call `callback(state)` once when the battery drops below `percent`.
+        """
+        return self.on_threshold('bat', callback, below=percent)
+
+    def on_high_temperature(self, celsius: int, callback: Callable[['TelloState'], None]) -> 'StateListener':
+        """Call `callback(state)` once when the highest temperature rises above `celsius`.
+        """
+        return self.on_threshold('temph', callback, above=celsius)
+
+    def add_state_listener(self, listener: 'StateListener') -> 'StateListener':
+        """Register a StateListener with the state receiver.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        drone = self.get_own_udp_object()
+        listener.drone = drone
+        # 수신 스레드가 잠금 없이 순회할 수 있도록 목록을 교체합니다
+        drone['listeners'] = drone['listeners'] + [listener]
+        return listener
+
     def get_mission_pad_id(self) -> int:
         """Mission pad ID of the currently detected mission pad
         Only available on Tello EDUs after calling enable_mission_pads
@@ -448,48 +650,188 @@ class Tello:
         address = address_schema.format(ip=self.VS_UDP_IP, port=self.vs_udp_port)
         return address
 
-    def get_frame_read(self, with_queue = False, max_queue_len = 32) -> 'BackgroundFrameRead':
+    def get_frame_read(self, with_queue = False, max_queue_len = 32,
+                       pixel_format: str = PIXEL_FORMAT_RGB,
+                       ring_capacity: int = FRAME_RING_CAPACITY, decode: bool = True) -> 'BackgroundFrameRead':
         """Get the BackgroundFrameRead object from the camera drone. Then, you just need to call
-        backgroundFrameRead.frame to get the actual frame received by the drone.
+        backgroundFrameRead.frame to get the actual frame received by the drone, or
+        backgroundFrameRead.wait_for_next(seq) to block until a frame newer than seq arrives.
+        Arguments:
+            with_queue: keep decoded frames in a queue instead of only the latest one
+            max_queue_len: maximum length of that queue
+            pixel_format: Tello.PIXEL_FORMAT_RGB, Tello.PIXEL_FORMAT_BGR or Tello.PIXEL_FORMAT_YUV420P
+            ring_capacity: number of recent frames kept in the ring buffer
+            decode: set to False to only receive packets, e.g. for
+                backgroundFrameRead.start_recording() without decoding
         Returns:
             BackgroundFrameRead
         """
         if self.background_frame_read is None:
             address = self.get_udp_video_address()
-            self.background_frame_read = BackgroundFrameRead(self, address, with_queue, max_queue_len)
+            self.background_frame_read = BackgroundFrameRead(self, address, with_queue, max_queue_len,
+                                                             pixel_format, ring_capacity, decode)
             self.background_frame_read.start()
         return self.background_frame_read
 
-    def send_command_with_return(self, command: str, timeout: int = RESPONSE_TIMEOUT) -> str:
+    def get_rc_streamer(self, rate: int = RC_STREAMER_RATE) -> 'RcStreamer':
+        """Get the RcStreamer of this drone, starting it on first use. While it runs,
+        send_rc_control only updates the stick values and the streamer transmits
+        the latest values at a fixed rate.
+        Returns:
+            RcStreamer
+        """
+        if self.rc_streamer is None:
+            self.rc_streamer = RcStreamer(self, rate)
+            self.rc_streamer.start()
+        return self.rc_streamer
+
+    def stop_rc_streamer(self):
+        """Stop the RcStreamer. send_rc_control sends packets directly again.
+        """
+        if self.rc_streamer is not None:
+            self.rc_streamer.stop()
+            self.rc_streamer = None
+
+    def get_telemetry_history(self, capacity: int = TELEMETRY_CAPACITY) -> 'TelemetryHistory':
+        """Get the telemetry history of this drone, creating it on first use. From then on
+        every state packet is recorded into preallocated NumPy columns which can be
+        queried by time window, e.g. `history.history('h', last=5.0)`.
+        Arguments:
+            capacity: number of state packets to keep
+        Returns:
+            TelemetryHistory
+        """
+        drone = self.get_own_udp_object()
+        if 'telemetry' not in drone:
+            # telemetry 모듈이 tello 모듈을 import 하므로 여기서 import 합니다
+            from .telemetry import TelemetryHistory
+            drone['telemetry'] = TelemetryHistory(capacity)
+        return drone['telemetry']
+
+    def start_state_recording(self, path: str) -> 'StateRecorder':
+        """Record every state packet of this drone as a fixed-width binary record.
+        Open the file later with djitellopy.flight_recorder.load_state_recording.
+        Arguments:
+            path: file to append the records to
+        Returns:
+            StateRecorder
+        """
+        from .flight_recorder import StateRecorder
+
+        self.stop_state_recording()
+        recorder = StateRecorder(path)
+        self.get_own_udp_object()['state_recorder'] = recorder
+        return recorder
+
+    def stop_state_recording(self):
+        """Stop recording state packets and close the file.
+        """
+        drone = self.get_drones_dict().get(self.address[0])
+        recorder = drone.pop('state_recorder', None) if drone is not None else None
+        if recorder is not None:
+            recorder.close()
+
+    def get_command_scheduler(self) -> 'CommandScheduler':
+        """Get the CommandScheduler of this drone, starting it on first use.
+        All commands expecting a response go through it, so commands issued from
+        several threads are sent one at a time and each caller gets its own response.
+        Returns:
+            CommandScheduler
+        """
+        if self.command_scheduler is None:
+            if self.transport is not None:
+                self.command_scheduler = self.transport.create_scheduler(self)
+            else:
+                self.command_scheduler = CommandScheduler(self)
+            self.command_scheduler.start()
+        return self.command_scheduler
+
+    def request_command(self, command: str, timeout: Optional[Union[int, float]] = None) -> Optional[str]:
+        """Queue a command in the CommandScheduler and wait for its response.
+        Without a timeout the scheduler picks one for the command class (see CommandScheduler.timeout_for).
+        Internal method, you normally wouldn't call this yourself.
+        Return:
+            str: response text, None on timeout
+        """
+        scheduler = self.get_command_scheduler()
+        scheduler.check_blocking_call(command)
+        future = scheduler.submit(command, timeout)
+        try:
+            response = future.result()
+        except CancelledError:
+            raise TelloException("Command '{}' was cancelled by '{}'".format(command, future.cancelled_by))
+
+        if response is None:
+            self.LOGGER.warning("Aborting command '{}'. Did not receive a response after {} seconds"
+                                .format(command, future.timeout))
+        return response
+
+    def send_command_with_return(self, command: str, timeout: Optional[Union[int, float]] = None) -> str:
         """Send command to Tello and wait for its response.
+        The command is queued in the CommandScheduler lane of its command class.
         Internal method, you normally wouldn't call this yourself.
         Return:
             bool/str: str with response text on success, False when unsuccessfull.
         """
+        response = self.request_command(command, timeout)
+        if response is None:
+            return "Aborting command '{}'. Did not receive a response in time".format(command)
+        return response
+
+    def retry_delay(self, attempt: int) -> float:
+        """Jittered exponential backoff before retry number `attempt` (1, 2, ...), so
+        retries of several drones on a congested link do not collide.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        ceiling = min(Tello.RETRY_BACKOFF_MAX, Tello.RETRY_BACKOFF_BASE * 2 ** (attempt - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def execute_command(self, command: str, timeout: Union[int, float],
+                        gate: Optional['BroadcastGate'] = None) -> Optional[str]:
+        """Send command to Tello and wait for its response. Only the CommandScheduler
+        worker calls this, so there is never more than one command in flight.
+        With a gate the datagram is not sent here: the broadcast coordinator sends it
+        together with those of the other drones (see BroadcastGate).
+        Internal method, you normally wouldn't call this yourself.
+        Return:
+            str: response text, None on timeout
+        """
         # Commands very consecutive makes the drone not respond to them.
         # So wait at least self.TIME_BTW_COMMANDS seconds
         diff = time.time() - self.last_received_command_timestamp
         if diff < self.TIME_BTW_COMMANDS:
-            self.LOGGER.debug('Waiting {} seconds to execute command: {}...'.format(diff, command))
-            time.sleep(diff)
+            delay = self.TIME_BTW_COMMANDS - diff
+            self.LOGGER.debug('Waiting {} seconds to execute command: {}...'.format(delay, command))
+            time.sleep(delay)
 
         self.LOGGER.info("Send command: '{}'".format(command))
-        timestamp = time.time()
 
-        client_socket.sendto(command.encode('utf-8'), self.address)
+        drone = self.get_own_udp_object()
+        responses = drone['responses']
+        condition = drone['condition']
 
-        responses = self.get_own_udp_object()['responses']
+        with condition:
+            # 이전 명령의 타임아웃 뒤에 늦게 도착한 응답은 이번 명령의 응답이 아닙니다
+            if responses:
+                self.LOGGER.debug('Discarding %d stale response(s) before %s', len(responses), command)
+                responses.clear()
 
-        while not responses:
-            if time.time() - timestamp > timeout:
-                message = "Aborting command '{}'. Did not receive a response after {} seconds".format(command, timeout)
-                self.LOGGER.warning(message)
-                return message
-            time.sleep(0.1)  # Sleep during send command
+        if gate is None:
+            self.get_control_socket().sendto(command.encode('utf-8'), self.address)
+        else:
+            gate.arrive_and_wait()
+        # RTT는 대기 간격이 아니라 실제로 보낸 시각부터 잽니다 (스케줄러가 사용)
+        self.last_sent_command_timestamp = time.monotonic()
+
+        # 응답 수신 스레드가 notify 할 때까지 대기 (폴링 없이 즉시 깨어남)
+        with condition:
+            if not condition.wait_for(lambda: responses, timeout=timeout):
+                return None
+
+            first_response = responses.pop(0)  # first datum from socket
 
         self.last_received_command_timestamp = time.time()
 
-        first_response = responses.pop(0)  # first datum from socket
         try:
             response = first_response.decode("utf-8")
         except UnicodeDecodeError as e:
@@ -507,35 +849,93 @@ class Tello:
         # Commands very consecutive makes the drone not respond to them. So wait at least self.TIME_BTW_COMMANDS seconds
 
         self.LOGGER.info("Send command (no response expected): '{}'".format(command))
-        client_socket.sendto(command.encode('utf-8'), self.address)
+        self.get_control_socket().sendto(command.encode('utf-8'), self.address)
 
-    def send_control_command(self, command: str, timeout: int = RESPONSE_TIMEOUT) -> bool:
+    def send_control_command(self, command: str, timeout: Optional[Union[int, float]] = None) -> bool:
         """Send control command to Tello and wait for its response.
+        Retries wait a jittered, exponentially growing delay (see retry_delay).
         Internal method, you normally wouldn't call this yourself.
         """
-        response = "max retries exceeded"
-        for i in range(0, self.retry_count):
-            response = self.send_command_with_return(command, timeout=timeout)
+        self.get_command_scheduler().check_blocking_call(command)
+        return self.send_control_command_async(command, timeout).result()
+
+    def send_control_command_async(self, command: str, timeout: Optional[Union[int, float]] = None) -> Future:
+        """Send control command to Tello without blocking. Returns a
+        concurrent.futures.Future that resolves to True once the drone answers 'ok'
+        (after retries), or raises a TelloException. Futures of several drones can be
+        combined with concurrent.futures.wait / as_completed. Done-callbacks run on a
+        separate callback thread (see CommandFuture), so they may send further commands.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        result = CommandFuture()
+        # 실행 중 상태로 두어 호출자가 cancel()로 결과를 버리지 못하게 합니다.
+        # 명령 취소는 land / emergency가 담당합니다.
+        result.set_running_or_notify_cancel()
+        scheduler = self.get_command_scheduler()
+        epoch = scheduler.epochs[CommandScheduler.lane_of(command)]
 
-            if 'ok' in response.lower():
-                return True
+        def attempt(i):
+            try:
+                pending = scheduler.submit(command, timeout, epoch=epoch)
+            except TelloException as e:
+                result.set_exception(e)
+                return
+            pending.add_internal_callback(lambda future: finished(i, future))
+
+        def finished(i, future):
+            if future.cancelled():
+                result.set_exception(TelloException("Command '{}' was cancelled by '{}'"
+                                                    .format(command, future.cancelled_by)))
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+                return
+
+            response = future.result()
+            if response is None:
+                self.LOGGER.warning("Aborting command '{}'. Did not receive a response after {} seconds"
+                                    .format(command, future.timeout))
+                response = "Aborting command '{}'. Did not receive a response in time".format(command)
+            elif 'ok' in response.lower():
+                result.set_result(True)
+                return
 
             self.LOGGER.debug("Command attempt #{} failed for command: '{}'".format(i, command))
-
-        self.raise_result_error(command, response)
-        return False # never reached
+            if i + 1 < self.retry_count:
+                # 스케줄러 워커를 막지 않도록 나중에 재시도합니다
+                scheduler.call_later(self.retry_delay(i + 1), lambda: attempt(i + 1))
+            else:
+                result.set_exception(self.result_error(command, response))
+
+        attempt(0)
+        return result
+
+    def command_result(self, command: str, wait: bool, timeout: Optional[Union[int, float]] = None) -> Optional[Future]:
+        """Send a control command, blocking when `wait` is True and returning its
+        Future otherwise. Used by the movement commands.
+        Internal method, you normally wouldn't call this yourself.
+        """
+        future = self.send_control_command_async(command, timeout)
+        if wait:
+            future.result()
+            return None
+        return future
 
     def send_read_command(self, command: str) -> str:
         """Send given command to Tello and wait for its response.
+        Read commands have short RTT-based timeouts and are retried with backoff when lost.
         Internal method, you normally wouldn't call this yourself.
         """
+        response = None
+        for i in range(0, self.retry_count):
+            if i > 0:
+                time.sleep(self.retry_delay(i))
+            response = self.request_command(command)
+            if response is not None:
+                break
 
-        response = self.send_command_with_return(command)
-
-        try:
-            response = str(response)
-        except TypeError as e:
-            self.LOGGER.error(e)
+        if response is None:
+            self.raise_result_error(command, "no response")
 
         if any(word in response for word in ('error', 'ERROR', 'False')):
             self.raise_result_error(command, response)
@@ -563,9 +963,15 @@ class Tello:
         """Used to reaise an error after an unsuccessful command
         Internal method, you normally wouldn't call this yourself.
         """
+        raise self.result_error(command, response)
+
+    def result_error(self, command: str, response: str) -> TelloException:
+        """Build the error raised after an unsuccessful command
+        Internal method, you normally wouldn't call this yourself.
+        """
         tries = 1 + self.retry_count
-        raise TelloException("Command '{}' was unsuccessful for {} tries. Latest response:\t'{}'"
-                             .format(command, tries, response))
+        return TelloException("Command '{}' was unsuccessful for {} tries. Latest response:\t'{}'"
+                              .format(command, tries, response))
 
     def connect(self, wait_for_state=True):
         """
@@ -576,6 +982,10 @@ class Tello:
         """
         self.send_control_command("command")
 
+        # 전용 상태 포트를 사용하는 경우 드론이 그 포트로 상태 패킷을 보내도록 설정
+        if self.transport is not None and self.transport.state_port != Tello.STATE_UDP_PORT:
+            self.set_network_ports(self.transport.state_port, self.vs_udp_port)
+
         if wait_for_state:
             REPS = 20
             for i in range(REPS):
@@ -655,126 +1065,151 @@ class Tello:
         비상 정지: 모든 모터를 즉시 정지시킵니다.
         긴급 상황에서만 사용하세요!
         """
+        # 대기 중인 비행 명령을 취소하고 진행 중인 명령을 기다리지 않고 바로 보냅니다
+        if self.command_scheduler is not None:
+            self.command_scheduler.cancel_pending('emergency')
         self.send_command_without_return("emergency")
         self.is_flying = False
 
-    def move(self, direction: str, x: int):
+    def move(self, direction: str, x: int, wait: bool = True) -> Optional[Future]:
         """
         지정된 방향으로 x cm만큼 이동합니다.
         
         매개변수:
             direction: 이동 방향 (up, down, left, right, forward, back)
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.send_control_command("{} {}".format(direction, x))
+        return self.command_result("{} {}".format(direction, x), wait)
 
-    def move_up(self, x: int):
+    def move_up(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         위로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("up", x)
+        return self.move("up", x, wait)
 
-    def move_down(self, x: int):
+    def move_down(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         아래로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("down", x)
+        return self.move("down", x, wait)
 
-    def move_left(self, x: int):
+    def move_left(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         왼쪽으로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("left", x)
+        return self.move("left", x, wait)
 
-    def move_right(self, x: int):
+    def move_right(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         오른쪽으로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("right", x)
+        return self.move("right", x, wait)
 
-    def move_forward(self, x: int):
+    def move_forward(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         앞으로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("forward", x)
+        return self.move("forward", x, wait)
 
-    def move_back(self, x: int):
+    def move_back(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         뒤로 x cm 이동합니다.
         
         매개변수:
             x: 이동 거리 (20-500cm)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.move("back", x)
+        return self.move("back", x, wait)
 
-    def rotate_clockwise(self, x: int):
+    def rotate_clockwise(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         시계 방향으로 x도 회전합니다.
         
         매개변수:
             x: 회전 각도 (1-360도)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.send_control_command("cw {}".format(x))
+        return self.command_result("cw {}".format(x), wait)
 
-    def rotate_counter_clockwise(self, x: int):
+    def rotate_counter_clockwise(self, x: int, wait: bool = True) -> Optional[Future]:
         """
         반시계 방향으로 x도 회전합니다.
         
         매개변수:
             x: 회전 각도 (1-360도)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.send_control_command("ccw {}".format(x))
+        return self.command_result("ccw {}".format(x), wait)
 
-    def flip(self, direction: str):
+    def flip(self, direction: str, wait: bool = True) -> Optional[Future]:
         """
         지정된 방향으로 플립(공중제비) 동작을 수행합니다.
         일반적으로 flip_x 함수들을 대신 사용합니다.
         
         매개변수:
             direction: l (왼쪽), r (오른쪽), f (앞쪽) 또는 b (뒤쪽)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.send_control_command("flip {}".format(direction))
+        return self.command_result("flip {}".format(direction), wait)
 
-    def flip_left(self):
+    def flip_left(self, wait: bool = True) -> Optional[Future]:
         """
         왼쪽으로 플립(공중제비) 동작을 수행합니다.
+
+        매개변수:
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.flip("l")
+        return self.flip("l", wait)
 
-    def flip_right(self):
+    def flip_right(self, wait: bool = True) -> Optional[Future]:
         """
         오른쪽으로 플립(공중제비) 동작을 수행합니다.
+
+        매개변수:
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.flip("r")
+        return self.flip("r", wait)
 
-    def flip_forward(self):
+    def flip_forward(self, wait: bool = True) -> Optional[Future]:
         """
         앞으로 플립(공중제비) 동작을 수행합니다.
+
+        매개변수:
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.flip("f")
+        return self.flip("f", wait)
 
-    def flip_back(self):
+    def flip_back(self, wait: bool = True) -> Optional[Future]:
         """
         뒤로 플립(공중제비) 동작을 수행합니다.
+
+        매개변수:
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
-        self.flip("b")
+        return self.flip("b", wait)
 
-    def go_xyz_speed(self, x: int, y: int, z: int, speed: int):
+    def go_xyz_speed(self, x: int, y: int, z: int, speed: int, wait: bool = True) -> Optional[Future]:
         """
         현재 위치를 기준으로 x, y, z 좌표로 이동합니다.
         speed로 이동 속도를 지정합니다.
@@ -784,9 +1219,10 @@ class Tello:
             y: y축 이동 거리 (-500~500cm)
             z: z축 이동 거리 (-500~500cm)
             speed: 이동 속도 (10-100cm/s)
+            wait: False이면 기다리지 않고 응답으로 완료되는 Future를 반환합니다
         """
         cmd = 'go {} {} {} {}'.format(x, y, z, speed)
-        self.send_control_command(cmd)
+        return self.command_result(cmd, wait)
 
     def stop(self):
         """
@@ -795,7 +1231,8 @@ class Tello:
         """
         self.send_control_command("stop")
 
-    def curve_xyz_speed(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int):
+    def curve_xyz_speed(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int,
+                        wait: bool = True) -> Optional[Future]:
         """Fly to x2 y2 z2 in a curve via x1 y1 z1. Speed defines the traveling speed in cm/s.
 
         - Both points are relative to the current position
@@ -811,11 +1248,14 @@ class Tello:
             z1: -500-500
             z2: -500-500
             speed: 10-60
+            wait: False returns a Future resolving on the response instead of blocking
+        Returns:
+            None, or a concurrent.futures.Future when wait is False
         """
         cmd = 'curve {} {} {} {} {} {} {}'.format(x1, y1, z1, x2, y2, z2, speed)
-        self.send_control_command(cmd)
+        return self.command_result(cmd, wait)
 
-    def go_xyz_speed_mid(self, x: int, y: int, z: int, speed: int, mid: int):
+    def go_xyz_speed_mid(self, x: int, y: int, z: int, speed: int, mid: int, wait: bool = True) -> Optional[Future]:
         """Fly to x y z relative to the mission pad with id mid.
         Speed defines the traveling speed in cm/s.
         Arguments:
@@ -824,11 +1264,15 @@ class Tello:
             z: -500-500
             speed: 10-100
             mid: 1-8
+            wait: False returns a Future resolving on the response instead of blocking
+        Returns:
+            None, or a concurrent.futures.Future when wait is False
         """
         cmd = 'go {} {} {} {} m{}'.format(x, y, z, speed, mid)
-        self.send_control_command(cmd)
+        return self.command_result(cmd, wait)
 
-    def curve_xyz_speed_mid(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int, mid: int):
+    def curve_xyz_speed_mid(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, speed: int, mid: int,
+                            wait: bool = True) -> Optional[Future]:
         """Fly to x2 y2 z2 in a curve via x1 y1 z1. Speed defines the traveling speed in cm/s.
 
         - Both points are relative to the mission pad with id mid.
@@ -845,11 +1289,15 @@ class Tello:
             z2: -500-500
             speed: 10-60
             mid: 1-8
+            wait: False returns a Future resolving on the response instead of blocking
+        Returns:
+            None, or a concurrent.futures.Future when wait is False
         """
         cmd = 'curve {} {} {} {} {} {} {} m{}'.format(x1, y1, z1, x2, y2, z2, speed, mid)
-        self.send_control_command(cmd)
+        return self.command_result(cmd, wait)
 
-    def go_xyz_speed_yaw_mid(self, x: int, y: int, z: int, speed: int, yaw: int, mid1: int, mid2: int):
+    def go_xyz_speed_yaw_mid(self, x: int, y: int, z: int, speed: int, yaw: int, mid1: int, mid2: int,
+                             wait: bool = True) -> Optional[Future]:
         """Fly to x y z relative to mid1.
         Then fly to 0 0 z over mid2 and rotate to yaw relative to mid2's rotation.
         Speed defines the traveling speed in cm/s.
@@ -861,9 +1309,12 @@ class Tello:
             yaw: -360-360
             mid1: 1-8
             mid2: 1-8
+            wait: False returns a Future resolving on the response instead of blocking
+        Returns:
+            None, or a concurrent.futures.Future when wait is False
         """
         cmd = 'jump {} {} {} {} {} m{} m{}'.format(x, y, z, speed, yaw, mid1, mid2)
-        self.send_control_command(cmd)
+        return self.command_result(cmd, wait)
 
     def enable_mission_pads(self):
         """Enable mission pad detection
@@ -893,17 +1344,24 @@ class Tello:
         """
         self.send_control_command("speed {}".format(x))
 
-    def send_rc_control(self, left_right_velocity: int, forward_backward_velocity: int, up_down_velocity: int,
-                        yaw_velocity: int):
+    def send_rc_control(self, left_right_velocity: Union[int, float], forward_backward_velocity: Union[int, float],
+                        up_down_velocity: Union[int, float], yaw_velocity: Union[int, float]):
         """Send RC control via four channels. Command is sent every self.TIME_BTW_RC_CONTROL_COMMANDS seconds.
+        If the RcStreamer is running (see get_rc_streamer), the values are handed to it instead
+        and sent at its fixed rate.
         Arguments:
             left_right_velocity: -100~100 (left/right)
             forward_backward_velocity: -100~100 (forward/backward)
             up_down_velocity: -100~100 (up/down)
             yaw_velocity: -100~100 (yaw)
+        Floats are truncated to integers.
         """
-        def clamp100(x: int) -> int:
-            return max(-100, min(100, x))
+        if self.rc_streamer is not None:
+            self.rc_streamer.set(left_right_velocity, forward_backward_velocity, up_down_velocity, yaw_velocity)
+            return
+
+        def clamp100(x: Union[int, float]) -> int:
+            return max(-100, min(100, int(x)))
 
         if time.time() - self.last_rc_control_timestamp > self.TIME_BTW_RC_CONTROL_COMMANDS:
             self.last_rc_control_timestamp = time.time()
@@ -937,8 +1395,8 @@ class Tello:
 
     def set_network_ports(self, state_packet_port: int, video_stream_port: int):
         """상태 패킷과 비디오 스트리밍을 위한 포트를 설정합니다.
-        이 명령어로 텔로를 재구성할 수 있지만 현재 이 라이브러리는
-        기본 포트가 아닌 포트는 지원하지 않습니다 (TODO!)
+        기본 포트가 아닌 상태 포트는 같은 포트로 바인딩된 TelloTransport를
+        사용할 때만 수신할 수 있습니다.
         """
         cmd = 'port {} {}'.format(state_packet_port, video_stream_port)
         self.send_control_command(cmd)
@@ -1110,26 +1568,773 @@ class Tello:
             self.background_frame_read.stop()
             self.background_frame_read = None
 
+        self.stop_rc_streamer()
+        self.stop_state_recording()
+        if self.command_scheduler is not None:
+            self.command_scheduler.stop()
+            self.command_scheduler = None
+
         host = self.address[0]
-        if host in drones:
-            del drones[host]
+        drone_dict = self.get_drones_dict()
+        if host in drone_dict:
+            del drone_dict[host]
 
     def __del__(self):
         self.end()
 
 
+class TelloState(Mapping):
+    """
+    상태 패킷 하나를 파싱한 결과. 필드는 속성(state.h, state.bat)으로 읽을 수 있고,
+    기존 코드와의 호환을 위해 읽기 전용 dict처럼(state['h'], dict(state))도 사용할 수 있습니다.
+    값은 필드 순서대로 튜플 하나에 저장되므로 패킷마다 dict를 만들지 않습니다.
+    미션 패드 필드(mid, x, y, z, mpry)는 Tello EDU가 아니면 None이며 dict 뷰에서 빠집니다.
+
+    ```python
+    state = tello.get_current_state()
+    print(state.h, state['bat'], state.received_at)
+    ```
+    """
+
+    __slots__ = ('data', 'received_at', 'extra')
+
+    # Tello 상태 패킷의 필드 순서 (SDK 2.0, 미션 패드 필드는 Tello EDU 전용)
+    FIELDS = ('mid', 'x', 'y', 'z', 'mpry',
+              'pitch', 'roll', 'yaw', 'vgx', 'vgy', 'vgz', 'templ', 'temph',
+              'tof', 'h', 'bat', 'baro', 'time', 'agx', 'agy', 'agz')
+    BASIC_OFFSET = FIELDS.index('pitch')
+    MISSION_PAD_ABSENT = (None,) * BASIC_OFFSET
+    INDEX = {name: index for index, name in enumerate(FIELDS)}
+
+    def __init__(self, data: Tuple, received_at: Optional[datetime] = None, extra: Optional[dict] = None):
+        """
+        매개변수:
+            data: FIELDS 순서의 값 튜플 (없는 필드는 None)
+            received_at: 패킷 수신 시각
+            extra: FIELDS에 없는 필드 (알 수 없는 펌웨어 형식)
+        """
+        self.data = data
+        self.received_at = received_at
+        self.extra = extra
+
+    @staticmethod
+    def from_dict(state: dict, received_at: Optional[datetime] = None) -> 'TelloState':
+        """parse_state가 반환한 dict로 TelloState를 만듭니다"""
+        data = tuple(state.get(name) for name in TelloState.FIELDS)
+        extra = {key: value for key, value in state.items() if key not in TelloState.INDEX}
+        return TelloState(data, received_at, extra or None)
+
+    def __getitem__(self, key):
+        index = TelloState.INDEX.get(key)
+        if index is not None:
+            value = self.data[index]
+            if value is not None:
+                return value
+        elif key == 'received_at':
+            if self.received_at is not None:
+                return self.received_at
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for name, value in zip(TelloState.FIELDS, self.data):
+            if value is not None:
+                yield name
+        if self.extra is not None:
+            yield from self.extra
+        if self.received_at is not None:
+            yield 'received_at'
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return 'TelloState({})'.format(', '.join('{}={!r}'.format(key, self[key]) for key in self))
+
+
+def _state_pattern(fields):
+    """필드 순서 그대로 'name:값;'이 이어지는 상태 패킷 정규식을 만듭니다.
+    패킷 전체와 일치해야 하며(fullmatch), 끝의 줄바꿈만 허용합니다"""
+    value_patterns = {int: rb'(-?\d+)', float: rb'(-?\d+(?:\.\d*)?)'}
+    parts = [name.encode('ASCII') + b':' + value_patterns.get(Tello.state_field_converters.get(name), rb'([^;]*)')
+             for name in fields]
+    return re.compile(b';'.join(parts) + rb';(?:\r?\n)?')
+
+
+def _decode_ascii(value: bytes) -> str:
+    return value.decode('ASCII')
+
+
+TelloState.LAYOUT_EDU = _state_pattern(TelloState.FIELDS)
+TelloState.LAYOUT_BASIC = _state_pattern(TelloState.FIELDS[TelloState.BASIC_OFFSET:])
+# 필드 순서대로의 변환 함수 (mpry처럼 변환기가 없는 필드는 문자열)
+TelloState.CONVERTERS = tuple(Tello.state_field_converters.get(name, _decode_ascii) for name in TelloState.FIELDS)
+for _index, _name in enumerate(TelloState.FIELDS):
+    setattr(TelloState, _name, property(lambda self, index=_index: self.data[index]))
+del _index, _name
+
+
+class StateListener:
+    """
+    Tello.on_state / on_threshold 구독 하나. 콜백은 상태 수신 스레드에서 호출되며,
+    콜백에서 발생한 예외는 기록만 하고 수신 스레드는 계속 동작합니다.
+    """
+
+    def __init__(self, callback, fields: Optional[tuple] = None, predicate=None):
+        """
+        매개변수:
+            callback: 상태를 인자로 받는 함수
+            fields: 이 필드 중 하나가 바뀔 때만 호출 (None이면 매 패킷)
+            predicate: 주어지면 predicate(state)가 False에서 True가 될 때만 호출
+        """
+        self.callback = callback
+        self.fields = fields
+        self.predicate = predicate
+        self.active = False  # predicate가 마지막으로 True였는지
+        self.drone: Optional[dict] = None
+
+    def notify(self, state, previous):
+        """새 상태 패킷을 받았을 때 수신 스레드가 호출합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        try:
+            if self.predicate is not None:
+                active = bool(self.predicate(state))
+                fire = active and not self.active
+                self.active = active
+            elif self.fields is not None and previous:
+                fire = any(state.get(field) != previous.get(field) for field in self.fields)
+            else:
+                fire = True
+
+            if fire:
+                self.callback(state)
+        except Exception as e:
+            Tello.LOGGER.error('State listener failed: {}'.format(e))
+
+    def cancel(self):
+        """구독을 해제합니다"""
+        if self.drone is not None:
+            self.drone['listeners'] = [listener for listener in self.drone['listeners'] if listener is not self]
+            self.drone = None
+
+
+class RttEstimator:
+    """
+    TCP의 재전송 타임아웃(RFC 6298)과 같은 방식으로 드론 한 대의 응답 시간을 추정합니다.
+    SRTT와 RTTVAR를 지수 가중 이동 평균으로 갱신하고 RTO = SRTT + 4 * RTTVAR 를
+    타임아웃으로 사용합니다. 타임아웃이 나면 새 표본을 받을 때까지 RTO를 두 배로 늘립니다.
+    """
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+    INITIAL_RTO = 1.0      # 표본이 없을 때의 RTO (초)
+    MIN_VARIANCE = 0.01    # 4 * RTTVAR의 최소값 (초), 지연이 일정한 링크에서 RTO가 RTT에 붙지 않도록
+    MAX_RTO = 60.0
+
+    def __init__(self):
+        self.lock = Lock()
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self.rto = RttEstimator.INITIAL_RTO
+        self.samples = 0
+
+    def sample(self, rtt: float):
+        """응답 시간 표본 하나를 반영합니다"""
+        with self.lock:
+            if self.srtt is None:
+                self.srtt = rtt
+                self.rttvar = rtt / 2
+            else:
+                self.rttvar = (1 - RttEstimator.BETA) * self.rttvar + RttEstimator.BETA * abs(self.srtt - rtt)
+                self.srtt = (1 - RttEstimator.ALPHA) * self.srtt + RttEstimator.ALPHA * rtt
+            self.rto = min(self.srtt + max(RttEstimator.MIN_VARIANCE, RttEstimator.K * self.rttvar),
+                           RttEstimator.MAX_RTO)
+            self.samples += 1
+
+    def backoff(self):
+        """타임아웃이 났을 때 RTO를 두 배로 늘립니다"""
+        with self.lock:
+            self.rto = min(self.rto * 2, RttEstimator.MAX_RTO)
+
+    def timeout(self, minimum: float, maximum: float) -> float:
+        """[minimum, maximum]으로 자른 현재 RTO"""
+        return max(minimum, min(maximum, self.rto))
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                'srtt_ms': round(self.srtt * 1e3, 3) if self.srtt is not None else None,
+                'rttvar_ms': round(self.rttvar * 1e3, 3),
+                'rto_ms': round(self.rto * 1e3, 3),
+                'samples': self.samples,
+            }
+
+
+class CommandFuture(Future):
+    """
+    명령 응답 Future. 스케줄러 워커(또는 SwarmTransport의 이벤트 루프)가 결과를 설정하므로,
+    add_done_callback으로 등록한 사용자 콜백은 그 스레드가 아닌 별도의 콜백 스레드에서
+    실행됩니다. 콜백 안에서 tello.query_battery()처럼 응답을 기다리는 명령을 호출해도
+    워커가 막히지 않습니다.
+    """
+
+    CALLBACK_WORKERS = 4  # 사용자 콜백을 실행하는 스레드 수
+    executor: Optional[ThreadPoolExecutor] = None
+    executor_lock = Lock()
+
+    @staticmethod
+    def get_executor() -> ThreadPoolExecutor:
+        with CommandFuture.executor_lock:
+            if CommandFuture.executor is None:
+                CommandFuture.executor = ThreadPoolExecutor(max_workers=CommandFuture.CALLBACK_WORKERS,
+                                                            thread_name_prefix='TelloCallback')
+            return CommandFuture.executor
+
+    def add_done_callback(self, fn):
+        executor = CommandFuture.get_executor()
+        super().add_done_callback(lambda future: executor.submit(fn, future))
+
+    def add_internal_callback(self, fn):
+        """결과를 설정한 스레드에서 바로 실행되는 콜백을 등록합니다. 막히지 않는 짧은 콜백만 사용합니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        super().add_done_callback(fn)
+
+
+class CommandRequest:
+    """CommandScheduler의 대기열에 들어 있는 명령 하나
+    """
+
+    __slots__ = ('command', 'timeout', 'lane', 'future', 'submitted_at', 'gate')
+
+    def __init__(self, command: str, timeout, lane: int, future: Future, gate: Optional['BroadcastGate'] = None):
+        self.command = command
+        self.timeout = timeout
+        self.lane = lane
+        self.future = future
+        self.submitted_at = time.monotonic()
+        self.gate = gate
+
+
+class BroadcastGate:
+    """
+    여러 드론의 같은 명령을 한 스레드에서 연달아 보내기 위한 관문. 각 드론의 스케줄러는
+    명령 차례가 되면 데이터그램을 직접 보내지 않고 관문에 도착(arrive)만 합니다. 모든 드론이
+    도착하면 조정 스레드(TelloSwarm.at(t).send)가 미리 인코딩한 데이터그램을 연달아 보내고
+    관문을 열며(open), 그 뒤 각 스케줄러는 평소처럼 응답을 기다립니다.
+
+    보통 직접 만들지 않고 TelloSwarm.broadcast()나 TelloSwarm.at()을 사용합니다.
+    """
+
+    def __init__(self, parties: int, at: Optional[float] = None):
+        """
+        매개변수:
+            parties: 도착해야 하는 드론 수
+            at: 예약 전송 시각 (time.monotonic() 기준, None이면 모두 도착하는 즉시)
+        """
+        self.parties = parties
+        self.at = at
+        self.arrived = 0
+        self.sent = False
+        self.error: Optional[Exception] = None
+        self.abort_callbacks = []
+        self.condition = Condition()
+
+    def arrive(self, on_abort: Optional[Callable[[Exception], None]] = None) -> bool:
+        """드론 하나가 보낼 준비가 되었음을 알립니다. 이미 취소된 관문이면 False를 반환합니다.
+        on_abort는 전송 전에 관문이 취소되면 그 예외와 함께 호출됩니다.
+        """
+        with self.condition:
+            if self.error is not None:
+                return False
+            self.arrived += 1
+            if on_abort is not None:
+                self.abort_callbacks.append(on_abort)
+            self.condition.notify_all()
+            return True
+
+    def arrive_and_wait(self):
+        """도착을 알리고 데이터그램이 전송될 때까지 기다립니다. 취소되면 그 예외를 던집니다"""
+        if self.arrive():
+            with self.condition:
+                self.condition.wait_for(lambda: self.sent or self.error is not None)
+        if self.error is not None:
+            raise self.error
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """모든 드론이 도착할 때까지 기다립니다"""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.arrived >= self.parties, timeout)
+
+    def open(self):
+        """데이터그램을 모두 보냈음을 알립니다"""
+        with self.condition:
+            self.sent = True
+            self.condition.notify_all()
+
+    def abort(self, error: Exception):
+        """전송하지 않고 관문을 취소합니다. 도착한 드론과 나중에 도착하는 드론 모두 error로 끝납니다"""
+        with self.condition:
+            if self.sent or self.error is not None:
+                return
+            self.error = error
+            callbacks = self.abort_callbacks
+            self.abort_callbacks = []
+            self.condition.notify_all()
+        for callback in callbacks:
+            callback(error)
+
+
+class CommandScheduler:
+    """
+    드론 한 대의 명령을 우선순위 대기열(lane)에 넣고 하나의 워커 스레드가 한 번에 하나씩
+    보냅니다. Tello의 응답에는 요청 식별자가 없으므로 동시에 하나의 명령만 보내야 여러
+    스레드(웹 서버, 에이전트 도구 등)가 서로의 응답을 가져가지 않습니다.
+
+    대기열 우선순위: SAFETY(land, stop) > FLIGHT(이동, 회전, 이륙 등) > QUERY(읽기 명령)
+    > CONFIG(command, speed, streamon 등 설정). land나 emergency가 들어오면 대기 중인
+    FLIGHT 명령은 취소되고, 이를 기다리던 호출자는 TelloException을 받습니다.
+    emergency는 대기열을 거치지 않고 즉시 전송됩니다.
+
+    보통 직접 만들지 않고 Tello가 자동으로 만듭니다. stats()로 대기열 상태를 볼 수 있습니다.
+    """
+
+    SAFETY = 0
+    FLIGHT = 1
+    QUERY = 2
+    CONFIG = 3
+    LANE_NAMES = ('safety', 'flight', 'query', 'config')
+
+    SAFETY_COMMANDS = ('land', 'stop', 'emergency')
+    # 이 명령이 들어오면 대기 중인 FLIGHT 명령을 취소합니다
+    PREEMPTING_COMMANDS = ('land', 'emergency')
+    CONFIG_COMMANDS = ('command', 'speed', 'wifi', 'ap', 'port', 'setfps', 'setbitrate', 'setresolution',
+                       'mon', 'moff', 'mdirection', 'downvision', 'streamon', 'streamoff')
+
+    # 응답이 기동이 끝난 뒤에 오는 명령 (RTT 추정과 무관하게 긴 타임아웃)
+    LONG_COMMANDS = ('takeoff', 'land', 'go', 'curve', 'jump', 'throwfly')
+
+    def __init__(self, tello: Tello):
+        self.tello = tello
+        self.rtt = RttEstimator()
+        self.condition = Condition()
+        self.lanes = [deque() for _ in CommandScheduler.LANE_NAMES]
+        self.in_flight: Optional[CommandRequest] = None
+        self.stopped = False
+        self.worker = Thread(target=self.run, daemon=True)
+
+        # 대기열(backpressure) 지표
+        self.submitted = [0] * len(self.lanes)
+        self.completed = [0] * len(self.lanes)
+        self.cancelled = [0] * len(self.lanes)
+        self.max_pending = [0] * len(self.lanes)
+        # 대기열별 취소 횟수와 마지막 취소 사유. 재시도는 첫 시도 때의 값과 비교해
+        # 그 사이에 land / emergency가 있었으면 다시 넣지 않습니다
+        self.epochs = [0] * len(self.lanes)
+        self.cancel_reasons = [None] * len(self.lanes)
+        self.timeouts = 0
+        self.total_wait = 0.0     # 대기열에서 기다린 시간의 합 (초)
+        self.total_service = 0.0  # 전송부터 응답까지 걸린 시간의 합 (초)
+
+    @staticmethod
+    def lane_of(command: str) -> int:
+        """명령 문자열이 들어갈 대기열"""
+        name = command.split(' ', 1)[0]
+        if name in CommandScheduler.SAFETY_COMMANDS:
+            return CommandScheduler.SAFETY
+        if name.endswith('?'):
+            return CommandScheduler.QUERY
+        if name in CommandScheduler.CONFIG_COMMANDS:
+            return CommandScheduler.CONFIG
+        return CommandScheduler.FLIGHT
+
+    def timeout_for(self, command: str, lane: int) -> float:
+        """명령 종류별 타임아웃. 읽기/설정 명령은 측정된 RTT로 정한 값을 범위 안으로 자르고,
+        이륙, go, curve처럼 기동이 끝나야 응답하는 명령은 긴 고정값을 사용합니다.
+        """
+        if lane == CommandScheduler.QUERY:
+            return self.rtt.timeout(*Tello.QUERY_TIMEOUT_RANGE)
+        if lane == CommandScheduler.CONFIG:
+            return self.rtt.timeout(*Tello.CONFIG_TIMEOUT_RANGE)
+        if command.split(' ', 1)[0] in CommandScheduler.LONG_COMMANDS:
+            return Tello.TAKEOFF_TIMEOUT
+        return Tello.RESPONSE_TIMEOUT
+
+    def start(self):
+        self.worker.start()
+
+    def is_worker_thread(self) -> bool:
+        """현재 스레드가 명령을 보내는 스레드인지 (여기서 응답을 기다리면 교착 상태가 됩니다)"""
+        return current_thread() is self.worker
+
+    def check_blocking_call(self, command: str):
+        """워커 스레드에서 응답을 기다리려 하면 멈추는 대신 TelloException을 던집니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        if self.is_worker_thread():
+            raise TelloException("Command '{}' would wait for a response on the command scheduler thread "
+                                 "of {}, which would never answer".format(command, self.tello.address[0]))
+
+    def submit(self, command: str, timeout=None, gate: Optional[BroadcastGate] = None,
+               epoch: Optional[int] = None) -> Future:
+        """명령을 대기열에 넣고 응답 문자열(타임아웃이면 None)로 완료되는 Future를 반환합니다.
+        timeout이 None이면 timeout_for로 정합니다. gate가 주어지면 데이터그램은
+        BroadcastGate의 조정 스레드가 보냅니다. epoch가 주어지면(재시도) 그 뒤로 명령의
+        대기열이 취소된 적이 있을 때 넣지 않고 TelloException을 던집니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        lane = CommandScheduler.lane_of(command)
+        if timeout is None:
+            timeout = self.timeout_for(command, lane)
+        future = CommandFuture()
+        future.cancelled_by = None
+        future.timeout = timeout
+        request = CommandRequest(command, timeout, lane, future, gate)
+
+        with self.condition:
+            if self.stopped:
+                raise TelloException("Command '{}' was sent after the drone connection ended".format(command))
+            if epoch is not None and epoch != self.epochs[lane]:
+                raise TelloException("Command '{}' was cancelled by '{}'".format(command, self.cancel_reasons[lane]))
+            if command in CommandScheduler.PREEMPTING_COMMANDS:
+                self.cancel_pending_locked(command)
+
+            queue = self.lanes[lane]
+            queue.append(request)
+            self.submitted[lane] += 1
+            self.max_pending[lane] = max(self.max_pending[lane], len(queue))
+            self.condition.notify()
+        return future
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        """delay초 뒤에 callback을 호출합니다 (명령 재시도용).
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        timer = Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+
+    def cancel_pending(self, reason: str, lanes=(FLIGHT,)) -> int:
+        """대기 중인 명령을 취소합니다. 진행 중인 명령은 취소되지 않습니다.
+        반환값:
+            int: 취소된 명령 수
+        """
+        with self.condition:
+            return self.cancel_pending_locked(reason, lanes)
+
+    def cancel_pending_locked(self, reason: str, lanes=(FLIGHT,)) -> int:
+        count = 0
+        for lane in lanes:
+            # 대기열 밖에서 재시도를 기다리는 명령도 취소되도록 합니다
+            self.epochs[lane] += 1
+            self.cancel_reasons[lane] = reason
+            queue = self.lanes[lane]
+            while queue:
+                request = queue.popleft()
+                request.future.cancelled_by = reason
+                if request.future.cancel():
+                    self.cancelled[lane] += 1
+                    count += 1
+        if count:
+            Tello.LOGGER.info("'{}' cancelled {} queued command(s)".format(reason, count))
+        return count
+
+    def next_request_locked(self) -> Optional[CommandRequest]:
+        for queue in self.lanes:
+            if queue:
+                return queue.popleft()
+        return None
+
+    def run(self):
+        """대기열에서 우선순위가 가장 높은 명령을 꺼내 보내는 스레드 워커 함수
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.stopped or any(self.lanes))
+                if self.stopped:
+                    return
+                request = self.next_request_locked()
+                if not request.future.set_running_or_notify_cancel():
+                    continue
+                self.in_flight = request
+
+            started = time.monotonic()
+            try:
+                response = self.tello.execute_command(request.command, request.timeout, request.gate)
+            except Exception as e:
+                request.future.set_exception(e)
+                response = ''
+            else:
+                request.future.set_result(response)
+
+            # 명령 간격을 지키느라 잠든 시간은 처리 시간이 아니라 대기 시간입니다
+            started = max(started, self.tello.last_sent_command_timestamp)
+            service = time.monotonic() - started
+            with self.condition:
+                self.in_flight = None
+                self.completed[request.lane] += 1
+                self.total_wait += started - request.submitted_at
+                self.total_service += service
+                if response is None:
+                    self.timeouts += 1
+
+            # 기동 시간이 응답 시간에 포함되지 않는 명령만 RTT 표본으로 사용합니다
+            # (관문을 거친 명령은 다른 드론을 기다린 시간이 섞여 있으므로 제외)
+            if request.lane in (CommandScheduler.QUERY, CommandScheduler.CONFIG) and request.gate is None:
+                if response is None:
+                    self.rtt.backoff()
+                else:
+                    self.rtt.sample(service)
+
+    def stats(self) -> dict:
+        """대기열별 대기 수, 최대 대기 수, 처리/취소 수와 평균 대기/처리 시간(ms)
+        """
+        with self.condition:
+            completed = sum(self.completed)
+            return {
+                'in_flight': self.in_flight.command if self.in_flight is not None else None,
+                'lanes': {name: {'pending': len(self.lanes[i]), 'max_pending': self.max_pending[i],
+                                 'submitted': self.submitted[i], 'completed': self.completed[i],
+                                 'cancelled': self.cancelled[i]}
+                          for i, name in enumerate(CommandScheduler.LANE_NAMES)},
+                'timeouts': self.timeouts,
+                'mean_wait_ms': round(self.total_wait / completed * 1e3, 3) if completed else 0.0,
+                'mean_service_ms': round(self.total_service / completed * 1e3, 3) if completed else 0.0,
+                'rtt': self.rtt.stats(),
+            }
+
+    def stop(self):
+        """워커를 멈추고 대기 중인 모든 명령을 취소합니다"""
+        with self.condition:
+            self.stopped = True
+            self.cancel_pending_locked('end', range(len(self.lanes)))
+            self.condition.notify_all()
+
+
+class RcStreamer:
+    """
+    RC 제어 값을 고정 주기로 전송하는 백그라운드 스레드.
+    send_rc_control이 호출되는 빈도와 관계없이 항상 가장 최근의 스틱 값만
+    일정한 주기로 전송하며, 그 사이에 갱신된 값은 버려집니다.
+    패킷은 값이 바뀔 때 미리 인코딩해 두므로 전송할 때는 포맷팅이 필요 없습니다.
+    """
+
+    # -100~100 범위의 정수를 미리 인코딩한 테이블
+    ENCODED_VALUES = {value: str(value).encode('ascii') for value in range(-100, 101)}
+
+    def __init__(self, tello, rate=Tello.RC_STREAMER_RATE):
+        self.tello = tello
+        self.interval = 1 / rate
+        self.packet = b'rc 0 0 0 0'
+        self.packets_sent = 0
+        self.packets_dropped = 0
+
+        self.stopped = Event()
+        self.worker = Thread(target=self.send_loop, args=(), daemon=True)
+
+    def start(self):
+        """RC 전송 워커를 시작합니다
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        self.worker.start()
+
+    def set(self, left_right_velocity: Union[int, float], forward_backward_velocity: Union[int, float],
+            up_down_velocity: Union[int, float], yaw_velocity: Union[int, float]):
+        """다음 주기에 전송할 스틱 값을 설정합니다 (-100~100, 실수는 정수로 자릅니다)
+        """
+        encoded = RcStreamer.ENCODED_VALUES
+        values = (left_right_velocity, forward_backward_velocity, up_down_velocity, yaw_velocity)
+        # 패킷 교체는 단일 대입이므로 전송 스레드와의 잠금이 필요 없습니다
+        self.packet = b'rc ' + b' '.join(encoded[max(-100, min(100, int(value)))] for value in values)
+
+    def send_loop(self):
+        """고정 주기로 마지막 패킷을 전송하는 스레드 워커 함수
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        sock = self.tello.get_control_socket()
+        address = self.tello.address
+        next_send = time.monotonic()
+
+        while not self.stopped.is_set():
+            try:
+                sock.sendto(self.packet, address)
+                self.packets_sent += 1
+            except BlockingIOError:
+                # SwarmTransport의 논블로킹 소켓에서 송신 버퍼가 가득 찬 경우, 다음 주기에 다시 보냅니다
+                self.packets_dropped += 1
+            except OSError as e:
+                Tello.LOGGER.error(e)
+                break
+
+            next_send += self.interval
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                self.stopped.wait(delay)
+            else:
+                # 주기를 놓친 경우 밀린 패킷을 몰아서 보내지 않습니다
+                next_send = time.monotonic()
+
+    def stop(self):
+        """RC 전송 워커를 중지하고, 마지막 스틱 값이 유지되지 않도록 정지 패킷을 보냅니다
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        self.stopped.set()
+        # 워커가 중지된 뒤에 보내야 마지막 값이 정지 패킷을 덮어쓰지 않습니다
+        if self.worker.is_alive():
+            self.worker.join()
+        self.packet = b'rc 0 0 0 0'
+        try:
+            self.tello.get_control_socket().sendto(self.packet, self.tello.address)
+        except OSError as e:
+            Tello.LOGGER.error(e)
+
+
+class TelloTransport:
+    """
+    Tello 인스턴스가 전용으로 사용하는 제어/상태 소켓과 수신 스레드 묶음.
+    기본적으로 모든 Tello는 모듈 전역 소켓(8889/8890)을 공유하므로 한 호스트에서
+    하나의 프로세스만 드론과 통신할 수 있습니다. TelloTransport를 사용하면 제어
+    소켓은 임시 포트에, 상태 소켓은 지정한 포트에 바인딩되므로 드론마다 별도의
+    워커 프로세스를 실행할 수 있습니다.
+
+    ```python
+    tello = Tello('192.168.10.1', transport=TelloTransport(state_port=9001))
+    tello.connect()  # 드론에 'port 9001 <vs_udp>' 명령을 함께 보냅니다
+    ```
+    """
+
+    def __init__(self, control_port: int = 0, state_port: int = 0):
+        """
+        매개변수:
+            control_port: 제어 소켓 포트 (0이면 임시 포트)
+            state_port: 상태 소켓 포트 (0이면 임시 포트)
+        """
+        self.drones = {}
+
+        self.control_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.control_socket.bind(("", control_port))
+        self.state_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.state_socket.bind(("", state_port))
+        self.state_port = self.state_socket.getsockname()[1]
+
+        self.response_receiver_thread = Thread(target=Tello.udp_response_receiver,
+                                               args=(self.control_socket, self.drones),
+                                               daemon=True)
+        self.response_receiver_thread.start()
+        self.state_receiver_thread = Thread(target=Tello.udp_state_receiver,
+                                            args=(self.state_socket, self.drones),
+                                            daemon=True)
+        self.state_receiver_thread.start()
+
+    def create_scheduler(self, tello: Tello) -> CommandScheduler:
+        """이 전송 계층을 사용하는 드론의 CommandScheduler를 만듭니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        return CommandScheduler(tello)
+
+    def close(self):
+        """소켓을 닫고 수신 스레드를 종료합니다.
+        """
+        for sock in (self.control_socket, self.state_socket):
+            # shutdown으로 recvfrom에서 대기 중인 수신 스레드를 깨웁니다
+            with suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+            sock.close()
+
+
+TimestampedFrame = namedtuple('TimestampedFrame', ['sequence', 'pts', 'received_at', 'frame'])
+TimestampedFrame.__doc__ = """FrameRingBuffer에 보관되는 프레임.
+sequence: 1부터 증가하는 시퀀스 번호, pts: 스트림 표시 시각(초, 없으면 None),
+received_at: 디코딩 완료 시각(time.time()), frame: ndarray
+"""
+
+
+class FrameRingBuffer:
+    """
+    최근 프레임을 시퀀스 번호, PTS, 수신 시각과 함께 고정 개수만큼 보관하는 링 버퍼.
+    소비자는 마지막으로 처리한 시퀀스 번호를 기억하고 wait_for_next로 새 프레임을
+    기다리므로, 폴링하거나 이미 처리한 프레임을 다시 복사할 필요가 없습니다.
+    """
+
+    def __init__(self, capacity = Tello.FRAME_RING_CAPACITY):
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.sequence = 0  # 마지막으로 기록된 프레임의 시퀀스 번호 (0이면 없음)
+        self.condition = Condition()
+
+    def push(self, frame: 'np.ndarray', pts: Optional[float] = None) -> int:
+        """프레임을 기록하고 대기 중인 소비자를 깨웁니다. 시퀀스 번호를 반환합니다.
+        """
+        with self.condition:
+            self.sequence += 1
+            self.slots[self.sequence % self.capacity] = TimestampedFrame(self.sequence, pts, time.time(), frame)
+            self.condition.notify_all()
+            return self.sequence
+
+    def latest(self) -> Optional[TimestampedFrame]:
+        """가장 최근 프레임 (아직 없으면 None)
+        """
+        with self.condition:
+            return self.slots[self.sequence % self.capacity] if self.sequence else None
+
+    def get(self, sequence: int) -> Optional[TimestampedFrame]:
+        """시퀀스 번호로 프레임을 가져옵니다. 이미 덮어써졌거나 아직 없으면 None
+        """
+        with self.condition:
+            item = self.slots[sequence % self.capacity]
+            if item is None or item.sequence != sequence:
+                return None
+            return item
+
+    def wait_for_next(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[TimestampedFrame]:
+        """after_seq 다음 프레임을 반환합니다. 소비자가 뒤처져 그 프레임이 이미
+        덮어써졌다면 남아 있는 가장 오래된 프레임을 반환합니다.
+        timeout 안에 새 프레임이 오지 않으면 None을 반환합니다.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.sequence > after_seq, timeout):
+                return None
+            oldest = max(after_seq + 1, self.sequence - self.capacity + 1)
+            return self.slots[oldest % self.capacity]
+
+    def wait_for_latest(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[TimestampedFrame]:
+        """after_seq보다 새로운 프레임 중 가장 최근 프레임을 반환합니다 (화면 표시용).
+        timeout 안에 새 프레임이 오지 않으면 None을 반환합니다.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.sequence > after_seq, timeout):
+                return None
+            return self.slots[self.sequence % self.capacity]
+
+
 class BackgroundFrameRead:
     """
     이 클래스는 백그라운드에서 PyAV를 사용하여 프레임을 읽습니다.
     현재 프레임을 가져오려면 backgroundFrameRead.frame을 사용하세요.
+    디코딩된 프레임은 backgroundFrameRead.ring(FrameRingBuffer)에도 기록되므로
+    wait_for_next / wait_for_latest로 새 프레임을 기다릴 수 있습니다.
+    start_recording()으로 수신한 H.264 패킷을 재인코딩 없이 파일로 저장할 수 있습니다.
     """
 
-    def __init__(self, tello, address, with_queue = False, maxsize = 32):
+    def __init__(self, tello, address, with_queue = False, maxsize = 32,
+                 pixel_format = Tello.PIXEL_FORMAT_RGB,
+                 ring_capacity = Tello.FRAME_RING_CAPACITY, decode = True):
+        import av
+        import numpy as np
+
         self.address = address
+        self.decode = decode
+        self.recorder: Optional[H264Recorder] = None
         self.lock = Lock()
         self.frame = np.zeros([300, 400, 3], dtype=np.uint8)
         self.frames = deque([], maxsize)
         self.with_queue = with_queue
+        self.pixel_format = pixel_format
+        self.ring = FrameRingBuffer(ring_capacity)
 
         # PyAV로 프레임 가져오기 시도
         # 이슈 #90에 따르면 디코더가 시간이 필요할 수 있음
@@ -1153,12 +2358,25 @@ class BackgroundFrameRead:
         """PyAV를 사용하여 프레임을 가져오는 스레드 워커 함수
         내부 메서드로, 일반적으로 직접 호출하지 않습니다.
         """
+        import av
+
         try:
-            for frame in self.container.decode(video=0):
-                if self.with_queue:
-                    self.frames.append(np.array(frame.to_image()))
-                else:
-                    self.frame = np.array(frame.to_image())
+            for packet in self.container.demux(video=0):
+                received_at = time.monotonic()
+
+                if self.decode:
+                    for frame in packet.decode():
+                        array = self.convert_frame(frame)
+                        if self.with_queue:
+                            self.frames.append(array)
+                        else:
+                            self.frame = array
+                        self.ring.push(array, frame.time)
+
+                # 디코딩이 끝난 패킷을 그대로 녹화기에 넘깁니다
+                recorder = self.recorder
+                if recorder is not None:
+                    recorder.write(packet, received_at)
 
                 if self.stopped:
                     self.container.close()
@@ -1166,6 +2384,44 @@ class BackgroundFrameRead:
         except av.error.ExitError:
             raise TelloException('디코딩을 위한 충분한 프레임이 없습니다. 다시 시도하거나 get_frame_read() 전에 비디오 fps를 높이세요')
     
+    def convert_frame(self, frame) -> 'np.ndarray':
+        """디코딩된 프레임을 PIL 이미지를 거치지 않고 바로 ndarray로 변환합니다.
+        프레임마다 새 배열이므로 링 버퍼나 FrameHub가 넘겨준 프레임은 덮어써지지 않습니다.
+        내부 메서드로, 일반적으로 직접 호출하지 않습니다.
+        """
+        return frame.to_ndarray(format=self.pixel_format)
+
+    def wait_for_next(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[TimestampedFrame]:
+        """after_seq 다음 프레임을 기다립니다. FrameRingBuffer.wait_for_next 참고
+        """
+        return self.ring.wait_for_next(after_seq, timeout)
+
+    def wait_for_latest(self, after_seq: int = 0, timeout: Optional[float] = None) -> Optional[TimestampedFrame]:
+        """after_seq보다 새로운 가장 최근 프레임을 기다립니다. FrameRingBuffer.wait_for_latest 참고
+        """
+        return self.ring.wait_for_latest(after_seq, timeout)
+
+    def start_recording(self, path: str, container_format: Optional[str] = None) -> H264Recorder:
+        """수신한 H.264 패킷을 디코딩/재인코딩 없이 MP4/MKV 파일로 저장하기 시작합니다.
+        프레임 디코딩(화면 표시)과 동시에 사용할 수 있습니다.
+
+        ```python
+        frame_read = tello.get_frame_read(decode=False)  # 녹화만 할 때
+        frame_read.start_recording('video.mp4')
+        ```
+        """
+        self.stop_recording()
+        self.recorder = H264Recorder(path, self.container.streams.video[0], container_format)
+        return self.recorder
+
+    def stop_recording(self):
+        """녹화를 중지하고 파일을 마무리합니다
+        """
+        recorder = self.recorder
+        self.recorder = None
+        if recorder is not None:
+            recorder.close()
+
     def get_queued_frame(self):
         """
         큐에서 프레임을 가져옵니다
@@ -1197,3 +2453,4 @@ class BackgroundFrameRead:
         내부 메서드로, 일반적으로 직접 호출하지 않습니다.
         """
         self.stopped = True
+        self.stop_recording()
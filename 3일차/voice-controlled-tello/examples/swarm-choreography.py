@@ -0,0 +1,48 @@
+import sys
+
+from djitellopy import TelloSwarm, TelloTransport
+from djitellopy.choreography import Choreography
+
+# describe the show as one timed track per drone (seconds since the start)
+# 드론마다 시각이 적힌 트랙으로 안무를 작성합니다 (시작 후 경과 초)
+show = Choreography(3, start_positions=[(0, 0, 0), (0, 150, 0), (0, 300, 0)])
+show.add_all(0, 'takeoff')
+
+# each tello does something different at the same moment
+# 같은 순간에 각 Tello가 서로 다른 동작을 합니다
+show.add(0, 4, 'up 50').add(1, 4, 'flip b').add(2, 4, 'down 20')
+
+# rc setpoints are held until the next step: fly forward for 3 seconds
+# rc 값은 다음 단계까지 유지됩니다: 3초 동안 앞으로 비행
+show.add_all(7, 'rc 0 40 0 0')
+show.add_all(10, [0, 0, 0, 0])
+
+show.add(1, 11, 'cw 180')
+show.add_all(14, 'land')
+
+# check SDK ranges, timing, separation and battery without any drone
+# 드론 없이 SDK 범위, 시간 간격, 드론 간 거리와 배터리를 검사합니다
+report = show.validate(battery=[90, 90, 90])
+for problem in report.errors + report.warnings:
+    print(problem)
+print("Battery needed: {}".format(report.battery_needed.round(1)))
+
+if '--simulate' in sys.argv:
+    # rehearse against local simulators: python -m djitellopy.sim --host 127.0.0.2 --count 3
+    # 로컬 시뮬레이터로 리허설합니다
+    swarm = TelloSwarm.fromIps(["127.0.0.2", "127.0.0.3", "127.0.0.4"], transport=TelloTransport())
+else:
+    swarm = TelloSwarm.fromIps([
+        "192.168.178.42",
+        "192.168.178.43",
+        "192.168.178.44"
+    ])
+
+swarm.connect()
+
+# one thread sends every drone's next step on time, no sync() between steps
+# 한 스레드가 각 드론의 다음 단계를 제시간에 보냅니다. 단계 사이에 sync()가 없습니다
+result = swarm.perform(show)
+print("Completed: {}, latest step sent {:.1f} ms late".format(result.completed, result.lateness.max() * 1e3))
+
+swarm.end()
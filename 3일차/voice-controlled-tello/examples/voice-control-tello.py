@@ -1,4 +1,4 @@
-from djitellopy import Tello
+from djitellopy import Tello, FrameHub
 import speech_recognition as sr
 from typing import Dict, Any
 from openai import OpenAI
@@ -107,7 +107,6 @@ class TelloGUI(QMainWindow):
 class TelloController:
     def __init__(self):
         self.tello = Tello()
-        self.camera_thread = None
         self.processing_thread = None
         self.stop_camera = False
         self.detect_objects = False
@@ -119,10 +118,9 @@ class TelloController:
             self.app = QApplication.instance()
         self.gui = TelloGUI()
         
-        # 프레임 버퍼
-        self.frame_buffer = None
-        self.frame_ready = threading.Event()
-        self.frame_lock = threading.Lock()
+        # 프레임 허브: GUI/감지 루프는 가장 최근 프레임만 공유 참조로 받음
+        self.frame_hub = None
+        self.gui_frames = None
         
         # 프레임 스킵용 변수
         self.frame_skip = 5  # 예: 5프레임마다 한 번만 감지
@@ -137,10 +135,10 @@ class TelloController:
         self.stop_camera = False
         self.gui.show()
         
-        # 카메라 스트리밍 스레드 시작
-        self.camera_thread = threading.Thread(target=self._camera_loop)
-        self.camera_thread.daemon = True
-        self.camera_thread.start()
+        # 프레임 허브 시작 (별도의 복사 루프 없이 디코딩된 프레임을 전달)
+        self.frame_hub = FrameHub(self.frame_reader)
+        self.gui_frames = self.frame_hub.subscribe('gui', FrameHub.LATEST)
+        self.frame_hub.start()
         
         # 프레임 처리 스레드 시작
         self.processing_thread = threading.Thread(target=self._processing_loop)
@@ -150,42 +148,20 @@ class TelloController:
     def stop_camera(self):
         """카메라 스트리밍 중지"""
         self.stop_camera = True
-        if self.camera_thread:
-            self.camera_thread.join()
+        if self.frame_hub:
+            self.frame_hub.stop()
         if self.processing_thread:
             self.processing_thread.join()
         self.tello.streamoff()
         self.gui.close()
         
-    def _camera_loop(self):
-        """카메라 스트리밍 루프 (프레임 캡처만 담당)"""
-        print("카메라 루프 시작")
-        
-        while not self.stop_camera:
-            try:
-                frame = self.frame_reader.frame
-                if frame is not None:
-                    with self.frame_lock:
-                        self.frame_buffer = frame.copy()
-                    self.frame_ready.set()
-                else:
-                    print("프레임이 None입니다")
-                time.sleep(0.01)  # 대기 시간 감소
-            except Exception as e:
-                print(f"프레임 캡처 중 오류 발생: {str(e)}")
-                time.sleep(0.1)
-            
     def _processing_loop(self):
         """프레임 처리 루프 (객체 감지 및 GUI 업데이트 담당)"""
         print("처리 루프 시작")
         while not self.stop_camera:
-            if self.frame_ready.wait(timeout=0.1):
-                with self.frame_lock:
-                    if self.frame_buffer is not None:
-                        frame = self.frame_buffer.copy()
-                    else:
-                        frame = None
-                self.frame_ready.clear()
+            item = self.gui_frames.get(timeout=0.1)
+            if item is not None:
+                frame = item.frame
                 
                 if frame is not None:
                     # 표시/추론용 해상도 축소 (예: 320x240)
@@ -253,8 +229,8 @@ class TelloController:
     def __del__(self):
         """소멸자: 프로그램 종료 시 정리"""
         self.stop_camera = True
-        if self.camera_thread:
-            self.camera_thread.join()
+        if self.frame_hub:
+            self.frame_hub.stop()
         if self.processing_thread:
             self.processing_thread.join()
         self.tello.end()
@@ -0,0 +1,73 @@
+import asyncio
+import socket
+
+import pytest
+
+from djitellopy import AsyncTello
+from djitellopy import async_tello
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
+
+
+def test_concurrent_connect_shares_state_port(simulator):
+    simulators = [simulator(), simulator()]
+    state_port = free_udp_port()
+
+    async def main():
+        tellos = [AsyncTello(sim.host, state_port=state_port) for sim in simulators]
+        # 두 드론이 동시에 연결해도 상태 포트는 한 번만 바인딩됩니다
+        await asyncio.gather(*(tello.connect() for tello in tellos))
+        batteries = [tello.get_battery() for tello in tellos]
+        await asyncio.gather(*(tello.end() for tello in tellos))
+        return batteries
+
+    assert all(battery > 0 for battery in asyncio.run(main()))
+    assert all(sim.state_port == state_port for sim in simulators)
+
+
+def test_concurrent_connect_opens_one_control_socket(simulator, monkeypatch):
+    sim = simulator()
+    opened = []
+
+    class CountingProtocol(async_tello._TelloControlProtocol):
+        def __init__(self, tello):
+            super().__init__(tello)
+            opened.append(tello)
+
+    monkeypatch.setattr(async_tello, '_TelloControlProtocol', CountingProtocol)
+
+    async def main():
+        tello = AsyncTello(sim.host, state_port=free_udp_port())
+        await asyncio.gather(tello.connect(), tello.connect())
+        await tello.end()
+
+    asyncio.run(main())
+    assert len(opened) == 1
+
+
+def test_connect_retries_after_state_port_bind_fails(simulator):
+    sim = simulator()
+    blocker = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    blocker.bind(('0.0.0.0', 0))
+    state_port = blocker.getsockname()[1]
+
+    async def main():
+        tello = AsyncTello(sim.host, state_port=state_port)
+        with pytest.raises(OSError):
+            await tello.connect()
+        assert tello._transport is None
+
+        blocker.close()
+        await tello.connect()
+        battery = tello.get_battery()
+        await tello.end()
+        return battery
+
+    try:
+        assert asyncio.run(main()) > 0
+    finally:
+        blocker.close()
@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+
+def test_package_import_does_not_load_asyncio():
+    code = 'import sys, djitellopy; print("asyncio" in sys.modules)'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == 'False'
+
+
+def test_async_tello_is_still_exported():
+    from djitellopy import AsyncTello
+    from djitellopy.async_tello import AsyncTello as module_class
+    assert AsyncTello is module_class
@@ -0,0 +1,52 @@
+import socket
+
+from djitellopy import Tello
+from djitellopy.sim import TelloSimulator
+
+
+def send(sim, command, timeout=2.0):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(timeout)
+        sock.sendto(command.encode('utf-8'), (sim.host, Tello.CONTROL_UDP_PORT))
+        return sock.recvfrom(1024)[0].decode('utf-8')
+
+
+def test_simulator_answers_commands(simulator):
+    sim = simulator()
+    assert send(sim, 'command') == 'ok'
+    assert send(sim, 'battery?') == '100'
+    assert send(sim, 'speed 5') == 'error'
+    assert send(sim, 'forward 50') == 'error Not joystick'
+
+
+def test_simulator_flies(simulator):
+    sim = simulator()
+    assert send(sim, 'takeoff') == 'ok'
+    assert sim.model.flying
+    assert send(sim, 'forward 50') == 'ok'
+    assert round(sim.model.x) == 50
+    assert send(sim, 'land') == 'ok'
+    assert not sim.model.flying
+
+
+def test_simulator_drops_lost_commands(simulator):
+    sim = simulator(loss=1.0)
+    try:
+        send(sim, 'command', timeout=0.2)
+    except socket.timeout:
+        pass
+    else:
+        raise AssertionError('lost command was answered')
+    assert sim.commands_dropped == 1
+
+
+def test_connect_receives_state(tello):
+    drone = tello()
+    assert drone.get_battery() == 100
+    assert drone.query_sdk_version()
+
+
+def test_context_manager_stops_simulator():
+    with TelloSimulator('127.0.0.1', time_scale=0.05) as sim:
+        assert send(sim, 'command') == 'ok'
+    assert sim.stopped.is_set()